@@ -5,12 +5,14 @@ These agents handle intelligent analysis that requires reasoning:
 - BiasAgent: Detects bias and finds alternative perspectives
 - ConnectionAgent: Finds cross-story patterns and relationships
 - SynthesisAgent: Creates HN-style digest content
+- SemanticCache: Reuses analyses of near-duplicate articles
 """
 
 from .quality_agent import QualityAgent, TopicConfig
 from .bias_agent import BiasAgent
 from .connection_agent import ConnectionAgent
 from .synthesis_agent import SynthesisAgent
+from .semantic_cache import SemanticCache
 
 __all__ = [
     "QualityAgent",
@@ -18,4 +20,5 @@ __all__ = [
     "BiasAgent",
     "ConnectionAgent",
     "SynthesisAgent",
+    "SemanticCache",
 ]
@@ -0,0 +1,123 @@
+"""Shared per-article feature cache for Tier 2 agents.
+
+QualityAgent, BiasAgent and ConnectionAgent run over the same articles,
+and derive the same things from article content: truncated or compressed
+prompt text, short previews, and term counts for similarity screening.
+Features are computed once per article and reused by every agent (and by
+retries of the same analysis).
+
+Entries are keyed by article ID and checked against the article's title
+and content hash, so an article whose text changes gets fresh features,
+and the cache holds one version per article without keeping bodies alive.
+
+Usage:
+    from ._article_cache import get_features
+
+    features = get_features(article)
+    prompt_text = features.analysis_content
+"""
+
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+
+from ...models.article import ParsedArticle
+from ...utils.compression import compress_content, count_tokens, truncate_tokens
+from ...utils.similarity import term_counts
+
+# Content budget for bias analysis prompts (~5000 chars of English)
+ANALYSIS_CONTENT_TOKENS = 1250
+
+# Content budget for quality analysis prompts
+QUALITY_CONTENT_CHARS = 6000
+
+TRUNCATION_NOTE = "\n\n[Content truncated for analysis]"
+
+# Budget for one-line previews in comparison/summary prompts (~200 chars)
+PREVIEW_TOKENS = 50
+
+# Terms that mark paragraphs carrying claims, attribution, and framing
+BIAS_QUERY_TERMS = [
+    "according said says claims claimed alleged",
+    "critics supporters opponents experts officials sources",
+    "study report data evidence percent",
+]
+
+# Maximum articles held; a daily run processes well under this
+MAX_CACHED_ARTICLES = 2048
+
+
+@dataclass(frozen=True, slots=True)
+class ArticleFeatures:
+    """Content-derived features of an article."""
+
+    token_count: int
+    analysis_content: str
+    analysis_truncated: bool
+    preview: str
+    term_counts: Counter[str]
+
+
+# article_id -> ((title, content_hash), features), least recently used first
+_features: OrderedDict[str, tuple[tuple[str, str], ArticleFeatures]] = OrderedDict()
+
+
+def get_features(article: ParsedArticle) -> ArticleFeatures:
+    """
+    Get cached features for an article, computing them on first use.
+
+    Args:
+        article: Article to featurize
+
+    Returns:
+        ArticleFeatures (shared; do not mutate term_counts)
+    """
+    version = (article.title, article.content_hash)
+    cached = _features.get(article.article_id)
+    if cached is not None and cached[0] == version:
+        _features.move_to_end(article.article_id)
+        return cached[1]
+
+    features = _compute_features(article.title, article.content)
+    _features[article.article_id] = (version, features)
+    _features.move_to_end(article.article_id)
+    if len(_features) > MAX_CACHED_ARTICLES:
+        _features.popitem(last=False)
+    return features
+
+
+def _compute_features(title: str, content: str) -> ArticleFeatures:
+    """Compute features for one article version."""
+    token_count = count_tokens(content)
+    return ArticleFeatures(
+        token_count=token_count,
+        analysis_content=compress_content(
+            content, ANALYSIS_CONTENT_TOKENS, [title, *BIAS_QUERY_TERMS]
+        ),
+        analysis_truncated=token_count > ANALYSIS_CONTENT_TOKENS,
+        preview=truncate_tokens(content, PREVIEW_TOKENS),
+        term_counts=term_counts(f"{title}\n{content}"),
+    )
+
+
+def quality_content(article: ParsedArticle) -> str:
+    """
+    Get article content cut to the quality analysis budget.
+
+    A plain slice: it costs less than hashing a cache key on the full body,
+    so it is neither cached nor part of ArticleFeatures.
+
+    Args:
+        article: Article to truncate
+
+    Returns:
+        Content, with a truncation note if it was cut
+    """
+    content = article.content
+    if len(content) > QUALITY_CONTENT_CHARS:
+        return content[:QUALITY_CONTENT_CHARS] + TRUNCATION_NOTE
+    return content
+
+
+def clear_features() -> None:
+    """Drop all cached features."""
+    _features.clear()
@@ -0,0 +1,108 @@
+"""Local neutrality pre-filter for bias analysis.
+
+Technical and research coverage is usually genuinely neutral, and a full
+Tier 2 bias analysis of it mostly confirms that. This module scores how
+likely an article is to be neutral with a small logistic model over term
+rates, so BiasAgent can skip the LLM for confidently neutral articles.
+
+Features are per-100-term rates of technical vocabulary, emotionally loaded
+or opinion language, and politically contested topics, taken from the
+shared article feature cache. Weights are hand-set and deliberately
+conservative: an article needs plenty of technical vocabulary and almost
+no loaded or contested terms to clear the bypass threshold. They have not
+been fit or calibrated on labelled data, so BiasAgent only uses the bypass
+when a threshold is passed explicitly.
+
+Usage:
+    from ._neutral_filter import NEUTRAL_BYPASS_THRESHOLD, neutral_probability
+
+    if neutral_probability(article) > NEUTRAL_BYPASS_THRESHOLD:
+        ...
+"""
+
+import math
+
+from ...models.article import ParsedArticle
+from ._article_cache import get_features
+
+# Skip the LLM above this neutral probability
+NEUTRAL_BYPASS_THRESHOLD = 0.9
+
+# Too little text to judge; always send to the LLM
+MIN_TERMS = 150
+
+TECHNICAL_TERMS = frozenset(
+    [
+        "algorithm", "algorithms", "api", "architecture", "benchmark", "benchmarks", "bug", "chip",
+        "chips", "code", "compiler", "compute", "cpu", "database", "dataset", "datasets",
+        "developers", "device", "encryption", "engineering", "experiment", "experiments",
+        "framework", "gpu", "hardware", "implementation", "inference", "kernel", "latency",
+        "library", "memory", "method", "methods", "model", "models", "molecule", "neural",
+        "open-source", "paper", "performance", "processor", "protein", "protocol", "prototype",
+        "python", "release", "researchers", "runtime", "sensor", "server", "software", "source",
+        "specification", "spectrometer", "telescope", "theorem", "throughput", "update", "version",
+    ]
+)
+
+LOADED_TERMS = frozenset(
+    [
+        "absurd", "outrage", "outrageous", "shocking", "slammed", "blasted", "disgrace",
+        "disgraceful", "radical", "extremist", "corrupt", "scandal", "catastrophe", "catastrophic",
+        "disaster", "betrayal", "destroy", "destroyed", "furious", "terrifying", "horrific", "evil",
+        "lies", "liar", "propaganda", "regime", "elite", "elites", "woke", "crisis", "chaos",
+        "attack", "attacks", "unprecedented", "devastating", "alarming", "stunning", "brutal",
+        "reckless", "shameful",
+    ]
+)
+
+CONTESTED_TERMS = frozenset(
+    [
+        "abortion", "immigration", "immigrants", "border", "democrat", "democrats", "democratic",
+        "republican", "republicans", "gop", "liberal", "liberals", "conservative", "conservatives",
+        "election", "elections", "trump", "biden", "harris", "congress", "senate", "senator",
+        "lawmakers", "partisan", "gun", "guns", "israel", "gaza", "palestinian", "ukraine",
+        "russia", "climate", "tariff", "tariffs", "protest", "protesters", "police", "religion",
+        "vaccine", "vaccines",
+    ]
+)
+
+# Logistic weights per 100 terms; intercept keeps no-signal text well below
+# the threshold
+INTERCEPT = -1.0
+TECHNICAL_WEIGHT = 0.8
+LOADED_WEIGHT = -4.0
+CONTESTED_WEIGHT = -2.5
+
+
+def neutral_probability(article: ParsedArticle) -> float:
+    """
+    Estimate the probability that an article is neutral.
+
+    Args:
+        article: Article to score
+
+    Returns:
+        Probability in [0, 1]; 0.0 when there is too little text to judge
+    """
+    counts = get_features(article).term_counts
+    total = counts.total()
+    if total < MIN_TERMS:
+        return 0.0
+
+    technical = loaded = contested = 0
+    for term, count in counts.items():
+        if term in TECHNICAL_TERMS:
+            technical += count
+        elif term in LOADED_TERMS:
+            loaded += count
+        elif term in CONTESTED_TERMS:
+            contested += count
+
+    scale = 100 / total
+    z = (
+        INTERCEPT
+        + TECHNICAL_WEIGHT * technical * scale
+        + LOADED_WEIGHT * loaded * scale
+        + CONTESTED_WEIGHT * contested * scale
+    )
+    return 1 / (1 + math.exp(-z))
@@ -11,11 +11,19 @@ Usage:
     agent = BiasAgent(provider)
 
     analysis = await agent.analyze(article)
+
+    # Stream fields (e.g. bias_score) to a dashboard as they arrive
+    analysis = await agent.analyze(article, on_field=lambda k, v: ...)
 """
 
 import json
-import re
+import time
+from collections import Counter
+from collections.abc import Callable
 from dataclasses import dataclass
+from itertools import islice
+from statistics import fmean
+from string import Template
 from typing import Any
 
 from ...models.article import (
@@ -24,9 +32,14 @@ from ...models.article import (
     BiasDirection,
 )
 from ...providers.base import BaseLLMProvider, LLMResponse
+from ...providers.cache import LLMCache
+from ...utils.compression import load_tokenizer
+from ...utils.llm_json import JSONFieldStream, clamp01, loads_llm_json
+from ._article_cache import TRUNCATION_NOTE, get_features
+from ._neutral_filter import neutral_probability
 
 
-@dataclass
+@dataclass(slots=True)
 class BiasAgentStats:
     """Statistics for bias agent operations."""
 
@@ -35,6 +48,17 @@ class BiasAgentStats:
     neutral: int = 0
     total_tokens: int = 0
     total_cost: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    neutral_bypassed: int = 0
+
+
+def _take(data: dict[str, Any], key: str, limit: int) -> list[str]:
+    """Take up to limit items from a list field, ignoring non-list values."""
+    value = data.get(key)
+    if not isinstance(value, list):
+        return []
+    return [str(item) for item in islice(value, limit)]
 
 
 # System prompt for bias analysis
@@ -59,6 +83,51 @@ For the "skeptic's corner": Write as a thoughtful HN commenter would - pointing
 IMPORTANT: Respond ONLY with valid JSON. No markdown, no explanations outside JSON."""
 
 
+# Response format for bias analysis. Sent as part of the system prompt so the
+# whole static prefix is cacheable and only article content varies per call.
+BIAS_RESPONSE_FORMAT = """Respond with JSON in this format:
+{
+    "bias_score": 0.0-1.0,  // 0=far left, 0.5=neutral, 1.0=far right
+    "bias_direction": "left|center_left|center|center_right|right|unknown",
+    "bias_confidence": 0.0-1.0,  // How confident in bias assessment
+
+    "loaded_language": ["phrase1", "phrase2"],  // Emotionally charged terms
+    "framing_issues": ["issue1", "issue2"],  // How story is framed
+    "missing_context": ["context1", "context2"],  // Important omissions
+    "one_sided_sources": true/false,  // Are sources balanced?
+
+    "missing_perspectives": ["perspective1", "perspective2"],  // Viewpoints not represented
+    "suggested_counterpoints": ["point1", "point2"],  // Alternative views to consider
+
+    "verifiable_claims": ["claim1", "claim2"],  // Claims that can be fact-checked
+    "unverified_claims": ["claim1"],  // Claims without clear evidence
+    "potentially_misleading": ["issue1"],  // Technically true but misleading statements
+
+    "skeptics_corner": "A thoughtful 2-3 sentence skeptical take on this article",
+    "red_flags": ["flag1", "flag2"]  // Specific concerns about this content
+}
+
+Note: Be nuanced. A 0.5 bias score means balanced/neutral. Reserve extreme scores (< 0.2 or > 0.8) for clearly agenda-driven content. Technical/research content is often genuinely neutral."""
+
+# Full system prompt for analysis requests
+ANALYSIS_SYSTEM_PROMPT = f"{BIAS_SYSTEM_PROMPT}\n\n{BIAS_RESPONSE_FORMAT}"
+
+# Per-article analysis prompt; only the header fields and content vary
+ANALYSIS_PROMPT_TEMPLATE = Template("""Analyze this article for potential bias and missing perspectives.
+
+ARTICLE:
+Title: $title
+Source: $source
+Author: $author
+Published: $published
+
+Content:
+$content
+$context_section
+
+Analyze for bias and respond with JSON in the required format.""")
+
+
 class BiasAgent:
     """
     Tier 2 Bias Detection Agent.
@@ -67,20 +136,118 @@ class BiasAgent:
     and provides skeptical analysis.
     """
 
-    def __init__(self, provider: BaseLLMProvider):
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        cache: LLMCache | None = None,
+        neutral_threshold: float | None = None,
+    ):
         """
         Initialize bias agent.
 
         Args:
             provider: LLM provider (Tier 2 recommended)
+            cache: Optional response cache for deterministic calls
+            neutral_threshold: Skip the LLM for articles whose local neutral
+                probability exceeds this (e.g. NEUTRAL_BYPASS_THRESHOLD); None
+                (default) always calls the LLM. The model's weights are
+                hand-set and uncalibrated, so the bypass is opt-in
         """
         self.provider = provider
+        self.cache = cache
+        self.neutral_threshold = neutral_threshold
         self._stats = BiasAgentStats()
+        # Article features count tokens; don't fetch the tokenizer mid-request
+        load_tokenizer()
+
+    async def _complete(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        """Call the provider through the cache, counting hits and misses."""
+        response, hit = await LLMCache.complete_if_cacheable(
+            self.cache, self.provider, prompt, max_tokens, temperature, system_prompt
+        )
+        if hit is True:
+            self._stats.cache_hits += 1
+        elif hit is False:
+            self._stats.cache_misses += 1
+        return response
+
+    async def _complete_batch(
+        self,
+        requests: list[dict[str, Any]],
+        max_concurrent: int,
+    ) -> list[LLMResponse]:
+        """Complete many requests in one batch, serving cached ones locally."""
+        if self.cache is None:
+            return await self.provider.complete_batch(requests, max_concurrent=max_concurrent)
+
+        responses, hits = await self.cache.complete_batch(
+            self.provider, requests, max_concurrent=max_concurrent
+        )
+        # Requests too random to cache are neither hits nor misses
+        cacheable = sum(LLMCache.is_cacheable(r["temperature"]) for r in requests)
+        self._stats.cache_hits += hits
+        self._stats.cache_misses += cacheable - hits
+        return responses
+
+    def _prefilter(self, article: ParsedArticle) -> BiasAnalysis | None:
+        """Return a neutral analysis if the article can skip the LLM."""
+        if self.neutral_threshold is None:
+            return None
+
+        probability = neutral_probability(article)
+        if probability <= self.neutral_threshold:
+            return None
+
+        # The heuristic's probability is not a calibrated confidence in the
+        # bias score, so the local answer claims none
+        return BiasAnalysis(
+            bias_score=0.5,
+            bias_direction=BiasDirection.CENTER,
+            bias_confidence=0.0,
+        )
+
+    def _analysis_request(
+        self,
+        article: ParsedArticle,
+        context_articles: list[ParsedArticle] | None = None,
+    ) -> dict[str, Any]:
+        """Build the completion request for a bias analysis."""
+        return {
+            "prompt": self._build_analysis_prompt(article, context_articles),
+            "max_tokens": 1200,
+            "temperature": 0.4,
+            "system_prompt": ANALYSIS_SYSTEM_PROMPT,
+        }
+
+    def _record_analyses(
+        self,
+        analyses: list[BiasAnalysis],
+        responses: list[LLMResponse],
+    ) -> None:
+        """Update stats for completed analyses in one write."""
+        highly_biased = sum(1 for a in analyses if a.is_highly_biased)
+        neutral = sum(
+            1 for a in analyses if not a.is_highly_biased and a.bias_confidence > 0.5
+        )
+
+        stats = self._stats
+        stats.total_analyzed += len(analyses)
+        stats.total_tokens += sum(r.total_tokens for r in responses)
+        stats.total_cost += sum(r.cost_usd for r in responses)
+        stats.highly_biased += highly_biased
+        stats.neutral += neutral
 
     async def analyze(
         self,
         article: ParsedArticle,
         context_articles: list[ParsedArticle] | None = None,
+        on_field: Callable[[str, Any], None] | None = None,
     ) -> BiasAnalysis:
         """
         Analyze article for bias and missing perspectives.
@@ -88,90 +255,97 @@ class BiasAgent:
         Args:
             article: Article to analyze
             context_articles: Other articles on same topic for comparison
+            on_field: Optional callback receiving each raw (key, value) field
+                of the model's JSON as soon as it is complete. Uses the
+                provider's streaming API unless a response cache is set.
 
         Returns:
             BiasAnalysis with scores and insights
         """
-        # Build analysis prompt
-        prompt = self._build_analysis_prompt(article, context_articles)
+        # Confidently neutral articles skip the LLM
+        analysis = self._prefilter(article)
+        if analysis is not None:
+            self._stats.neutral_bypassed += 1
+            self._record_analyses([analysis], [])
+            return analysis
+
+        request = self._analysis_request(article, context_articles)
 
         # Call LLM
-        response = await self.provider.complete(
-            prompt=prompt,
-            max_tokens=1200,
-            temperature=0.4,
-            system_prompt=BIAS_SYSTEM_PROMPT,
-        )
+        if on_field is not None and self.cache is None:
+            response = await self._stream(request, on_field)
+        else:
+            response = await self._complete(**request)
+            if on_field is not None:
+                for key, value in JSONFieldStream().feed(response.content):
+                    on_field(key, value)
 
         # Parse response
         analysis = self._parse_response(response, article)
 
         # Update stats
-        self._stats.total_analyzed += 1
-        self._stats.total_tokens += response.total_tokens
-        self._stats.total_cost += response.cost_usd
-
-        if analysis.is_highly_biased:
-            self._stats.highly_biased += 1
-        elif analysis.bias_confidence > 0.5 and not analysis.is_highly_biased:
-            self._stats.neutral += 1
+        self._record_analyses([analysis], [response])
 
         return analysis
 
+    async def _stream(
+        self,
+        request: dict[str, Any],
+        on_field: Callable[[str, Any], None],
+    ) -> LLMResponse:
+        """Stream a completion, reporting JSON fields as they complete."""
+        start_time = time.time()
+        parser = JSONFieldStream()
+        parts = []
+
+        async for chunk in self.provider.stream_complete(**request):
+            parts.append(chunk)
+            for key, value in parser.feed(chunk):
+                on_field(key, value)
+
+        # Streams don't return usage to the caller; estimate for agent stats
+        content = "".join(parts)
+        input_tokens = self.provider.estimate_tokens(request["system_prompt"] + request["prompt"])
+        output_tokens = self.provider.estimate_tokens(content)
+
+        return LLMResponse(
+            content=content,
+            model=self.provider.model,
+            provider=self.provider.provider_name,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=self.provider.calculate_cost(input_tokens, output_tokens),
+            response_time_seconds=time.time() - start_time,
+            metadata={"streamed": True, "estimated_usage": True},
+        )
+
     def _build_analysis_prompt(
         self,
         article: ParsedArticle,
         context_articles: list[ParsedArticle] | None,
     ) -> str:
         """Build the bias analysis prompt."""
-        # Truncate content if too long
-        content = article.content
-        if len(content) > 5000:
-            content = content[:5000] + "\n\n[Content truncated for analysis]"
+        # Content compressed to the analysis budget (shared with other agents)
+        features = get_features(article)
+        content = features.analysis_content
+        if features.analysis_truncated:
+            content += TRUNCATION_NOTE
 
         context_section = ""
         if context_articles:
             context_section = "\nOTHER ARTICLES ON SAME TOPIC (for comparison):\n"
             for i, ctx in enumerate(context_articles[:3], 1):
-                context_section += f"{i}. {ctx.title} ({ctx.source}): {ctx.content[:200]}...\n"
-
-        prompt = f"""Analyze this article for potential bias and missing perspectives.
-
-ARTICLE:
-Title: {article.title}
-Source: {article.source}
-Author: {article.author or 'Unknown'}
-Published: {article.published_date.isoformat() if article.published_date else 'Unknown'}
-
-Content:
-{content}
-{context_section}
-
-Analyze for bias and respond with JSON:
-{{
-    "bias_score": 0.0-1.0,  // 0=far left, 0.5=neutral, 1.0=far right
-    "bias_direction": "left|center_left|center|center_right|right|unknown",
-    "bias_confidence": 0.0-1.0,  // How confident in bias assessment
-
-    "loaded_language": ["phrase1", "phrase2"],  // Emotionally charged terms
-    "framing_issues": ["issue1", "issue2"],  // How story is framed
-    "missing_context": ["context1", "context2"],  // Important omissions
-    "one_sided_sources": true/false,  // Are sources balanced?
-
-    "missing_perspectives": ["perspective1", "perspective2"],  // Viewpoints not represented
-    "suggested_counterpoints": ["point1", "point2"],  // Alternative views to consider
-
-    "verifiable_claims": ["claim1", "claim2"],  // Claims that can be fact-checked
-    "unverified_claims": ["claim1"],  // Claims without clear evidence
-    "potentially_misleading": ["issue1"],  // Technically true but misleading statements
-
-    "skeptics_corner": "A thoughtful 2-3 sentence skeptical take on this article",
-    "red_flags": ["flag1", "flag2"]  // Specific concerns about this content
-}}
-
-Note: Be nuanced. A 0.5 bias score means balanced/neutral. Reserve extreme scores (< 0.2 or > 0.8) for clearly agenda-driven content. Technical/research content is often genuinely neutral."""
-
-        return prompt
+                preview = get_features(ctx).preview
+                context_section += f"{i}. {ctx.title} ({ctx.source}): {preview}...\n"
+
+        return ANALYSIS_PROMPT_TEMPLATE.substitute(
+            title=article.title,
+            source=article.source,
+            author=article.author or "Unknown",
+            published=article.published_date.isoformat() if article.published_date else "Unknown",
+            content=content,
+            context_section=context_section,
+        )
 
     def _parse_response(
         self,
@@ -180,15 +354,8 @@ Note: Be nuanced. A 0.5 bias score means balanced/neutral. Reserve extreme score
     ) -> BiasAnalysis:
         """Parse LLM response into BiasAnalysis."""
         try:
-            # Try to extract JSON from response
-            content = response.content.strip()
-
-            # Handle potential markdown code blocks
-            if content.startswith("```"):
-                content = re.sub(r"^```(?:json)?\n?", "", content)
-                content = re.sub(r"\n?```$", "", content)
-
-            data = json.loads(content)
+            # Extract JSON from response, handling markdown code blocks
+            data = loads_llm_json(response.content)
 
             # Parse bias direction
             direction_str = data.get("bias_direction", "unknown").upper()
@@ -198,20 +365,20 @@ Note: Be nuanced. A 0.5 bias score means balanced/neutral. Reserve extreme score
                 bias_direction = BiasDirection.UNKNOWN
 
             return BiasAnalysis(
-                bias_score=self._clamp(data.get("bias_score", 0.5)),
+                bias_score=clamp01(data.get("bias_score", 0.5)),
                 bias_direction=bias_direction,
-                bias_confidence=self._clamp(data.get("bias_confidence", 0.5)),
-                loaded_language=data.get("loaded_language", [])[:10],
-                framing_issues=data.get("framing_issues", [])[:5],
-                missing_context=data.get("missing_context", [])[:5],
+                bias_confidence=clamp01(data.get("bias_confidence", 0.5)),
+                loaded_language=_take(data, "loaded_language", 10),
+                framing_issues=_take(data, "framing_issues", 5),
+                missing_context=_take(data, "missing_context", 5),
                 one_sided_sources=data.get("one_sided_sources", False),
-                missing_perspectives=data.get("missing_perspectives", [])[:5],
-                suggested_counterpoints=data.get("suggested_counterpoints", [])[:5],
-                verifiable_claims=data.get("verifiable_claims", [])[:5],
-                unverified_claims=data.get("unverified_claims", [])[:5],
-                potentially_misleading=data.get("potentially_misleading", [])[:3],
+                missing_perspectives=_take(data, "missing_perspectives", 5),
+                suggested_counterpoints=_take(data, "suggested_counterpoints", 5),
+                verifiable_claims=_take(data, "verifiable_claims", 5),
+                unverified_claims=_take(data, "unverified_claims", 5),
+                potentially_misleading=_take(data, "potentially_misleading", 3),
                 skeptics_corner=data.get("skeptics_corner", ""),
-                red_flags=data.get("red_flags", [])[:5],
+                red_flags=_take(data, "red_flags", 5),
             )
 
         except (json.JSONDecodeError, KeyError, TypeError) as e:
@@ -223,38 +390,43 @@ Note: Be nuanced. A 0.5 bias score means balanced/neutral. Reserve extreme score
                 skeptics_corner=f"Unable to complete bias analysis: {str(e)}",
             )
 
-    def _clamp(self, value: float) -> float:
-        """Clamp value between 0 and 1."""
-        try:
-            return max(0.0, min(1.0, float(value)))
-        except (TypeError, ValueError):
-            return 0.5
-
     async def batch_analyze(
         self,
         articles: list[ParsedArticle],
-        max_concurrent: int = 5,
+        max_concurrent: int = 50,
     ) -> list[BiasAnalysis]:
         """
-        Analyze multiple articles concurrently.
+        Analyze multiple articles as a single provider batch.
+
+        All prompts are built upfront and submitted together via
+        the provider's complete_batch(). Requests are submitted shortest
+        article first, so requests in flight together have similar
+        latency and short analyses don't wait behind long ones.
+
+        Confidently neutral articles are answered locally and never
+        submitted.
 
         Args:
             articles: List of articles to analyze
-            max_concurrent: Maximum concurrent analyses
+            max_concurrent: Maximum in-flight requests (size to provider rate limit)
 
         Returns:
             List of BiasAnalysis in same order as input
         """
-        import asyncio
+        analyses: list[BiasAnalysis | None] = [self._prefilter(a) for a in articles]
+        bypassed = len(articles) - analyses.count(None)
 
-        semaphore = asyncio.Semaphore(max_concurrent)
+        pending = [i for i, analysis in enumerate(analyses) if analysis is None]
+        order = sorted(pending, key=lambda i: len(articles[i].content))
+        requests = [self._analysis_request(articles[i]) for i in order]
+        responses = await self._complete_batch(requests, max_concurrent) if requests else []
 
-        async def analyze_with_limit(article: ParsedArticle) -> BiasAnalysis:
-            async with semaphore:
-                return await self.analyze(article)
+        for i, response in zip(order, responses, strict=True):
+            analyses[i] = self._parse_response(response, articles[i])
 
-        tasks = [analyze_with_limit(article) for article in articles]
-        return await asyncio.gather(*tasks)
+        self._stats.neutral_bypassed += bypassed
+        self._record_analyses(analyses, responses)
+        return analyses
 
     async def compare_coverage(
         self,
@@ -277,35 +449,39 @@ Note: Be nuanced. A 0.5 bias score means balanced/neutral. Reserve extreme score
         # Analyze each article
         analyses = await self.batch_analyze(articles)
 
-        # Calculate aggregate stats
-        avg_bias = sum(a.bias_score for a in analyses) / len(analyses)
-        bias_range = max(a.bias_score for a in analyses) - min(a.bias_score for a in analyses)
-
-        # Collect all missing perspectives
+        # Aggregate in a single pass
+        scores = []
+        distribution = {"left": 0, "center": 0, "right": 0}
         all_missing = set()
+        flag_counts: Counter[str] = Counter()
+        highly_biased = 0
+
         for analysis in analyses:
+            score = analysis.bias_score
+            scores.append(score)
+            if score < 0.4:
+                distribution["left"] += 1
+            elif score <= 0.6:
+                distribution["center"] += 1
+            else:
+                distribution["right"] += 1
+
             all_missing.update(analysis.missing_perspectives)
+            flag_counts.update(analysis.red_flags)
+            if analysis.is_highly_biased:
+                highly_biased += 1
 
-        # Find common red flags
-        flag_counts: dict[str, int] = {}
-        for analysis in analyses:
-            for flag in analysis.red_flags:
-                flag_counts[flag] = flag_counts.get(flag, 0) + 1
         common_flags = [f for f, c in flag_counts.items() if c > 1]
 
         return {
             "topic": topic,
             "article_count": len(articles),
-            "average_bias_score": avg_bias,
-            "bias_range": bias_range,
-            "bias_distribution": {
-                "left": sum(1 for a in analyses if a.bias_score < 0.4),
-                "center": sum(1 for a in analyses if 0.4 <= a.bias_score <= 0.6),
-                "right": sum(1 for a in analyses if a.bias_score > 0.6),
-            },
+            "average_bias_score": fmean(scores),
+            "bias_range": max(scores) - min(scores),
+            "bias_distribution": distribution,
             "missing_perspectives_across_all": list(all_missing),
             "common_red_flags": common_flags,
-            "highly_biased_count": sum(1 for a in analyses if a.is_highly_biased),
+            "highly_biased_count": highly_biased,
         }
 
     async def generate_balanced_summary(
@@ -342,7 +518,7 @@ Issues identified:
 
 Write a balanced summary:"""
 
-        response = await self.provider.complete(
+        response = await self._complete(
             prompt=prompt,
             max_tokens=200,
             temperature=0.3,
@@ -365,6 +541,14 @@ Write a balanced summary:"""
             ),
             "total_tokens": self._stats.total_tokens,
             "total_cost_usd": self._stats.total_cost,
+            "cache_hits": self._stats.cache_hits,
+            "cache_misses": self._stats.cache_misses,
+            "neutral_bypassed": self._stats.neutral_bypassed,
+            "bypass_rate": (
+                self._stats.neutral_bypassed / self._stats.total_analyzed * 100
+                if self._stats.total_analyzed > 0
+                else 0.0
+            ),
             "provider_stats": self.provider.get_stats(),
         }
 
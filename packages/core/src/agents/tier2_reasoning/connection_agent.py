@@ -13,9 +13,10 @@ Usage:
     connections = await agent.find_connections(articles)
 """
 
+import asyncio
 import json
-import re
 from dataclasses import dataclass
+from itertools import combinations
 from typing import Any
 
 from ...models.article import (
@@ -24,9 +25,14 @@ from ...models.article import (
     CrossConnection,
 )
 from ...providers.base import BaseLLMProvider, LLMResponse
+from ...providers.cache import LLMCache
+from ...utils.compression import compress_content, load_tokenizer
+from ...utils.llm_json import clamp01, loads_llm_json
+from ...utils.similarity import similar_pairs
+from ._article_cache import get_features
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionAgentStats:
     """Statistics for connection agent operations."""
 
@@ -34,6 +40,18 @@ class ConnectionAgentStats:
     connections_found: int = 0
     total_tokens: int = 0
     total_cost: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    pairs_screened: int = 0
+    pairs_sent: int = 0
+
+
+# Per-article content budget in connection prompts (~500 chars)
+PREVIEW_CONTENT_TOKENS = 125
+
+# Local pre-screening: only pairs this lexically similar reach the LLM
+CANDIDATE_SIMILARITY_THRESHOLD = 0.2
+MAX_CANDIDATE_PAIRS = 10
 
 
 # System prompt for connection analysis
@@ -58,6 +76,41 @@ Be selective - only identify connections that provide genuine insight. Not every
 IMPORTANT: Respond ONLY with valid JSON. No markdown, no explanations outside JSON."""
 
 
+# Response format for connection analysis. Sent as part of the system prompt
+# so the static prefix is cacheable and only the article list varies.
+CONNECTION_RESPONSE_FORMAT = """Find connections between article pairs. For each connection, provide:
+1. The two article IDs involved
+2. Type of connection (supports, contradicts, extends, provides_context, pattern)
+3. Strength (0.0-1.0, where 1.0 is very strong)
+4. Brief summary of the connection
+
+Respond with JSON in this format:
+{
+    "connections": [
+        {
+            "article1_id": "id1",
+            "article2_id": "id2",
+            "connection_type": "supports|contradicts|extends|provides_context|pattern",
+            "strength": 0.0-1.0,
+            "summary": "Brief explanation of how these articles connect"
+        }
+    ],
+    "patterns": [
+        {
+            "pattern_name": "Name of the broader pattern",
+            "article_ids": ["id1", "id2", "id3"],
+            "description": "Description of the pattern across these articles"
+        }
+    ],
+    "cross_story_insight": "One key insight that emerges from looking across all these articles"
+}
+
+Only include connections with strength >= 0.5. If no meaningful connections exist, return empty arrays."""
+
+# Full system prompt for connection analysis requests
+ANALYSIS_SYSTEM_PROMPT = f"{CONNECTION_SYSTEM_PROMPT}\n\n{CONNECTION_RESPONSE_FORMAT}"
+
+
 class ConnectionAgent:
     """
     Tier 2 Cross-Connection Analysis Agent.
@@ -66,15 +119,36 @@ class ConnectionAgent:
     deeper insights and pattern recognition.
     """
 
-    def __init__(self, provider: BaseLLMProvider):
+    def __init__(self, provider: BaseLLMProvider, cache: LLMCache | None = None):
         """
         Initialize connection agent.
 
         Args:
             provider: LLM provider (Tier 2 recommended)
+            cache: Optional response cache for deterministic calls
         """
         self.provider = provider
+        self.cache = cache
         self._stats = ConnectionAgentStats()
+        # Article features count tokens; don't fetch the tokenizer mid-request
+        load_tokenizer()
+
+    async def _complete(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        """Call the provider through the cache, counting hits and misses."""
+        response, hit = await LLMCache.complete_if_cacheable(
+            self.cache, self.provider, prompt, max_tokens, temperature, system_prompt
+        )
+        if hit is True:
+            self._stats.cache_hits += 1
+        elif hit is False:
+            self._stats.cache_misses += 1
+        return response
 
     async def find_connections(
         self,
@@ -102,38 +176,65 @@ class ConnectionAgent:
             else:
                 parsed_articles.append(article)
 
+        # Screen pairs locally so the LLM only sees plausible connections
+        pairs = self._candidate_pairs(parsed_articles)
+        self._stats.total_analyses += 1
+        self._stats.pairs_screened += len(parsed_articles) * (len(parsed_articles) - 1) // 2
+        self._stats.pairs_sent += len(pairs)
+        if not pairs:
+            return []
+
         # Build analysis prompt
-        prompt = self._build_connection_prompt(parsed_articles)
+        prompt = self._build_connection_prompt(parsed_articles, pairs)
 
         # Call LLM
-        response = await self.provider.complete(
+        response = await self._complete(
             prompt=prompt,
             max_tokens=1500,
             temperature=0.4,
-            system_prompt=CONNECTION_SYSTEM_PROMPT,
+            system_prompt=ANALYSIS_SYSTEM_PROMPT,
         )
 
         # Parse response
         connections = self._parse_response(response, parsed_articles, min_strength)
 
         # Update stats
-        self._stats.total_analyses += 1
         self._stats.connections_found += len(connections)
         self._stats.total_tokens += response.total_tokens
         self._stats.total_cost += response.cost_usd
 
         return connections
 
+    def _candidate_pairs(
+        self,
+        articles: list[ParsedArticle],
+    ) -> list[tuple[int, int, float]]:
+        """Find the most similar article pairs by local TF-IDF cosine."""
+        counts = [get_features(a).term_counts for a in articles]
+        return similar_pairs(counts, CANDIDATE_SIMILARITY_THRESHOLD, MAX_CANDIDATE_PAIRS)
+
     def _build_connection_prompt(
         self,
         articles: list[ParsedArticle],
+        pairs: list[tuple[int, int, float]],
     ) -> str:
-        """Build the connection analysis prompt."""
+        """Build the connection analysis prompt for candidate pairs."""
+        # Each article's partners, for ranking its preview paragraphs
+        partners: dict[int, list[int]] = {}
+        for i, j, _ in pairs:
+            partners.setdefault(i, []).append(j)
+            partners.setdefault(j, []).append(i)
+
         articles_text = ""
-        for i, article in enumerate(articles[:10]):  # Limit to 10 articles
-            content_preview = article.content[:500] if len(article.content) > 500 else article.content
+        for n, i in enumerate(sorted(partners), 1):
+            article = articles[i]
+            content_preview = compress_content(
+                article.content,
+                PREVIEW_CONTENT_TOKENS,
+                [articles[j].title for j in partners[i]],
+            )
             articles_text += f"""
-ARTICLE {i + 1}:
+ARTICLE {n}:
 ID: {article.article_id}
 Title: {article.title}
 Source: {article.source}
@@ -142,38 +243,19 @@ Content: {content_preview}...
 ---
 """
 
+        pairs_text = "\n".join(
+            f"- {articles[i].article_id} <-> {articles[j].article_id}"
+            for i, j, _ in pairs
+        )
+
         prompt = f"""Analyze these articles and identify meaningful connections between them.
 
 {articles_text}
 
-Find connections between article pairs. For each connection, provide:
-1. The two article IDs involved
-2. Type of connection (supports, contradicts, extends, provides_context, pattern)
-3. Strength (0.0-1.0, where 1.0 is very strong)
-4. Brief summary of the connection
-
-Respond with JSON:
-{{
-    "connections": [
-        {{
-            "article1_id": "id1",
-            "article2_id": "id2",
-            "connection_type": "supports|contradicts|extends|provides_context|pattern",
-            "strength": 0.0-1.0,
-            "summary": "Brief explanation of how these articles connect"
-        }}
-    ],
-    "patterns": [
-        {{
-            "pattern_name": "Name of the broader pattern",
-            "article_ids": ["id1", "id2", "id3"],
-            "description": "Description of the pattern across these articles"
-        }}
-    ],
-    "cross_story_insight": "One key insight that emerges from looking across all these articles"
-}}
+CANDIDATE PAIRS (pre-screened as topically related):
+{pairs_text}
 
-Only include connections with strength >= 0.5. If no meaningful connections exist, return empty arrays."""
+Find connections between the candidate pairs and respond with JSON in the required format."""
 
         return prompt
 
@@ -185,39 +267,33 @@ Only include connections with strength >= 0.5. If no meaningful connections exis
     ) -> list[tuple[str, str, CrossConnection]]:
         """Parse LLM response into connections."""
         try:
-            # Try to extract JSON from response
-            content = response.content.strip()
-
-            # Handle potential markdown code blocks
-            if content.startswith("```"):
-                content = re.sub(r"^```(?:json)?\n?", "", content)
-                content = re.sub(r"\n?```$", "", content)
-
-            data = json.loads(content)
+            # Extract JSON from response, handling markdown code blocks
+            data = loads_llm_json(response.content)
 
-            # Validate article IDs
-            valid_ids = {a.article_id for a in articles}
+            # Article positions, for validating IDs
+            id_to_idx = {a.article_id: i for i, a in enumerate(articles)}
 
             connections = []
             for conn_data in data.get("connections", []):
                 article1_id = conn_data.get("article1_id", "")
                 article2_id = conn_data.get("article2_id", "")
-                strength = float(conn_data.get("strength", 0))
 
                 # Validate
-                if (
-                    article1_id in valid_ids
-                    and article2_id in valid_ids
-                    and article1_id != article2_id
-                    and strength >= min_strength
-                ):
-                    connection = CrossConnection(
-                        related_article_id=article2_id,
-                        connection_type=conn_data.get("connection_type", "related"),
-                        connection_strength=min(1.0, max(0.0, strength)),
-                        summary=conn_data.get("summary", ""),
-                    )
-                    connections.append((article1_id, article2_id, connection))
+                i1 = id_to_idx.get(article1_id)
+                i2 = id_to_idx.get(article2_id)
+                if i1 is None or i2 is None or i1 == i2:
+                    continue
+                strength = clamp01(conn_data.get("strength"), default=0.0)
+                if strength < min_strength:
+                    continue
+
+                connection = CrossConnection(
+                    related_article_id=article2_id,
+                    connection_type=conn_data.get("connection_type", "related"),
+                    connection_strength=strength,
+                    summary=conn_data.get("summary", ""),
+                )
+                connections.append((article1_id, article2_id, connection))
 
             return connections
 
@@ -251,7 +327,7 @@ Only include connections with strength >= 0.5. If no meaningful connections exis
                 parsed.append(article)
 
         articles_text = "\n".join(
-            f"- {a.title} ({a.source}): {a.content[:200]}..."
+            f"- {a.title} ({a.source}): {get_features(a).preview}..."
             for a in parsed
         )
 
@@ -269,7 +345,7 @@ Articles:
 
 Write a HN-style synthesis (technical, insightful, slightly skeptical):"""
 
-        response = await self.provider.complete(
+        response = await self._complete(
             prompt=prompt,
             max_tokens=200,
             temperature=0.5,
@@ -284,6 +360,10 @@ Write a HN-style synthesis (technical, insightful, slightly skeptical):"""
         """
         Specifically find contradictions between articles.
 
+        Each article pair is checked with its own small request and all
+        pairs run in parallel, so latency is bounded by the slowest pair
+        rather than one long combined generation.
+
         Args:
             articles: Articles to check for contradictions
 
@@ -293,45 +373,59 @@ Write a HN-style synthesis (technical, insightful, slightly skeptical):"""
         if len(articles) < 2:
             return []
 
-        articles_text = "\n".join(
-            f"[{i + 1}] {a.title}: {a.content[:400]}..."
-            for i, a in enumerate(articles[:6])
-        )
+        pairs = list(combinations(enumerate(articles[:6], 1), 2))
+
+        responses = await asyncio.gather(*(
+            self._complete(
+                prompt=self._build_contradiction_prompt(a1, a2),
+                max_tokens=250,
+                temperature=0.3,
+            )
+            for (_, a1), (_, a2) in pairs
+        ))
+
+        contradictions = []
+        for ((i, _), (j, _)), response in zip(pairs, responses, strict=True):
+            try:
+                data = loads_llm_json(response.content)
+            except (json.JSONDecodeError, TypeError):
+                continue
+
+            if not isinstance(data, dict) or data.get("contradicts") is not True:
+                continue
+
+            contradictions.append({
+                "article_indices": [i, j],
+                "claim_1": data.get("claim_1", ""),
+                "claim_2": data.get("claim_2", ""),
+                "significance": data.get("significance", ""),
+                "possible_resolution": data.get("possible_resolution", ""),
+            })
+
+        return contradictions
+
+    def _build_contradiction_prompt(
+        self,
+        article1: ParsedArticle,
+        article2: ParsedArticle,
+    ) -> str:
+        """Build the pairwise contradiction check prompt."""
+        return f"""Do these two articles make contradicting or conflicting claims?
 
-        prompt = f"""Identify any contradictions or conflicting claims between these articles.
+[A] {article1.title}: {article1.content[:400]}...
 
-{articles_text}
+[B] {article2.title}: {article2.content[:400]}...
 
-For each contradiction found, respond with JSON:
+Respond with JSON:
 {{
-    "contradictions": [
-        {{
-            "article_indices": [1, 3],
-            "claim_1": "What article 1 claims",
-            "claim_2": "What article 3 claims (contradicting)",
-            "significance": "Why this contradiction matters",
-            "possible_resolution": "How to reconcile or which might be more accurate"
-        }}
-    ]
+    "contradicts": true/false,
+    "claim_1": "What article A claims",
+    "claim_2": "What article B claims (contradicting)",
+    "significance": "Why this contradiction matters",
+    "possible_resolution": "How to reconcile or which might be more accurate"
 }}
 
-If no meaningful contradictions exist, return {{"contradictions": []}}"""
-
-        response = await self.provider.complete(
-            prompt=prompt,
-            max_tokens=800,
-            temperature=0.3,
-        )
-
-        try:
-            content = response.content.strip()
-            if content.startswith("```"):
-                content = re.sub(r"^```(?:json)?\n?", "", content)
-                content = re.sub(r"\n?```$", "", content)
-            data = json.loads(content)
-            return data.get("contradictions", [])
-        except (json.JSONDecodeError, TypeError):
-            return []
+If there is no meaningful contradiction, return {{"contradicts": false}}"""
 
     async def identify_trends(
         self,
@@ -341,6 +435,9 @@ If no meaningful contradictions exist, return {{"contradictions": []}}"""
         """
         Identify broader trends from a collection of articles.
 
+        Runs in two phases: each article is tagged with trend labels in
+        parallel, then a single small aggregation call sees only the tags.
+
         Args:
             articles: Articles to analyze
             topic: Topic for context
@@ -348,15 +445,32 @@ If no meaningful contradictions exist, return {{"contradictions": []}}"""
         Returns:
             Trend analysis
         """
-        articles_text = "\n".join(
-            f"- {a.title} ({a.source}, {a.published_date.strftime('%Y-%m-%d') if a.published_date else 'unknown date'})"
-            for a in articles[:10]
+        empty = {"trends": [], "hot_topics": [], "prediction": ""}
+        articles = articles[:10]
+        if not articles:
+            return empty
+
+        # Phase 1: per-article trend tagging
+        tag_responses = await asyncio.gather(*(
+            self._complete(
+                prompt=self._build_trend_tag_prompt(article, topic),
+                max_tokens=100,
+                temperature=0.3,
+            )
+            for article in articles
+        ))
+
+        tagged_text = "\n".join(
+            f"- {a.title} ({a.source}, {a.published_date.strftime('%Y-%m-%d') if a.published_date else 'unknown date'}): "
+            f"{', '.join(self._parse_trend_tags(r)) or 'no tags'}"
+            for a, r in zip(articles, tag_responses, strict=True)
         )
 
-        prompt = f"""Based on these recent articles about {topic}, identify emerging trends.
+        # Phase 2: aggregate tags into trends
+        prompt = f"""Based on these recent articles about {topic} and their trend tags, identify emerging trends.
 
-Articles:
-{articles_text}
+Articles (title: tags):
+{tagged_text}
 
 Respond with JSON:
 {{
@@ -374,20 +488,38 @@ Respond with JSON:
     "prediction": "Brief prediction about where this topic is heading"
 }}"""
 
-        response = await self.provider.complete(
+        response = await self._complete(
             prompt=prompt,
             max_tokens=600,
             temperature=0.5,
         )
 
         try:
-            content = response.content.strip()
-            if content.startswith("```"):
-                content = re.sub(r"^```(?:json)?\n?", "", content)
-                content = re.sub(r"\n?```$", "", content)
-            return json.loads(content)
+            return loads_llm_json(response.content)
+        except (json.JSONDecodeError, TypeError):
+            return empty
+
+    def _build_trend_tag_prompt(self, article: ParsedArticle, topic: str) -> str:
+        """Build the per-article trend tagging prompt."""
+        return f"""Tag this article about {topic} with 1-3 short trend labels.
+
+Title: {article.title}
+Source: {article.source}
+Content: {article.content[:300]}...
+
+Respond with JSON: {{"tags": ["label1", "label2"]}}"""
+
+    def _parse_trend_tags(self, response: LLMResponse) -> list[str]:
+        """Parse trend labels from a tagging response."""
+        try:
+            data = loads_llm_json(response.content)
         except (json.JSONDecodeError, TypeError):
-            return {"trends": [], "hot_topics": [], "prediction": ""}
+            return []
+
+        tags = data.get("tags") if isinstance(data, dict) else None
+        if not isinstance(tags, list):
+            return []
+        return [str(tag) for tag in tags[:3]]
 
     def get_stats(self) -> dict[str, Any]:
         """Get agent statistics."""
@@ -403,6 +535,10 @@ Respond with JSON:
             ),
             "total_tokens": self._stats.total_tokens,
             "total_cost_usd": self._stats.total_cost,
+            "cache_hits": self._stats.cache_hits,
+            "cache_misses": self._stats.cache_misses,
+            "pairs_screened": self._stats.pairs_screened,
+            "pairs_sent": self._stats.pairs_sent,
             "provider_stats": self.provider.get_stats(),
         }
 
@@ -13,9 +13,12 @@ Usage:
     analysis = await agent.analyze(article, topic_config)
 """
 
+import asyncio
+import copy
 import json
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from ...models.article import (
@@ -23,12 +26,21 @@ from ...models.article import (
     QualityAnalysis,
     ContentType,
 )
-from ...providers.base import BaseLLMProvider, LLMResponse
+from ...providers.base import BaseLLMProvider, LLMResponse, RateLimitError
+from ...utils.llm_json import clamp01, loads_llm_json
+from ...utils.rate_limit import RateLimiter
+from ._article_cache import quality_content
+from .semantic_cache import SemanticCache
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicConfig:
-    """Configuration for topic-based quality analysis."""
+    """
+    Configuration for topic-based quality analysis.
+
+    The prompt strings are built from the keyword lists at construction;
+    treat the lists as immutable afterwards.
+    """
 
     name: str
     keywords: list[str] = field(default_factory=list)
@@ -37,9 +49,54 @@ class TopicConfig:
     min_relevance: float = 0.5
     prefer_technical: bool = True
     max_age_days: int = 7
+    # Keyword lists as shown in analysis prompts
+    keywords_prompt: str = field(init=False, repr=False, compare=False)
+    exclude_prompt: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.keywords_prompt = ", ".join(self.keywords[:PROMPT_KEYWORDS])
+        self.exclude_prompt = ", ".join(self.exclude_keywords[:PROMPT_EXCLUDE_KEYWORDS]) or "none"
+
+    @property
+    def keyword_pattern(self) -> re.Pattern[str] | None:
+        """Pattern matching any keyword anywhere in the text, like a substring check."""
+        return _compile_terms(tuple(self.keywords), whole_words=False)
+
+    @property
+    def exclude_pattern(self) -> re.Pattern[str] | None:
+        """Pattern matching any excluded keyword as a whole word."""
+        return _compile_terms(tuple(self.exclude_keywords), whole_words=True)
+
+
+# Keywords listed in analysis prompts
+PROMPT_KEYWORDS = 10
+PROMPT_EXCLUDE_KEYWORDS = 5
+
 
+@lru_cache(maxsize=256)
+def _compile_terms(terms: tuple[str, ...], whole_words: bool) -> re.Pattern[str] | None:
+    """Compile terms into one case-insensitive alternation, or None if empty."""
+    terms = [term for term in terms if term]
+    if not terms:
+        return None
+    pattern = "|".join(map(re.escape, terms))
+    if whole_words:
+        pattern = rf"(?<!\w)(?:{pattern})(?!\w)"
+    return re.compile(pattern, re.IGNORECASE)
 
-@dataclass
+
+def _apply_thresholds(analysis: QualityAnalysis, config: TopicConfig) -> None:
+    """Exclude an analysis that falls below the topic's score thresholds."""
+    if analysis.relevance_score < config.min_relevance:
+        analysis.should_include = False
+        analysis.skip_reason = analysis.skip_reason or "Below relevance threshold"
+
+    if analysis.quality_score < config.min_quality:
+        analysis.should_include = False
+        analysis.skip_reason = analysis.skip_reason or "Below quality threshold"
+
+
+@dataclass(slots=True)
 class QualityAgentStats:
     """Statistics for quality agent operations."""
 
@@ -49,6 +106,10 @@ class QualityAgentStats:
     failed_relevance: int = 0
     total_tokens: int = 0
     total_cost: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    quick_filter_lexical: int = 0
+    rate_limit_retries: int = 0
 
 
 # System prompt for quality analysis
@@ -73,6 +134,88 @@ Be brutally honest. Most content is mediocre - don't inflate scores. A 0.7+ shou
 IMPORTANT: Respond ONLY with valid JSON. No markdown, no explanations outside JSON."""
 
 
+# Response format for quality analysis. Sent as part of the system prompt so
+# the whole static prefix is cacheable and only article content varies per call.
+QUALITY_RESPONSE_FORMAT = """Respond with JSON in this format:
+{
+    "relevance_score": 0.0-1.0,  // How relevant to topic/interests
+    "quality_score": 0.0-1.0,    // Writing quality, depth, credibility
+    "novelty_score": 0.0-1.0,    // How new/original is this
+    "depth_score": 0.0-1.0,      // Technical/analytical depth
+    "credibility_score": 0.0-1.0, // Source credibility, evidence quality
+    "content_type": "news|opinion|analysis|research|press_release|blog|unknown",
+    "technical_level": 1-5,       // 1=general, 5=expert
+    "key_points": ["point1", "point2", "point3"],  // 3-5 key takeaways
+    "why_matters": "One sentence on why this matters",
+    "implications": ["implication1", "implication2"],  // Future implications
+    "originality_indicators": ["indicator1"],  // What makes this original
+    "skip_reason": null or "reason to skip",  // If should be filtered
+    "should_include": true/false
+}"""
+
+# JSON schema for providers with structured output, which constrain the
+# response to it; the format above remains for providers without.
+_SCORE = {"type": "number", "minimum": 0, "maximum": 1}
+_STRINGS = {"type": "array", "items": {"type": "string"}}
+QUALITY_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "relevance_score": _SCORE,
+        "quality_score": _SCORE,
+        "novelty_score": _SCORE,
+        "depth_score": _SCORE,
+        "credibility_score": _SCORE,
+        "content_type": {
+            "type": "string",
+            "enum": ["news", "opinion", "analysis", "research", "press_release", "blog", "unknown"],
+        },
+        "technical_level": {"type": "integer", "minimum": 1, "maximum": 5},
+        "key_points": _STRINGS,
+        "why_matters": {"type": "string"},
+        "implications": _STRINGS,
+        "originality_indicators": _STRINGS,
+        "skip_reason": {"type": ["string", "null"]},
+        "should_include": {"type": "boolean"},
+    },
+    "required": [
+        "relevance_score",
+        "quality_score",
+        "novelty_score",
+        "depth_score",
+        "credibility_score",
+        "content_type",
+        "technical_level",
+        "key_points",
+        "why_matters",
+        "implications",
+        "originality_indicators",
+        "skip_reason",
+        "should_include",
+    ],
+    "additionalProperties": False,
+}
+
+# Response content_type value -> ContentType
+_CONTENT_TYPES = {content_type.value: content_type for content_type in ContentType}
+
+# Full system prompt for analysis requests
+ANALYSIS_SYSTEM_PROMPT = f"{QUALITY_SYSTEM_PROMPT}\n\n{QUALITY_RESPONSE_FORMAT}"
+
+ANALYSIS_MAX_TOKENS = 1000
+
+# Rough prompt size estimate for rate limiting (no tokenizer on the hot path)
+CHARS_PER_TOKEN = 4
+
+# Tokens every request spends besides the article prompt: the system prompt
+# is sent each time, plus the completion budget
+REQUEST_OVERHEAD_TOKENS = len(ANALYSIS_SYSTEM_PROMPT) // CHARS_PER_TOKEN + ANALYSIS_MAX_TOKENS
+
+# Retries after the provider's own retries give up on a 429 (rate-limited
+# agents only; the limiter is paused so the whole batch backs off)
+RATE_LIMIT_RETRIES = 2
+RATE_LIMIT_BACKOFF_SECONDS = 2.0
+
+
 class QualityAgent:
     """
     Tier 2 Quality Analysis Agent.
@@ -85,6 +228,8 @@ class QualityAgent:
         self,
         provider: BaseLLMProvider,
         default_config: TopicConfig | None = None,
+        semantic_cache: SemanticCache[QualityAnalysis] | None = None,
+        rate_limiter: RateLimiter | None = None,
     ):
         """
         Initialize quality agent.
@@ -92,9 +237,15 @@ class QualityAgent:
         Args:
             provider: LLM provider (Tier 2 recommended)
             default_config: Default topic configuration
+            semantic_cache: Optional cache reusing analyses of the same or
+                near-duplicate articles
+            rate_limiter: Optional limiter matching the provider's request
+                and token limits; share one across agents using the same key
         """
         self.provider = provider
         self.default_config = default_config or TopicConfig(name="General")
+        self.semantic_cache = semantic_cache
+        self.rate_limiter = rate_limiter
         self._stats = QualityAgentStats()
 
     async def analyze(
@@ -116,24 +267,74 @@ class QualityAgent:
         """
         config = topic_config or self.default_config
 
+        # Same or near-duplicate article already analyzed for this config
+        scope = repr((config, user_interests))
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.get(article, scope)
+            if cached is not None:
+                self._stats.cache_hits += 1
+                analysis = copy.deepcopy(cached)
+                self._record(analysis, config)
+                return analysis
+            self._stats.cache_misses += 1
+
         # Build analysis prompt
         prompt = self._build_analysis_prompt(article, config, user_interests)
 
         # Call LLM
-        response = await self.provider.complete(
-            prompt=prompt,
-            max_tokens=1000,
-            temperature=0.3,  # Low temperature for consistent scoring
-            system_prompt=QUALITY_SYSTEM_PROMPT,
-        )
+        response = await self._complete(prompt)
 
         # Parse response
         analysis = self._parse_response(response, article, config)
+        if self.semantic_cache is not None:
+            self.semantic_cache.set(article, copy.deepcopy(analysis), scope)
 
         # Update stats
+        self._record(analysis, config, response)
+
+        return analysis
+
+    async def _complete(self, prompt: str) -> LLMResponse:
+        """Call the provider, within the rate limit if one is set."""
+        if self.rate_limiter is None:
+            return await self._request(prompt)
+
+        tokens = len(prompt) // CHARS_PER_TOKEN + REQUEST_OVERHEAD_TOKENS
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire(tokens)
+            try:
+                return await self._request(prompt)
+            except RateLimitError as e:
+                if attempt >= RATE_LIMIT_RETRIES:
+                    raise
+                self._stats.rate_limit_retries += 1
+                self.rate_limiter.pause(
+                    e.retry_after or RATE_LIMIT_BACKOFF_SECONDS * 2**attempt
+                )
+                attempt += 1
+
+    async def _request(self, prompt: str) -> LLMResponse:
+        """Send one analysis request."""
+        return await self.provider.complete(
+            prompt=prompt,
+            max_tokens=ANALYSIS_MAX_TOKENS,
+            temperature=0.3,  # Low temperature for consistent scoring
+            system_prompt=ANALYSIS_SYSTEM_PROMPT,
+            response_schema=QUALITY_RESPONSE_SCHEMA,
+        )
+
+    def _record(
+        self,
+        analysis: QualityAnalysis,
+        config: TopicConfig,
+        response: LLMResponse | None = None,
+    ) -> None:
+        """Update stats for one analysis (response is None for cache hits)."""
         self._stats.total_analyzed += 1
-        self._stats.total_tokens += response.total_tokens
-        self._stats.total_cost += response.cost_usd
+        if response is not None:
+            self._stats.total_tokens += response.total_tokens
+            self._stats.total_cost += response.cost_usd
 
         if analysis.should_include:
             self._stats.passed_filter += 1
@@ -142,8 +343,6 @@ class QualityAgent:
         else:
             self._stats.failed_quality += 1
 
-        return analysis
-
     def _build_analysis_prompt(
         self,
         article: ParsedArticle,
@@ -151,18 +350,13 @@ class QualityAgent:
         user_interests: list[str] | None,
     ) -> str:
         """Build the analysis prompt."""
-        # Truncate content if too long
-        content = article.content
-        if len(content) > 6000:
-            content = content[:6000] + "\n\n[Content truncated for analysis]"
-
         interests = ", ".join(user_interests) if user_interests else "general technology"
 
         prompt = f"""Analyze this article for quality and relevance.
 
 TOPIC: {config.name}
-KEYWORDS TO MATCH: {', '.join(config.keywords[:10])}
-KEYWORDS TO AVOID: {', '.join(config.exclude_keywords[:5]) if config.exclude_keywords else 'none'}
+KEYWORDS TO MATCH: {config.keywords_prompt}
+KEYWORDS TO AVOID: {config.exclude_prompt}
 USER INTERESTS: {interests}
 TECHNICAL PREFERENCE: {'high' if config.prefer_technical else 'general audience'}
 
@@ -174,24 +368,9 @@ Word Count: {article.word_count}
 Published: {article.published_date.isoformat() if article.published_date else 'Unknown'}
 
 Content:
-{content}
+{quality_content(article)}
 
-Respond with JSON:
-{{
-    "relevance_score": 0.0-1.0,  // How relevant to topic/interests
-    "quality_score": 0.0-1.0,    // Writing quality, depth, credibility
-    "novelty_score": 0.0-1.0,    // How new/original is this
-    "depth_score": 0.0-1.0,      // Technical/analytical depth
-    "credibility_score": 0.0-1.0, // Source credibility, evidence quality
-    "content_type": "news|opinion|analysis|research|press_release|blog|unknown",
-    "technical_level": 1-5,       // 1=general, 5=expert
-    "key_points": ["point1", "point2", "point3"],  // 3-5 key takeaways
-    "why_matters": "One sentence on why this matters",
-    "implications": ["implication1", "implication2"],  // Future implications
-    "originality_indicators": ["indicator1"],  // What makes this original
-    "skip_reason": null or "reason to skip",  // If should be filtered
-    "should_include": true/false
-}}"""
+Respond with JSON in the required format."""
 
         return prompt
 
@@ -203,29 +382,18 @@ Respond with JSON:
     ) -> QualityAnalysis:
         """Parse LLM response into QualityAnalysis."""
         try:
-            # Try to extract JSON from response
-            content = response.content.strip()
-
-            # Handle potential markdown code blocks
-            if content.startswith("```"):
-                content = re.sub(r"^```(?:json)?\n?", "", content)
-                content = re.sub(r"\n?```$", "", content)
+            data = loads_llm_json(response.content)
 
-            data = json.loads(content)
-
-            # Parse content type
-            content_type_str = data.get("content_type", "unknown").upper()
-            try:
-                content_type = ContentType[content_type_str]
-            except KeyError:
-                content_type = ContentType.UNKNOWN
+            content_type = _CONTENT_TYPES.get(
+                str(data.get("content_type")).lower(), ContentType.UNKNOWN
+            )
 
             analysis = QualityAnalysis(
-                relevance_score=self._clamp(data.get("relevance_score", 0.5)),
-                quality_score=self._clamp(data.get("quality_score", 0.5)),
-                novelty_score=self._clamp(data.get("novelty_score", 0.5)),
-                depth_score=self._clamp(data.get("depth_score", 0.5)),
-                credibility_score=self._clamp(data.get("credibility_score", 0.5)),
+                relevance_score=clamp01(data.get("relevance_score", 0.5)),
+                quality_score=clamp01(data.get("quality_score", 0.5)),
+                novelty_score=clamp01(data.get("novelty_score", 0.5)),
+                depth_score=clamp01(data.get("depth_score", 0.5)),
+                credibility_score=clamp01(data.get("credibility_score", 0.5)),
                 content_type=content_type,
                 key_points=data.get("key_points", [])[:5],
                 technical_level=min(5, max(1, data.get("technical_level", 3))),
@@ -236,15 +404,7 @@ Respond with JSON:
                 should_include=data.get("should_include", True),
             )
 
-            # Apply thresholds
-            if analysis.relevance_score < config.min_relevance:
-                analysis.should_include = False
-                analysis.skip_reason = analysis.skip_reason or "Below relevance threshold"
-
-            if analysis.quality_score < config.min_quality:
-                analysis.should_include = False
-                analysis.skip_reason = analysis.skip_reason or "Below quality threshold"
-
+            _apply_thresholds(analysis, config)
             return analysis
 
         except (json.JSONDecodeError, KeyError, TypeError) as e:
@@ -256,23 +416,19 @@ Respond with JSON:
                 should_include=True,  # Include on error, filter later
             )
 
-    def _clamp(self, value: float) -> float:
-        """Clamp value between 0 and 1."""
-        try:
-            return max(0.0, min(1.0, float(value)))
-        except (TypeError, ValueError):
-            return 0.5
-
     async def batch_analyze(
         self,
         articles: list[ParsedArticle],
         topic_config: TopicConfig | None = None,
         user_interests: list[str] | None = None,
-        max_concurrent: int = 5,
+        max_concurrent: int = 16,
     ) -> list[QualityAnalysis]:
         """
         Analyze multiple articles concurrently.
 
+        Concurrency only bounds requests in flight; set a rate_limiter on
+        the agent to keep the batch within the provider's per-minute limits.
+
         Args:
             articles: List of articles to analyze
             topic_config: Topic configuration
@@ -282,8 +438,6 @@ Respond with JSON:
         Returns:
             List of QualityAnalysis in same order as input
         """
-        import asyncio
-
         semaphore = asyncio.Semaphore(max_concurrent)
 
         async def analyze_with_limit(article: ParsedArticle) -> QualityAnalysis:
@@ -301,7 +455,9 @@ Respond with JSON:
         """
         Quick relevance check without full analysis.
 
-        Uses a simpler prompt for faster filtering.
+        Uses a simpler prompt for faster filtering. Articles whose title or
+        preview hits an excluded keyword, or none of the topic keywords, are
+        rejected locally without an LLM call.
 
         Args:
             article: Article to check
@@ -310,6 +466,14 @@ Respond with JSON:
         Returns:
             True if article passes quick filter
         """
+        text = f"{article.title} {article.content[:500]}"
+        exclude, keywords = config.exclude_pattern, config.keyword_pattern
+        if (exclude is not None and exclude.search(text)) or (
+            keywords is not None and not keywords.search(text)
+        ):
+            self._stats.quick_filter_lexical += 1
+            return False
+
         prompt = f"""Quick relevance check. Is this article relevant to "{config.name}"?
 
 Title: {article.title}
@@ -344,6 +508,10 @@ Respond with ONLY "yes" or "no"."""
             ),
             "total_tokens": self._stats.total_tokens,
             "total_cost_usd": self._stats.total_cost,
+            "cache_hits": self._stats.cache_hits,
+            "cache_misses": self._stats.cache_misses,
+            "quick_filter_lexical": self._stats.quick_filter_lexical,
+            "rate_limit_retries": self._stats.rate_limit_retries,
             "provider_stats": self.provider.get_stats(),
         }
 
@@ -0,0 +1,112 @@
+"""Near-duplicate result cache for Tier 2 agents.
+
+News aggregation sees the same story from many sources, often minutes
+apart and nearly word for word. This cache returns a stored analysis for
+an article that was already analyzed, or for one whose text is nearly
+identical, instead of paying for another LLM call.
+
+Lookups first try an exact key (scope, title and URL), then compare the
+article's term vector against every stored vector in the same scope
+(a flat cosine scan; the cache is bounded, so this stays cheap).
+
+Usage:
+    from src.agents.tier2_reasoning import QualityAgent, SemanticCache
+
+    agent = QualityAgent(provider, semantic_cache=SemanticCache())
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+from ...models.article import ParsedArticle
+from ...utils.compression import load_tokenizer
+from ...utils.similarity import cosine, unit_vector
+from ._article_cache import get_features
+
+T = TypeVar("T")
+
+
+# Cosine similarity above which two articles count as the same story
+SIMILARITY_THRESHOLD = 0.95
+
+# Oldest entries are evicted beyond this
+MAX_ENTRIES = 1024
+
+
+class SemanticCache(Generic[T]):
+    """Cache of per-article results with exact and near-duplicate lookup."""
+
+    def __init__(
+        self,
+        threshold: float = SIMILARITY_THRESHOLD,
+        max_entries: int = MAX_ENTRIES,
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a near-duplicate hit
+            max_entries: Maximum cached results
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        # exact key -> (scope, vector, value)
+        self._entries: OrderedDict[str, tuple[str, dict[str, float], T]] = OrderedDict()
+        # Lookups build article features, which count tokens
+        load_tokenizer()
+
+    @staticmethod
+    def _key(article: ParsedArticle, scope: str) -> str:
+        return hashlib.sha256(
+            f"{scope}\0{article.title}\0{article.url}".encode()
+        ).hexdigest()
+
+    @staticmethod
+    def _vector(article: ParsedArticle) -> dict[str, float]:
+        return unit_vector(get_features(article).term_counts)
+
+    def get(self, article: ParsedArticle, scope: str = "") -> T | None:
+        """
+        Look up a result for an article.
+
+        Args:
+            article: Article being analyzed
+            scope: Anything else the result depends on (e.g. topic config);
+                only entries with the same scope match
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        entry = self._entries.get(self._key(article, scope))
+        if entry is not None:
+            return entry[2]
+
+        vector = self._vector(article)
+        best_score, best_value = self.threshold, None
+        for entry_scope, entry_vector, value in self._entries.values():
+            if entry_scope == scope and (score := cosine(vector, entry_vector)) >= best_score:
+                best_score, best_value = score, value
+        return best_value
+
+    def set(self, article: ParsedArticle, value: T, scope: str = "") -> None:
+        """
+        Store a result for an article.
+
+        Args:
+            article: Analyzed article
+            value: Result to cache
+            scope: Scope the result is valid for
+        """
+        key = self._key(article, scope)
+        self._entries[key] = (scope, self._vector(article), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
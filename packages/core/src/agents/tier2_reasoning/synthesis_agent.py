@@ -1,11 +1,44 @@
 """Synthesis Agent - Tier 2 reasoning agent for creating HN-style digests."""
 
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, AsyncIterator
 from datetime import datetime
 from ...models.article import ParsedArticle, DigestMetadata
 from ...mcp_servers import get_tier2_server
 
 
+# Topic sections synthesized concurrently (keep within provider rate limits)
+MAX_CONCURRENT_SECTIONS = 4
+
+# Static persona and writing instructions for topic sections. Sent as the
+# system prompt so this prefix is cached across every section in a digest.
+SYNTHESIS_SYSTEM_PROMPT = """You are a veteran Hacker News commenter known for technical depth and skeptical analysis.
+
+You write Hacker News-style digest sections. Each section should:
+1. Group related articles together
+2. Use technical, skeptical HN-style commentary
+3. Focus on "why this matters" and implications
+4. Highlight key technical details and trade-offs
+5. Avoid hype - be measured and analytical
+6. Give each article 2-3 sentences maximum
+
+Format:
+## [Topic name]
+
+[Your synthesis of the articles in HN comment style]
+
+### Article Title 1
+*Source: [source] | [reading time]*
+
+[2-3 sentence HN-style summary focusing on implications and technical details]
+
+[Source link]
+
+---
+
+Continue for each article. Be concise but insightful."""
+
+
 class SynthesisAgent:
     """
     Tier 2 Synthesis Agent - Creates HN-style news digest from articles.
@@ -36,34 +69,64 @@ class SynthesisAgent:
         Returns:
             Markdown-formatted digest string
         """
-        self.synthesis_count += 1
+        return "".join([
+            chunk
+            async for chunk in self.stream_digest(articles_by_topic, user_preferences, metadata)
+        ])
 
-        # Generate digest sections
-        digest_parts = []
+    async def stream_digest(
+        self,
+        articles_by_topic: Dict[str, List[ParsedArticle]],
+        user_preferences: Dict[str, Any],
+        metadata: DigestMetadata
+    ) -> AsyncIterator[str]:
+        """
+        Stream the digest as markdown chunks.
 
-        # Header
-        digest_parts.append(self._create_header(metadata))
+        The header is yielded immediately. Topic sections are synthesized
+        concurrently and each is yielded, in topic order, as soon as it and
+        every section before it are ready; the footer comes last. Joining
+        the chunks gives exactly the text of create_digest().
 
-        # Topic sections
-        for topic_name, articles in articles_by_topic.items():
-            if not articles:
-                continue
+        Args:
+            articles_by_topic: Dict mapping topic name to list of ParsedArticle
+            user_preferences: User preferences configuration
+            metadata: Digest metadata for inclusion
 
-            topic_section = await self._synthesize_topic_section(
-                topic_name,
-                articles,
-                user_preferences
-            )
+        Yields:
+            Markdown chunks
+        """
+        self.synthesis_count += 1
 
-            digest_parts.append(topic_section)
+        # Header
+        yield self._create_header(metadata)
+
+        # Topic sections, synthesized concurrently
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SECTIONS)
+
+        async def synthesize_with_limit(topic_name: str, articles: List[ParsedArticle]) -> str:
+            async with semaphore:
+                return await self._synthesize_topic_section(
+                    topic_name,
+                    articles,
+                    user_preferences
+                )
+
+        tasks = [
+            asyncio.create_task(synthesize_with_limit(topic_name, articles))
+            for topic_name, articles in articles_by_topic.items()
+            if articles
+        ]
+        try:
+            for task in tasks:
+                yield "\n\n" + await task
+        finally:
+            # Reader stopped early or a section failed
+            for task in tasks:
+                task.cancel()
 
         # Footer with metadata
-        digest_parts.append(self._create_footer(metadata))
-
-        # Join all parts
-        digest = "\n\n".join(digest_parts)
-
-        return digest
+        yield "\n\n" + self._create_footer(metadata)
 
     def _create_header(self, metadata: DigestMetadata) -> str:
         """
@@ -108,40 +171,18 @@ class SynthesisAgent:
         articles_text = self._format_articles_for_synthesis(articles)
 
         # Create synthesis prompt
-        prompt = f"""You are writing a Hacker News-style digest section about: {topic_name}
-
-Articles to synthesize:
-{articles_text}
-
-Write an engaging section that:
-1. Groups related articles together
-2. Uses technical, skeptical HN-style commentary
-3. Focuses on "why this matters" and implications
-4. Highlights key technical details and trade-offs
-5. Avoids hype - be measured and analytical
-6. Each article gets 2-3 sentences maximum
-
-Format:
-## {topic_name}
-
-[Your synthesis of the articles in HN comment style]
+        prompt = f"""Write the digest section for the topic: {topic_name}
 
-### Article Title 1
-*Source: [source] | [reading time]*
-
-[2-3 sentence HN-style summary focusing on implications and technical details]
+Use "## {topic_name}" as the section heading.
 
-[Source link]
-
----
-
-Continue for each article. Be concise but insightful."""
+Articles to synthesize:
+{articles_text}"""
 
         response = await self.server.complete(
             prompt=prompt,
             max_tokens=1500,
             temperature=0.7,  # Moderate creativity for engaging writing
-            system_prompt="You are a veteran Hacker News commenter known for technical depth and skeptical analysis."
+            system_prompt=SYNTHESIS_SYSTEM_PROMPT,
         )
 
         return response.content.strip()
@@ -7,21 +7,133 @@ Can be deployed to Modal, Railway, or any Python hosting platform.
 import asyncio
 import os
 import json
-from typing import Optional
-from dataclasses import asdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 from datetime import datetime
 
+import httpx
 from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from src.orchestrator.main_orchestrator import MainOrchestrator
 from src.models.article import DigestMetadata
+from src.services.job_store import JobStore, create_job_store
+
+# Optional imports with fallbacks
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (several times faster than stdlib json)."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Job tracking: Redis when REDIS_URL is set (required for multiple workers),
+# in-memory otherwise
+job_store: JobStore = create_job_store()
+
+# Fields the orchestrator may report while a job runs
+PROGRESS_FIELDS = (
+    "status",
+    "progress",
+    "current_step",
+    "articles_found",
+    "articles_parsed",
+    "articles_included",
+)
+
+
+class DigestStream:
+    """Markdown chunks of a digest being generated, replayable by any reader."""
+
+    def __init__(self):
+        self.chunks: list[str] = []
+        self.done = False
+        self._changed = asyncio.Event()
+
+    def push(self, chunk: str) -> None:
+        """Append a chunk and wake readers."""
+        self.chunks.append(chunk)
+        self._notify()
+
+    def close(self) -> None:
+        """Mark the stream finished and wake readers."""
+        self.done = True
+        self._notify()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def read(self) -> AsyncIterator[str]:
+        """Yield every chunk from the start, waiting for new ones until closed."""
+        position = 0
+        while True:
+            while position < len(self.chunks):
+                yield self.chunks[position]
+                position += 1
+            if self.done:
+                return
+            await self._changed.wait()
+
+
+# Digests being generated by this worker, for /stream readers
+digest_streams: dict[str, DigestStream] = {}
+
+
+# Webhook client limits; one pooled client is shared by all webhooks
+WEBHOOK_TIMEOUT_SECONDS = 10.0
+WEBHOOK_MAX_KEEPALIVE = 32
+
+# Webhooks are delivered by background workers so slow receivers never hold
+# up digest jobs; 5xx and connection errors are retried with backoff
+WEBHOOK_WORKERS = 4
+WEBHOOK_RETRIES = 3
+WEBHOOK_BACKOFF_SECONDS = 1.0
+
+# On shutdown, wait this long for queued webhooks to go out
+WEBHOOK_DRAIN_SECONDS = 30.0
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared webhook client and delivery workers; drain on shutdown."""
+    app.state.http = httpx.AsyncClient(
+        timeout=WEBHOOK_TIMEOUT_SECONDS,
+        limits=httpx.Limits(max_keepalive_connections=WEBHOOK_MAX_KEEPALIVE),
+    )
+    app.state.webhooks = asyncio.Queue()
+    workers = [
+        asyncio.create_task(webhook_worker(app.state.webhooks, app.state.http))
+        for _ in range(WEBHOOK_WORKERS)
+    ]
+    yield
+    try:
+        await asyncio.wait_for(app.state.webhooks.join(), WEBHOOK_DRAIN_SECONDS)
+    except TimeoutError:
+        print(f"Shutting down with {app.state.webhooks.qsize()} webhooks undelivered")
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    await app.state.http.aclose()
+    await job_store.close()
+
 
 app = FastAPI(
     title="The Daily Clearing - Core API",
     description="AI-powered news digest generation service",
     version="1.0.0",
+    default_response_class=FastJSONResponse if HAS_ORJSON else JSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS for worker access
@@ -33,10 +145,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory job tracking (use Redis/DB in production)
-active_jobs: dict = {}
-
-
 class DigestRequest(BaseModel):
     """Request to generate a digest."""
 
@@ -88,11 +196,8 @@ async def generate_digest(request: DigestRequest, background_tasks: BackgroundTa
     This runs in the background and returns immediately.
     Poll /api/digest/{job_id}/progress for updates.
     """
-    if request.job_id in active_jobs:
-        raise HTTPException(status_code=409, detail="Job already exists")
-
     # Initialize job tracking
-    active_jobs[request.job_id] = {
+    created = await job_store.create(request.job_id, {
         "status": "pending",
         "progress": 0,
         "current_step": "Initializing...",
@@ -101,7 +206,9 @@ async def generate_digest(request: DigestRequest, background_tasks: BackgroundTa
         "articles_included": 0,
         "error": None,
         "result": None,
-    }
+    })
+    if not created:
+        raise HTTPException(status_code=409, detail="Job already exists")
 
     # Start generation in background
     background_tasks.add_task(
@@ -122,30 +229,28 @@ async def generate_digest(request: DigestRequest, background_tasks: BackgroundTa
 @app.get("/api/digest/{job_id}/progress")
 async def get_progress(job_id: str) -> DigestProgress:
     """Get progress of digest generation."""
-    if job_id not in active_jobs:
+    job = await job_store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = active_jobs[job_id]
-    return DigestProgress(
-        job_id=job_id,
-        status=job["status"],
-        progress=job["progress"],
-        current_step=job["current_step"],
-        articles_found=job["articles_found"],
-        articles_parsed=job["articles_parsed"],
-        articles_included=job["articles_included"],
-        error=job["error"],
-    )
+    # Polled frequently and the data is our own; serialize directly instead
+    # of building and validating a DigestProgress per request (the model
+    # still documents the response)
+    response_class = FastJSONResponse if HAS_ORJSON else JSONResponse
+    return response_class(content={
+        "job_id": job_id,
+        **{key: job.get(key) for key in PROGRESS_FIELDS},
+        "error": job.get("error"),
+    })
 
 
 @app.get("/api/digest/{job_id}/result")
 async def get_result(job_id: str) -> DigestResult:
     """Get result of completed digest generation."""
-    if job_id not in active_jobs:
+    job = await job_store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = active_jobs[job_id]
-
     if job["status"] not in ("complete", "failed"):
         raise HTTPException(status_code=400, detail="Job not yet complete")
 
@@ -156,21 +261,61 @@ async def get_result(job_id: str) -> DigestResult:
             error=job["error"],
         )
 
-    result = job.get("result", {})
+    result = job.get("result") or {}
+
+    # Digests carry large markdown; serialize directly, skipping model
+    # validation and jsonable_encoder (orjson handles the metadata
+    # dataclass and its datetimes natively)
+    if HAS_ORJSON:
+        return FastJSONResponse(content={
+            "job_id": job_id,
+            "success": True,
+            "digest_id": result.get("digest_id"),
+            "markdown": result.get("markdown"),
+            "metadata": result.get("metadata"),
+            "error": None,
+        })
+
     return DigestResult(
         job_id=job_id,
         success=True,
         digest_id=result.get("digest_id"),
         markdown=result.get("markdown"),
-        metadata=result.get("metadata"),
+        metadata=jsonable_encoder(result.get("metadata")),
     )
 
 
+@app.get("/api/digest/{job_id}/stream")
+async def stream_digest(job_id: str):
+    """
+    Stream digest markdown as it is generated.
+
+    The header arrives as soon as synthesis starts and topic sections
+    follow as they complete. Completed jobs stream their stored digest.
+    """
+    stream = digest_streams.get(job_id)
+    if stream is not None:
+        return StreamingResponse(stream.read(), media_type="text/markdown")
+
+    job = await job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if job["status"] == "complete":
+        markdown = (job.get("result") or {}).get("markdown") or ""
+        return StreamingResponse(iter([markdown]), media_type="text/markdown")
+
+    if job["status"] == "failed":
+        raise HTTPException(status_code=400, detail="Job failed")
+
+    # Running on another worker; only its result is shared
+    raise HTTPException(status_code=409, detail="Job running on another worker")
+
+
 @app.delete("/api/digest/{job_id}")
 async def cancel_job(job_id: str):
     """Cancel and remove a job."""
-    if job_id in active_jobs:
-        del active_jobs[job_id]
+    if await job_store.delete(job_id):
         return {"success": True, "message": "Job cancelled"}
     return {"success": False, "message": "Job not found"}
 
@@ -182,95 +327,139 @@ async def run_digest_generation(
     webhook_url: Optional[str] = None,
 ):
     """Background task to run digest generation."""
+    stream = digest_streams[job_id] = DigestStream()
     try:
         # Update status
-        active_jobs[job_id]["status"] = "searching"
-        active_jobs[job_id]["progress"] = 5
-        active_jobs[job_id]["current_step"] = "Searching for articles..."
+        await job_store.update(job_id, {
+            "status": "searching",
+            "progress": 5,
+            "current_step": "Searching for articles...",
+        })
 
         # Create orchestrator with progress callbacks
         orchestrator = MainOrchestratorWithProgress(
             preferences,
             progress_callback=lambda p: update_job_progress(job_id, p),
+            chunk_callback=stream.push,
         )
 
         # Generate digest
         digest_path, digest_content, metadata = await orchestrator.generate_digest_with_content()
+        stream.close()
 
         # Mark complete
-        active_jobs[job_id]["status"] = "complete"
-        active_jobs[job_id]["progress"] = 100
-        active_jobs[job_id]["current_step"] = "Complete!"
-        active_jobs[job_id]["result"] = {
-            "digest_id": metadata.digest_id if metadata else datetime.now().strftime("%Y-%m-%d"),
-            "markdown": digest_content,
-            "metadata": asdict(metadata) if metadata else None,
+        final = {
+            "status": "complete",
+            "progress": 100,
+            "current_step": "Complete!",
+            "result": {
+                "digest_id": metadata.digest_id if metadata else datetime.now().strftime("%Y-%m-%d"),
+                "markdown": digest_content,
+                # Kept as the dataclass; encoded once when the result is
+                # serialized, without an intermediate asdict() copy
+                "metadata": metadata,
+            },
         }
+        await job_store.update(job_id, final)
 
         # Webhook callback if configured
         if webhook_url:
-            await send_webhook(webhook_url, job_id, active_jobs[job_id])
+            app.state.webhooks.put_nowait((webhook_url, job_id, final))
 
     except Exception as e:
-        active_jobs[job_id]["status"] = "failed"
-        active_jobs[job_id]["error"] = str(e)
-        active_jobs[job_id]["progress"] = 0
-        active_jobs[job_id]["current_step"] = f"Failed: {e}"
+        final = {
+            "status": "failed",
+            "error": str(e),
+            "progress": 0,
+            "current_step": f"Failed: {e}",
+        }
+        await job_store.update(job_id, final)
 
         if webhook_url:
-            await send_webhook(webhook_url, job_id, active_jobs[job_id])
+            app.state.webhooks.put_nowait((webhook_url, job_id, final))
 
+    finally:
+        # Later readers get the stored result
+        stream.close()
+        digest_streams.pop(job_id, None)
 
-def update_job_progress(job_id: str, progress: dict):
+
+async def update_job_progress(job_id: str, progress: dict):
     """Update job progress from orchestrator callback."""
-    if job_id not in active_jobs:
-        return
-
-    if "status" in progress:
-        active_jobs[job_id]["status"] = progress["status"]
-    if "progress" in progress:
-        active_jobs[job_id]["progress"] = progress["progress"]
-    if "current_step" in progress:
-        active_jobs[job_id]["current_step"] = progress["current_step"]
-    if "articles_found" in progress:
-        active_jobs[job_id]["articles_found"] = progress["articles_found"]
-    if "articles_parsed" in progress:
-        active_jobs[job_id]["articles_parsed"] = progress["articles_parsed"]
-    if "articles_included" in progress:
-        active_jobs[job_id]["articles_included"] = progress["articles_included"]
-
-
-async def send_webhook(url: str, job_id: str, job_data: dict):
-    """Send webhook notification."""
-    import httpx
+    fields = {key: progress[key] for key in PROGRESS_FIELDS if key in progress}
+    if fields:
+        await job_store.update(job_id, fields)
 
-    try:
-        async with httpx.AsyncClient() as client:
-            await client.post(
-                url,
-                json={
-                    "job_id": job_id,
-                    "status": job_data["status"],
-                    "result": job_data.get("result"),
-                    "error": job_data.get("error"),
-                },
-                timeout=10.0,
-            )
-    except Exception as e:
-        print(f"Webhook failed: {e}")
+
+async def webhook_worker(queue: asyncio.Queue, client: httpx.AsyncClient):
+    """Deliver queued (url, job_id, job_data) webhooks until cancelled."""
+    while True:
+        url, job_id, job_data = await queue.get()
+        try:
+            await send_webhook(client, url, job_id, job_data)
+        finally:
+            queue.task_done()
+
+
+async def send_webhook(
+    client: httpx.AsyncClient,
+    url: str,
+    job_id: str,
+    job_data: dict,
+) -> bool:
+    """
+    Send webhook notification over the shared connection pool.
+
+    Server errors and connection failures are retried with exponential
+    backoff; webhooks that still fail are logged and dropped.
+
+    Returns:
+        True if the receiver accepted the webhook
+    """
+    payload = {
+        "job_id": job_id,
+        "status": job_data["status"],
+        "result": job_data.get("result"),
+        "error": job_data.get("error"),
+    }
+    if HAS_ORJSON:
+        request = {
+            "content": orjson.dumps(payload),
+            "headers": {"Content-Type": "application/json"},
+        }
+    else:
+        request = {"json": jsonable_encoder(payload)}
+
+    for attempt in range(WEBHOOK_RETRIES + 1):
+        if attempt:
+            await asyncio.sleep(WEBHOOK_BACKOFF_SECONDS * 2 ** (attempt - 1))
+        try:
+            response = await client.post(url, **request)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            continue
+        if response.is_success:
+            return True
+        error = f"HTTP {response.status_code}"
+        if response.status_code < 500:
+            break  # Rejected by the receiver; retrying won't help
+
+    print(f"Webhook for job {job_id} to {url} failed after {attempt + 1} attempts: {error}")
+    return False
 
 
 class MainOrchestratorWithProgress(MainOrchestrator):
     """Extended orchestrator with progress callbacks."""
 
-    def __init__(self, user_preferences: dict, progress_callback=None):
+    def __init__(self, user_preferences: dict, progress_callback=None, chunk_callback=None):
         super().__init__(user_preferences)
         self.progress_callback = progress_callback
+        self.chunk_callback = chunk_callback
 
-    def _update_progress(self, progress: dict):
-        """Call progress callback if set."""
+    async def _update_progress(self, progress: dict):
+        """Await progress callback if set."""
         if self.progress_callback:
-            self.progress_callback(progress)
+            await self.progress_callback(progress)
 
     async def generate_digest_with_content(self):
         """Generate digest and return content along with path."""
@@ -283,7 +472,7 @@ class MainOrchestratorWithProgress(MainOrchestrator):
         self.start_time = time.time()
 
         # Step 1: Search
-        self._update_progress({
+        await self._update_progress({
             "status": "searching",
             "progress": 10,
             "current_step": "Searching for articles...",
@@ -291,12 +480,12 @@ class MainOrchestratorWithProgress(MainOrchestrator):
         articles_by_topic = await self._search_all_topics()
 
         total_found = sum(len(a) for a in articles_by_topic.values())
-        self._update_progress({
+        await self._update_progress({
             "articles_found": total_found,
         })
 
         # Step 2: Parse
-        self._update_progress({
+        await self._update_progress({
             "status": "parsing",
             "progress": 30,
             "current_step": "Parsing articles...",
@@ -304,32 +493,37 @@ class MainOrchestratorWithProgress(MainOrchestrator):
         parsed_articles_by_topic = await self._parse_all_articles(articles_by_topic)
 
         total_parsed = sum(len(a) for a in parsed_articles_by_topic.values())
-        self._update_progress({
+        await self._update_progress({
             "articles_parsed": total_parsed,
             "progress": 55,
         })
 
         # Step 3: Synthesize
-        self._update_progress({
+        await self._update_progress({
             "status": "synthesizing",
             "progress": 70,
             "current_step": "Synthesizing digest...",
         })
 
         metadata = self._create_metadata(parsed_articles_by_topic)
-        digest_content = await self.synthesis_agent.create_digest(
+        chunks = []
+        async for chunk in self.synthesis_agent.stream_digest(
             parsed_articles_by_topic,
             self.preferences,
             metadata,
-        )
+        ):
+            chunks.append(chunk)
+            if self.chunk_callback:
+                self.chunk_callback(chunk)
+        digest_content = "".join(chunks)
 
-        self._update_progress({
+        await self._update_progress({
             "articles_included": metadata.total_articles_included,
             "progress": 90,
         })
 
         # Step 4: Save
-        self._update_progress({
+        await self._update_progress({
             "status": "saving",
             "progress": 95,
             "current_step": "Saving digest...",
@@ -18,6 +18,8 @@ Usage:
     digests = await db.get_user_digests(user_id)
 """
 
+from typing import Any
+
 from .base import (
     DatabaseInterface,
     DatabaseType,
@@ -25,9 +27,22 @@ from .base import (
     NotFoundError,
     DuplicateError,
 )
-from .sqlite import SQLiteDatabase
 from .factory import get_database, create_sqlite_database
 
+# The SQLite implementation pulls in aiosqlite; load it on first use so a
+# D1-only process never pays for it (PEP 562)
+_LAZY_SQLITE = frozenset({"SQLiteDatabase", "SQLitePool"})
+
+
+def __getattr__(name: str) -> Any:
+    """Import the SQLite classes the first time they're accessed."""
+    if name in _LAZY_SQLITE:
+        from . import sqlite
+
+        return getattr(sqlite, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Base
     "DatabaseInterface",
@@ -37,6 +52,7 @@ __all__ = [
     "DuplicateError",
     # Implementations
     "SQLiteDatabase",
+    "SQLitePool",
     # Factory
     "get_database",
     "create_sqlite_database",
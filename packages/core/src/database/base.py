@@ -1,10 +1,11 @@
 """Base database interface and common types."""
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+import hashlib
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Protocol, runtime_checkable
 
 
 class DatabaseType(Enum):
@@ -35,13 +36,29 @@ class DuplicateError(DatabaseError):
     pass
 
 
-class ConnectionError(DatabaseError):
-    """Database connection error."""
+def _to_epoch_ms(value: datetime) -> int:
+    """Format a datetime for storage as integer Unix milliseconds."""
+    return round(value.timestamp() * 1000)
 
-    pass
+
+def _from_epoch_ms(value: int) -> datetime:
+    """Parse a stored Unix-millisecond timestamp."""
+    return datetime.fromtimestamp(value / 1000)
+
+
+def _opt_epoch_ms(value: datetime | None) -> int | None:
+    """Format an optional datetime for storage."""
+    return _to_epoch_ms(value) if value else None
 
 
-@dataclass
+def _opt_from_epoch_ms(value: Any) -> datetime | None:
+    """Parse an optional stored timestamp (None if missing or malformed)."""
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    return _from_epoch_ms(value)
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
 class User:
     """User account."""
 
@@ -52,6 +69,29 @@ class User:
     preferences_json: str = "{}"
     last_digest_at: datetime | None = None
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "User":
+        """Create from a users row (columns in table order)."""
+        return cls(
+            id=row[0],
+            email=row[1],
+            created_at=_from_epoch_ms(row[2]),
+            subscription_tier=row[3],
+            preferences_json=row[4],
+            last_digest_at=_opt_from_epoch_ms(row[5]),
+        )
+
+    def to_row(self) -> tuple:
+        """Column values in users table order."""
+        return (
+            self.id,
+            self.email,
+            _to_epoch_ms(self.created_at),
+            self.subscription_tier,
+            self.preferences_json,
+            _opt_epoch_ms(self.last_digest_at),
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -63,7 +103,7 @@ class User:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class DigestRecord:
     """Stored digest record."""
 
@@ -79,6 +119,39 @@ class DigestRecord:
     topics_json: str = "[]"
     cost_usd: float = 0.0
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "DigestRecord":
+        """Create from a digests row (columns in table order)."""
+        return cls(
+            id=row[0],
+            user_id=row[1],
+            generated_at=_from_epoch_ms(row[2]),
+            period_start=_from_epoch_ms(row[3]),
+            period_end=_from_epoch_ms(row[4]),
+            frequency=row[5],
+            r2_key=row[6],
+            markdown=row[7] or "",
+            article_count=row[8],
+            topics_json=row[9],
+            cost_usd=row[10],
+        )
+
+    def to_row(self) -> tuple:
+        """Column values in digests table order."""
+        return (
+            self.id,
+            self.user_id,
+            _to_epoch_ms(self.generated_at),
+            _to_epoch_ms(self.period_start),
+            _to_epoch_ms(self.period_end),
+            self.frequency,
+            self.r2_key,
+            self.markdown,
+            self.article_count,
+            self.topics_json,
+            self.cost_usd,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -94,7 +167,7 @@ class DigestRecord:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ArticleRecord:
     """Stored article record."""
 
@@ -102,7 +175,7 @@ class ArticleRecord:
     url: str
     title: str
     source: str
-    content_hash: str
+    content_hash: bytes  # sha256 digest, see hash_content()
     first_seen_at: datetime
     topic: str | None = None
     author: str | None = None
@@ -112,6 +185,48 @@ class ArticleRecord:
     relevance_score: float | None = None
     bias_score: float | None = None
 
+    @staticmethod
+    def hash_content(content: str) -> bytes:
+        """Digest article content for content_hash (raw sha256 bytes)."""
+        return hashlib.sha256(content.encode()).digest()
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "ArticleRecord":
+        """Create from an articles row (columns in table order)."""
+        return cls(
+            id=row[0],
+            url=row[1],
+            title=row[2],
+            source=row[3],
+            content_hash=row[4],
+            first_seen_at=_from_epoch_ms(row[5]),
+            topic=row[6],
+            author=row[7],
+            published_date=_opt_from_epoch_ms(row[8]),
+            word_count=row[9],
+            quality_score=row[10],
+            relevance_score=row[11],
+            bias_score=row[12],
+        )
+
+    def to_row(self) -> tuple:
+        """Column values in articles table order."""
+        return (
+            self.id,
+            self.url,
+            self.title,
+            self.source,
+            self.content_hash,
+            _to_epoch_ms(self.first_seen_at),
+            self.topic,
+            self.author,
+            _opt_epoch_ms(self.published_date),
+            self.word_count,
+            self.quality_score,
+            self.relevance_score,
+            self.bias_score,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -119,7 +234,7 @@ class ArticleRecord:
             "url": self.url,
             "title": self.title,
             "source": self.source,
-            "content_hash": self.content_hash,
+            "content_hash": self.content_hash.hex(),
             "first_seen_at": self.first_seen_at.isoformat(),
             "topic": self.topic,
             "author": self.author,
@@ -131,7 +246,7 @@ class ArticleRecord:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class FeedbackRecord:
     """User feedback on articles/digests."""
 
@@ -144,6 +259,33 @@ class FeedbackRecord:
     rating: int | None = None  # 1-5 star rating
     comment: str | None = None
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "FeedbackRecord":
+        """Create from a feedback row (columns in table order)."""
+        return cls(
+            id=row[0],
+            user_id=row[1],
+            digest_id=row[2],
+            article_url=row[3],
+            feedback_type=row[4],
+            created_at=_from_epoch_ms(row[5]),
+            rating=row[6],
+            comment=row[7],
+        )
+
+    def to_row(self) -> tuple:
+        """Column values in feedback table order."""
+        return (
+            self.id,
+            self.user_id,
+            self.digest_id,
+            self.article_url,
+            self.feedback_type,
+            _to_epoch_ms(self.created_at),
+            self.rating,
+            self.comment,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -158,7 +300,7 @@ class FeedbackRecord:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class UsageRecord:
     """Monthly usage tracking."""
 
@@ -172,6 +314,35 @@ class UsageRecord:
     search_count: int = 0
     articles_analyzed: int = 0
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "UsageRecord":
+        """Create from a usage row (columns in table order)."""
+        return cls(
+            id=row[0],
+            user_id=row[1],
+            month=row[2],
+            input_tokens=row[3],
+            output_tokens=row[4],
+            cost_usd=row[5],
+            digest_count=row[6],
+            search_count=row[7],
+            articles_analyzed=row[8],
+        )
+
+    def to_row(self) -> tuple:
+        """Column values in usage table order."""
+        return (
+            self.id,
+            self.user_id,
+            self.month,
+            self.input_tokens,
+            self.output_tokens,
+            self.cost_usd,
+            self.digest_count,
+            self.search_count,
+            self.articles_analyzed,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -187,93 +358,108 @@ class UsageRecord:
         }
 
 
-class DatabaseInterface(ABC):
-    """Abstract base class for database implementations."""
+@runtime_checkable
+class DatabaseInterface(Protocol):
+    """
+    Structural interface for database implementations.
+
+    Implementations don't inherit from this; any class with these methods
+    is a database. get_database() checks conformance once at creation.
+    """
 
-    @abstractmethod
     async def initialize(self) -> None:
         """Initialize database schema."""
-        pass
+        ...
 
-    @abstractmethod
     async def close(self) -> None:
         """Close database connection."""
-        pass
+        ...
 
     # User operations
-    @abstractmethod
     async def create_user(self, user: User) -> User:
         """Create a new user."""
-        pass
+        ...
 
-    @abstractmethod
     async def get_user(self, user_id: str) -> User | None:
         """Get user by ID."""
-        pass
+        ...
 
-    @abstractmethod
     async def get_user_by_email(self, email: str) -> User | None:
         """Get user by email."""
-        pass
+        ...
 
-    @abstractmethod
     async def update_user(self, user: User) -> User:
         """Update user data."""
-        pass
+        ...
 
-    @abstractmethod
     async def delete_user(self, user_id: str) -> bool:
         """Delete user and all associated data."""
-        pass
+        ...
 
     # Digest operations
-    @abstractmethod
     async def save_digest(self, digest: DigestRecord) -> DigestRecord:
         """Save a digest record."""
-        pass
+        ...
+
+    async def save_digests(self, digests: list[DigestRecord]) -> list[DigestRecord]:
+        """Save digest records in a single transaction."""
+        ...
 
-    @abstractmethod
     async def get_digest(self, digest_id: str) -> DigestRecord | None:
         """Get digest by ID."""
-        pass
+        ...
 
-    @abstractmethod
     async def get_user_digests(
         self,
         user_id: str,
         limit: int = 10,
-        offset: int = 0,
+        before: datetime | None = None,
+        before_id: str | None = None,
+        include_markdown: bool = True,
     ) -> list[DigestRecord]:
-        """Get user's digests, ordered by date descending."""
-        pass
+        """Get user's digests, newest first, keyset-paged by ``before``.
+
+        ``include_markdown=False`` leaves bodies out (``markdown=""``).
+        """
+        ...
 
-    @abstractmethod
     async def get_latest_digest(self, user_id: str) -> DigestRecord | None:
         """Get user's most recent digest."""
-        pass
+        ...
 
-    @abstractmethod
     async def delete_old_digests(self, user_id: str, keep_days: int = 30) -> int:
         """Delete digests older than keep_days. Returns count deleted."""
-        pass
+        ...
 
     # Article operations
-    @abstractmethod
     async def save_article(self, article: ArticleRecord) -> ArticleRecord:
         """Save an article record. Updates if URL exists."""
-        pass
+        ...
+
+    async def save_articles(self, articles: list[ArticleRecord]) -> list[ArticleRecord]:
+        """Save article records in a single transaction. Updates existing URLs."""
+        ...
 
-    @abstractmethod
     async def get_article(self, article_id: str) -> ArticleRecord | None:
         """Get article by ID."""
-        pass
+        ...
 
-    @abstractmethod
     async def get_article_by_url(self, url: str) -> ArticleRecord | None:
         """Get article by URL."""
-        pass
+        ...
+
+    async def get_articles_by_urls(self, urls: list[str]) -> dict[str, ArticleRecord]:
+        """Get stored articles for many URLs at once (URL -> article; unknown URLs omitted)."""
+        ...
+
+    async def get_article_by_content_hash(self, content_hash: bytes) -> ArticleRecord | None:
+        """Get an article by content digest (for deduplication)."""
+        ...
+
+    async def articles_existing_hashes(self, hashes: list[bytes]) -> set[bytes]:
+        """Return the subset of content digests already stored (bulk dedup)."""
+        ...
 
-    @abstractmethod
     async def search_articles(
         self,
         query: str | None = None,
@@ -283,42 +469,60 @@ class DatabaseInterface(ABC):
         limit: int = 50,
     ) -> list[ArticleRecord]:
         """Search articles with filters."""
-        pass
+        ...
 
-    @abstractmethod
     async def get_recent_articles(
         self,
         hours: int = 24,
         limit: int = 100,
     ) -> list[ArticleRecord]:
         """Get recently seen articles."""
-        pass
+        ...
+
+    def iter_search_articles(
+        self,
+        query: str | None = None,
+        topic: str | None = None,
+        source: str | None = None,
+        min_quality: float | None = None,
+        limit: int = 50,
+    ) -> AsyncIterator[ArticleRecord]:
+        """Stream search_articles results without building a list."""
+        ...
+
+    def iter_recent_articles(
+        self,
+        hours: int = 24,
+        limit: int = 100,
+    ) -> AsyncIterator[ArticleRecord]:
+        """Stream get_recent_articles results without building a list."""
+        ...
 
     # Feedback operations
-    @abstractmethod
     async def save_feedback(self, feedback: FeedbackRecord) -> FeedbackRecord:
         """Save user feedback."""
-        pass
+        ...
+
+    async def save_feedbacks(self, feedbacks: list[FeedbackRecord]) -> list[FeedbackRecord]:
+        """Save user feedback records in a single transaction."""
+        ...
 
-    @abstractmethod
     async def get_user_feedback(
         self,
         user_id: str,
         limit: int = 100,
     ) -> list[FeedbackRecord]:
         """Get user's feedback history."""
-        pass
+        ...
 
-    @abstractmethod
     async def get_article_feedback(
         self,
         article_url: str,
     ) -> list[FeedbackRecord]:
         """Get all feedback for an article."""
-        pass
+        ...
 
     # Usage tracking
-    @abstractmethod
     async def record_usage(
         self,
         user_id: str,
@@ -330,34 +534,30 @@ class DatabaseInterface(ABC):
         articles: int = 0,
     ) -> UsageRecord:
         """Record usage for current month."""
-        pass
+        ...
 
-    @abstractmethod
     async def get_usage(self, user_id: str, month: str) -> UsageRecord | None:
         """Get usage for a specific month."""
-        pass
+        ...
 
-    @abstractmethod
     async def get_usage_history(
         self,
         user_id: str,
         months: int = 6,
     ) -> list[UsageRecord]:
         """Get usage history for past N months."""
-        pass
+        ...
 
     # Statistics
-    @abstractmethod
     async def get_stats(self) -> dict[str, Any]:
         """Get database statistics."""
-        pass
+        ...
 
     # Context manager
     async def __aenter__(self):
-        """Async context manager entry."""
-        await self.initialize()
-        return self
+        """Async context manager entry (initializes)."""
+        ...
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.close()
+        """Async context manager exit (closes)."""
+        ...
@@ -1,9 +1,22 @@
 """Database factory for creating database instances."""
 
-from typing import Any
+import sqlite3
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from .base import DatabaseInterface, DatabaseType
-from .sqlite import SQLiteDatabase
+
+if TYPE_CHECKING:
+    from .sqlite import SQLiteDatabase
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the re-exported apply_schema without loading aiosqlite early."""
+    if name == "apply_schema":
+        from .sqlite import apply_schema
+
+        return apply_schema
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def get_database(
@@ -22,9 +35,10 @@ async def get_database(
 
     Raises:
         ValueError: If database type is not supported
+        TypeError: If the implementation doesn't satisfy DatabaseInterface
     """
     if db_type == DatabaseType.SQLITE:
-        db = create_sqlite_database(**kwargs)
+        db = _checked(create_sqlite_database(**kwargs))
         await db.initialize()
         return db
 
@@ -37,8 +51,12 @@ async def get_database(
         )
 
     elif db_type == DatabaseType.MEMORY:
-        # In-memory SQLite for testing
-        db = SQLiteDatabase(db_path=":memory:")
+        from .sqlite import SQLiteDatabase
+
+        # In-memory SQLite for testing. Each database is private to its
+        # writer connection and reads go through it, so MEMORY can't
+        # exercise the read pool; use a file database for that
+        db = _checked(SQLiteDatabase(db_path=":memory:"))
         await db.initialize()
         return db
 
@@ -46,21 +64,32 @@ async def get_database(
         raise ValueError(f"Unsupported database type: {db_type}")
 
 
+def _checked(db: Any) -> DatabaseInterface:
+    """Check once, at creation, that a database implements the interface."""
+    if not isinstance(db, DatabaseInterface):
+        raise TypeError(f"{type(db).__name__} does not implement DatabaseInterface")
+    return db
+
+
 def create_sqlite_database(
     path: str = "data/clearing.db",
     **kwargs: Any,
-) -> SQLiteDatabase:
+) -> "SQLiteDatabase":
     """
     Create a SQLite database instance.
 
     Args:
         path: Path to database file
-        **kwargs: Additional arguments (ignored)
+        **kwargs: Connection tuning passed to SQLiteDatabase (journal_mode,
+            synchronous, cache_size_kb, temp_store, mmap_size,
+            busy_timeout_ms, pool_readers)
 
     Returns:
         SQLiteDatabase instance (not initialized)
     """
-    return SQLiteDatabase(db_path=path)
+    from .sqlite import SQLiteDatabase
+
+    return SQLiteDatabase(db_path=path, **kwargs)
 
 
 # SQL Schema for D1 (Cloudflare)
@@ -72,19 +101,19 @@ D1_SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS users (
     id TEXT PRIMARY KEY,
     email TEXT UNIQUE NOT NULL,
-    created_at TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
     subscription_tier TEXT DEFAULT 'free',
     preferences_json TEXT DEFAULT '{}',
-    last_digest_at TEXT
+    last_digest_at INTEGER
 );
 
 -- Digests
 CREATE TABLE IF NOT EXISTS digests (
     id TEXT PRIMARY KEY,
     user_id TEXT NOT NULL,
-    generated_at TEXT NOT NULL,
-    period_start TEXT NOT NULL,
-    period_end TEXT NOT NULL,
+    generated_at INTEGER NOT NULL,
+    period_start INTEGER NOT NULL,
+    period_end INTEGER NOT NULL,
     frequency TEXT NOT NULL,
     r2_key TEXT,
     markdown TEXT,
@@ -100,11 +129,11 @@ CREATE TABLE IF NOT EXISTS articles (
     url TEXT UNIQUE NOT NULL,
     title TEXT NOT NULL,
     source TEXT NOT NULL,
-    content_hash TEXT NOT NULL,
-    first_seen_at TEXT NOT NULL,
+    content_hash BLOB NOT NULL,
+    first_seen_at INTEGER NOT NULL,
     topic TEXT,
     author TEXT,
-    published_date TEXT,
+    published_date INTEGER,
     word_count INTEGER DEFAULT 0,
     quality_score REAL,
     relevance_score REAL,
@@ -118,7 +147,7 @@ CREATE TABLE IF NOT EXISTS feedback (
     digest_id TEXT NOT NULL,
     article_url TEXT,
     feedback_type TEXT NOT NULL,
-    created_at TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
     rating INTEGER,
     comment TEXT,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
@@ -140,17 +169,89 @@ CREATE TABLE IF NOT EXISTS usage (
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
 );
 
+-- Superseded by the composite indexes below
+DROP INDEX IF EXISTS idx_digests_user;
+DROP INDEX IF EXISTS idx_articles_source;
+DROP INDEX IF EXISTS idx_articles_topic;
+DROP INDEX IF EXISTS idx_articles_first_seen;
+DROP INDEX IF EXISTS idx_articles_topic_source_quality;
+-- Redundant with the UNIQUE constraint's own index on url
+DROP INDEX IF EXISTS idx_articles_url;
+
 -- Indexes (D1 compatible)
-CREATE INDEX IF NOT EXISTS idx_digests_user ON digests(user_id, generated_at);
-CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url);
-CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
-CREATE INDEX IF NOT EXISTS idx_articles_topic ON articles(topic);
-CREATE INDEX IF NOT EXISTS idx_articles_first_seen ON articles(first_seen_at);
+CREATE INDEX IF NOT EXISTS idx_digests_user_page ON digests(user_id, generated_at, id);
+CREATE INDEX IF NOT EXISTS idx_articles_content_hash ON articles(content_hash);
+CREATE INDEX IF NOT EXISTS idx_articles_topic_seen ON articles(topic, first_seen_at DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_first_seen_desc ON articles(first_seen_at DESC, id);
 CREATE INDEX IF NOT EXISTS idx_feedback_user ON feedback(user_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_feedback_article ON feedback(article_url, created_at);
 CREATE INDEX IF NOT EXISTS idx_usage_user_month ON usage(user_id, month);
+
+-- Full-text index over article titles, sources and authors (kept in sync by triggers).
+-- articles has a TEXT key, and its implicit rowids may change on VACUUM, so
+-- index rows are keyed by a stable integer docid from articles_search.
+CREATE TABLE IF NOT EXISTS articles_search (
+    docid INTEGER PRIMARY KEY,
+    article_id TEXT UNIQUE NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title,
+    source,
+    author,
+    tokenize='porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_search(article_id) VALUES (new.id);
+    INSERT INTO articles_fts(rowid, title, source, author)
+    VALUES (
+        (SELECT docid FROM articles_search WHERE article_id = new.id),
+        new.title, new.source, new.author
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+    DELETE FROM articles_fts
+    WHERE rowid = (SELECT docid FROM articles_search WHERE article_id = old.id);
+    DELETE FROM articles_search WHERE article_id = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS articles_fts_update
+AFTER UPDATE OF id, title, source, author ON articles BEGIN
+    UPDATE articles_search SET article_id = new.id WHERE article_id = old.id;
+    UPDATE articles_fts SET title = new.title, source = new.source, author = new.author
+    WHERE rowid = (SELECT docid FROM articles_search WHERE article_id = new.id);
+END;
 """
 
 
 def get_d1_schema() -> str:
     """Get the D1 schema SQL for migrations."""
     return D1_SCHEMA_SQL
+
+
+@lru_cache(maxsize=1)
+def get_d1_statements() -> tuple[str, ...]:
+    """
+    Get the D1 schema as individual statements (split once, then cached).
+
+    D1 migrations can prepare these and run them in one batch instead of
+    sending the whole script to be split on the Worker side.
+
+    Returns:
+        Complete SQL statements in schema order
+    """
+    return tuple(_split_statements(D1_SCHEMA_SQL))
+
+
+def _split_statements(script: str) -> list[str]:
+    """Split a SQL script into complete statements (trigger bodies kept whole)."""
+    statements = []
+    current = ""
+    for line in script.splitlines(keepends=True):
+        current += line
+        if sqlite3.complete_statement(current):
+            statements.append(current.strip())
+            current = ""
+    return statements
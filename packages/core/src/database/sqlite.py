@@ -1,15 +1,21 @@
 """SQLite database implementation for local development and self-hosted deployments."""
 
+import asyncio
 import json
+import re
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import aclosing, asynccontextmanager
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import aiosqlite
 
 from .base import (
-    DatabaseInterface,
     DatabaseError,
     NotFoundError,
     DuplicateError,
@@ -18,28 +24,30 @@ from .base import (
     ArticleRecord,
     FeedbackRecord,
     UsageRecord,
+    _opt_epoch_ms,
+    _to_epoch_ms,
 )
 
 
-# SQL Schema
+# SQL Schema (timestamps are INTEGER Unix milliseconds)
 SCHEMA_SQL = """
 -- Users
 CREATE TABLE IF NOT EXISTS users (
     id TEXT PRIMARY KEY,
     email TEXT UNIQUE NOT NULL,
-    created_at TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
     subscription_tier TEXT DEFAULT 'free',
     preferences_json TEXT DEFAULT '{}',
-    last_digest_at TEXT
+    last_digest_at INTEGER
 );
 
 -- Digests
 CREATE TABLE IF NOT EXISTS digests (
     id TEXT PRIMARY KEY,
     user_id TEXT NOT NULL,
-    generated_at TEXT NOT NULL,
-    period_start TEXT NOT NULL,
-    period_end TEXT NOT NULL,
+    generated_at INTEGER NOT NULL,
+    period_start INTEGER NOT NULL,
+    period_end INTEGER NOT NULL,
     frequency TEXT NOT NULL,
     r2_key TEXT,
     markdown TEXT,
@@ -55,11 +63,11 @@ CREATE TABLE IF NOT EXISTS articles (
     url TEXT UNIQUE NOT NULL,
     title TEXT NOT NULL,
     source TEXT NOT NULL,
-    content_hash TEXT NOT NULL,
-    first_seen_at TEXT NOT NULL,
+    content_hash BLOB NOT NULL,
+    first_seen_at INTEGER NOT NULL,
     topic TEXT,
     author TEXT,
-    published_date TEXT,
+    published_date INTEGER,
     word_count INTEGER DEFAULT 0,
     quality_score REAL,
     relevance_score REAL,
@@ -73,7 +81,7 @@ CREATE TABLE IF NOT EXISTS feedback (
     digest_id TEXT NOT NULL,
     article_url TEXT,
     feedback_type TEXT NOT NULL,
-    created_at TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
     rating INTEGER,
     comment TEXT,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
@@ -95,254 +103,1046 @@ CREATE TABLE IF NOT EXISTS usage (
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
 );
 
+-- Superseded by the composite indexes below
+DROP INDEX IF EXISTS idx_digests_user;
+DROP INDEX IF EXISTS idx_articles_source;
+DROP INDEX IF EXISTS idx_articles_topic;
+DROP INDEX IF EXISTS idx_articles_first_seen;
+DROP INDEX IF EXISTS idx_articles_topic_source_quality;
+-- Redundant with the UNIQUE constraint's own index on url
+DROP INDEX IF EXISTS idx_articles_url;
+
 -- Indexes
-CREATE INDEX IF NOT EXISTS idx_digests_user ON digests(user_id, generated_at DESC);
-CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url);
-CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
-CREATE INDEX IF NOT EXISTS idx_articles_topic ON articles(topic);
-CREATE INDEX IF NOT EXISTS idx_articles_first_seen ON articles(first_seen_at DESC);
+CREATE INDEX IF NOT EXISTS idx_digests_user_page ON digests(user_id, generated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_content_hash ON articles(content_hash);
+CREATE INDEX IF NOT EXISTS idx_articles_topic_seen ON articles(topic, first_seen_at DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_first_seen_desc ON articles(first_seen_at DESC, id);
 CREATE INDEX IF NOT EXISTS idx_feedback_user ON feedback(user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_feedback_article ON feedback(article_url, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_usage_user_month ON usage(user_id, month);
 """
 
 
-class SQLiteDatabase(DatabaseInterface):
+# Full-text index over article titles, sources and authors (kept in sync by
+# triggers). Applied only when SQLite has FTS5; searches fall back to LIKE.
+# articles has a TEXT key, and its implicit rowids may change on VACUUM, so
+# index rows are keyed by a stable integer docid from articles_search.
+SEARCH_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS articles_search (
+    docid INTEGER PRIMARY KEY,
+    article_id TEXT UNIQUE NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title,
+    source,
+    author,
+    tokenize='porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_search(article_id) VALUES (new.id);
+    INSERT INTO articles_fts(rowid, title, source, author)
+    VALUES (
+        (SELECT docid FROM articles_search WHERE article_id = new.id),
+        new.title, new.source, new.author
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+    DELETE FROM articles_fts
+    WHERE rowid = (SELECT docid FROM articles_search WHERE article_id = old.id);
+    DELETE FROM articles_search WHERE article_id = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS articles_fts_update
+AFTER UPDATE OF id, title, source, author ON articles BEGIN
+    UPDATE articles_search SET article_id = new.id WHERE article_id = old.id;
+    UPDATE articles_fts SET title = new.title, source = new.source, author = new.author
+    WHERE rowid = (SELECT docid FROM articles_search WHERE article_id = new.id);
+END;
+"""
+
+# Removes a search index built with different columns, so it can be rebuilt
+DROP_SEARCH_SQL = """
+DROP TRIGGER IF EXISTS articles_fts_insert;
+DROP TRIGGER IF EXISTS articles_fts_delete;
+DROP TRIGGER IF EXISTS articles_fts_update;
+DROP TABLE IF EXISTS articles_fts;
+DROP TABLE IF EXISTS articles_search;
+"""
+
+
+INSERT_DIGEST_SQL = """
+INSERT OR REPLACE INTO digests
+(id, user_id, generated_at, period_start, period_end, frequency, r2_key, markdown, article_count, topics_json, cost_usd)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Upsert rather than REPLACE: REPLACE deletes the old row without firing
+# delete triggers (unless recursive_triggers is on), orphaning its search entry
+INSERT_ARTICLE_SQL = """
+INSERT INTO articles
+(id, url, title, source, content_hash, first_seen_at, topic, author, published_date, word_count, quality_score, relevance_score, bias_score)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    url = excluded.url,
+    title = excluded.title,
+    source = excluded.source,
+    content_hash = excluded.content_hash,
+    first_seen_at = excluded.first_seen_at,
+    topic = excluded.topic,
+    author = excluded.author,
+    published_date = excluded.published_date,
+    word_count = excluded.word_count,
+    quality_score = excluded.quality_score,
+    relevance_score = excluded.relevance_score,
+    bias_score = excluded.bias_score
+ON CONFLICT(url) DO UPDATE SET
+    id = excluded.id,
+    title = excluded.title,
+    source = excluded.source,
+    content_hash = excluded.content_hash,
+    first_seen_at = excluded.first_seen_at,
+    topic = excluded.topic,
+    author = excluded.author,
+    published_date = excluded.published_date,
+    word_count = excluded.word_count,
+    quality_score = excluded.quality_score,
+    relevance_score = excluded.relevance_score,
+    bias_score = excluded.bias_score
+"""
+
+INSERT_FEEDBACK_SQL = """
+INSERT INTO feedback
+(id, user_id, digest_id, article_url, feedback_type, created_at, rating, comment)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+USER_DIGESTS_SQL = """
+SELECT * FROM digests
+WHERE user_id = ?
+ORDER BY generated_at DESC, id DESC
+LIMIT ?
+"""
+
+USER_DIGESTS_BEFORE_SQL = """
+SELECT * FROM digests
+WHERE user_id = ? AND (generated_at, id) < (?, ?)
+ORDER BY generated_at DESC, id DESC
+LIMIT ?
+"""
+
+# Digest columns in table order with the markdown body left out, for listings
+DIGEST_LISTING_COLUMNS = (
+    "id, user_id, generated_at, period_start, period_end, frequency, r2_key, "
+    "'' AS markdown, article_count, topics_json, cost_usd"
+)
+USER_DIGEST_LISTING_SQL = USER_DIGESTS_SQL.replace("*", DIGEST_LISTING_COLUMNS, 1)
+USER_DIGEST_LISTING_BEFORE_SQL = USER_DIGESTS_BEFORE_SQL.replace("*", DIGEST_LISTING_COLUMNS, 1)
+
+STATS_SQL = """
+SELECT
+    (SELECT COUNT(*) FROM users) AS total_users,
+    (SELECT COUNT(*) FROM digests) AS total_digests,
+    (SELECT COUNT(*) FROM articles) AS total_articles,
+    (SELECT COUNT(*) FROM feedback) AS total_feedback,
+    (SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size())
+        AS database_size_bytes
+"""
+
+# get_user / get_user_by_email, by lookup column
+USER_LOOKUP_SQL = {
+    "id": "SELECT * FROM users WHERE id = ?",
+    "email": "SELECT * FROM users WHERE email = ?",
+}
+
+RECORD_USAGE_SQL = """
+INSERT INTO usage
+(id, user_id, month, input_tokens, output_tokens, cost_usd,
+ digest_count, search_count, articles_analyzed)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(user_id, month) DO UPDATE SET
+    input_tokens = input_tokens + excluded.input_tokens,
+    output_tokens = output_tokens + excluded.output_tokens,
+    cost_usd = cost_usd + excluded.cost_usd,
+    digest_count = digest_count + excluded.digest_count,
+    search_count = search_count + excluded.search_count,
+    articles_analyzed = articles_analyzed + excluded.articles_analyzed
+RETURNING *
+"""
+
+
+BACKFILL_SEARCH_SQL = """
+INSERT INTO articles_search(article_id) SELECT id FROM articles;
+INSERT INTO articles_fts(rowid, title, source, author)
+SELECT articles_search.docid, articles.title, articles.source, articles.author
+FROM articles JOIN articles_search ON articles_search.article_id = articles.id;
+"""
+
+
+# Timestamp columns per table; the first one identifies the column type
+TIMESTAMP_COLUMNS = {
+    "users": ("created_at", "last_digest_at"),
+    "digests": ("generated_at", "period_start", "period_end"),
+    "articles": ("first_seen_at", "published_date"),
+    "feedback": ("created_at",),
+}
+
+# Hash columns stored as raw digest bytes
+BLOB_COLUMNS = {
+    "articles": ("content_hash",),
+}
+
+
+def _table_sql(table: str) -> str:
+    """Get a table's CREATE TABLE statement from SCHEMA_SQL."""
+    match = re.search(rf"CREATE TABLE IF NOT EXISTS {table} \(.*?\n\);", SCHEMA_SQL, re.S)
+    assert match is not None, table
+    return match.group(0)
+
+
+def _iso_to_epoch_ms(value: Any) -> Any:
+    """Convert a legacy ISO-8601 TEXT timestamp to Unix milliseconds."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return _to_epoch_ms(datetime.fromisoformat(value))
+    except ValueError:
+        return None
+
+
+def _hex_to_bytes(value: Any) -> Any:
+    """Convert a legacy TEXT hash (hex digest if possible) to bytes."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        return value.encode()
+
+
+# Prepared statements kept per connection (sqlite3's LRU statement cache).
+# Comfortably above the number of distinct statements this module issues, so
+# hot writes like INSERT_ARTICLE_SQL are parsed once per connection
+STATEMENT_CACHE_SIZE = 256
+
+# URLs (or content hashes) per IN (...) lookup; below SQLite's default 999
+# bound parameters
+URL_BATCH_SIZE = 500
+
+# Single-row writes queued together are committed as one batch; a batch
+# stops growing at this many writes or once this long has passed
+MAX_WRITE_BATCH = 500
+WRITE_FLUSH_SECONDS = 0.05
+
+# Writer transactions between periodic PRAGMA optimize runs (also run on
+# close); keeps planner statistics current in long-running processes
+OPTIMIZE_EVERY_WRITES = 1000
+
+# Users looked up by id or email are kept decoded in process for this long
+USER_CACHE_SIZE = 1024
+USER_CACHE_SECONDS = 60.0
+
+# Read-only connections can't change these (they belong to the writer)
+WRITER_ONLY_PRAGMAS = frozenset({"journal_mode", "synchronous", "foreign_keys"})
+
+
+async def apply_schema(conn: aiosqlite.Connection, script: str) -> None:
+    """
+    Run a schema script in one transaction.
+
+    The script is parsed and executed in a single executescript() call and
+    committed once, rather than statement by statement; on error nothing
+    is applied.
+
+    Args:
+        conn: Connection to apply the script on
+        script: Semicolon-separated SQL statements
+    """
+    try:
+        await conn.executescript(f"BEGIN;\n{script}\nCOMMIT;")
+    except Exception:
+        await conn.rollback()
+        raise
+
+
+def _fts_query(text: str) -> str:
+    """
+    Turn free text into an FTS5 query matching every word as a prefix.
+
+    Each word is quoted, so FTS5 operators and punctuation in user input
+    are searched for literally instead of raising syntax errors.
+
+    Args:
+        text: Search text from the caller
+
+    Returns:
+        FTS5 MATCH expression (empty if the text has no words)
+    """
+    terms = [word.replace('"', '""') for word in text.split()]
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+@lru_cache(maxsize=128)
+def _search_sql(fts: bool, words: int, topic: bool, source: bool, min_quality: bool) -> str:
+    """
+    Build the search_articles statement for a combination of filters.
+
+    Each combination is built once and every later search reuses the
+    identical string (and its cached prepared statement). Parameters bind
+    in the order: text, topic, source, min_quality, limit.
+
+    Args:
+        fts: Match text through the FTS5 index (one MATCH parameter)
+        words: Words in the search text (0 for none); without FTS5 each
+            word binds three LIKE patterns (title, source, author)
+        topic: Filter on topic
+        source: Filter on source
+        min_quality: Filter on minimum quality score
+    """
+    conditions = []
+    if words and fts:
+        conditions.append("articles_fts MATCH ?")
+    elif words:
+        # No FTS5: every word must appear in the title, source or author
+        conditions += [
+            "(articles.title LIKE ? OR articles.source LIKE ? OR articles.author LIKE ?)"
+        ] * words
+    if topic:
+        conditions.append("articles.topic = ?")
+    if source:
+        conditions.append("articles.source LIKE ?")
+    if min_quality:
+        conditions.append("articles.quality_score >= ?")
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+
+    if words and fts:
+        return f"""
+            SELECT articles.* FROM articles_fts
+            JOIN articles_search ON articles_search.docid = articles_fts.rowid
+            JOIN articles ON articles.id = articles_search.article_id
+            WHERE {where_clause}
+            ORDER BY articles_fts.rank
+            LIMIT ?
+        """
+    return f"""
+        SELECT * FROM articles
+        WHERE {where_clause}
+        ORDER BY first_seen_at DESC
+        LIMIT ?
+    """
+
+
+@lru_cache(maxsize=None)
+def _urls_sql(count: int) -> str:
+    """Build (once per batch size) the lookup for ``count`` URLs."""
+    return f"SELECT * FROM articles WHERE url IN ({', '.join('?' * count)})"
+
+
+@lru_cache(maxsize=None)
+def _hashes_sql(count: int) -> str:
+    """Build (once per batch size) the existence check for ``count`` hashes."""
+    return (
+        "SELECT DISTINCT content_hash FROM articles "
+        f"WHERE content_hash IN ({', '.join('?' * count)})"
+    )
+
+
+class SQLitePool:
+    """
+    One writer connection plus a pool of read-only connections.
+
+    Each aiosqlite connection runs its queries on its own thread, so a
+    single connection serializes every query. SQLite allows one writer at
+    a time, but in WAL mode readers proceed alongside it; separate read
+    connections let concurrent reads overlap. Writes take a lock so one
+    coroutine's transaction never interleaves with another's.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        pragmas: dict[str, Any],
+        readers: int = 4,
+        uri: bool = False,
+        optimize_every: int = OPTIMIZE_EVERY_WRITES,
+    ):
+        """
+        Initialize connection pool (connections open lazily).
+
+        Args:
+            db_path: Path to SQLite database file, or a ``file:`` URI
+            pragmas: PRAGMAs applied to every new connection
+            readers: Read-only connections (0 routes reads to the writer,
+                one at a time with writes)
+            uri: Treat ``db_path`` as a ``file:`` URI
+            optimize_every: Run PRAGMA optimize after this many writer
+                checkouts (0 disables)
+        """
+        self.db_path = db_path
+        self.pragmas = pragmas
+        self.uri = uri
+        self.optimize_every = optimize_every
+        self._writes_since_optimize = 0
+        # A plain in-memory database is private to the connection that made it
+        self.readers = 0 if db_path == ":memory:" else readers
+
+        self._writer: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        self._open_writer_lock = asyncio.Lock()
+        self._open_readers_lock = asyncio.Lock()
+        self._read_conns: list[aiosqlite.Connection] = []
+        self._idle: asyncio.Queue[aiosqlite.Connection] | None = None
+
+    async def _connect(
+        self,
+        database: str,
+        pragmas: dict[str, Any],
+        **kwargs: Any,
+    ) -> aiosqlite.Connection:
+        """Open a connection and apply PRAGMAs."""
+        conn = await aiosqlite.connect(
+            database, cached_statements=STATEMENT_CACHE_SIZE, **kwargs
+        )
+        conn.row_factory = aiosqlite.Row
+        for name, value in pragmas.items():
+            await conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+
+    async def writer_connection(self) -> aiosqlite.Connection:
+        """Get the writer connection, opening it if needed (no lock held)."""
+        async with self._open_writer_lock:
+            if self._writer is None:
+                if not self.uri:
+                    # Ensure directory exists
+                    Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+                self._writer = await self._connect(self.db_path, self.pragmas, uri=self.uri)
+        return self._writer
+
+    async def _open_readers(self) -> asyncio.Queue[aiosqlite.Connection]:
+        """Open the read-only connections once."""
+        async with self._open_readers_lock:
+            if self._idle is None:
+                # The writer creates the file (and WAL) that readers attach to
+                await self.writer_connection()
+                pragmas = {
+                    name: value
+                    for name, value in self.pragmas.items()
+                    if name not in WRITER_ONLY_PRAGMAS
+                }
+                if self.uri:
+                    # mode=ro would name a file; keep the URI, refuse writes
+                    uri = self.db_path
+                    pragmas["query_only"] = "ON"
+                else:
+                    uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+                idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+                for _ in range(self.readers):
+                    conn = await self._connect(uri, pragmas, uri=True)
+                    self._read_conns.append(conn)
+                    idle.put_nowait(conn)
+                self._idle = idle
+        return self._idle
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Hold the writer connection exclusively."""
+        conn = await self.writer_connection()
+        async with self._write_lock:
+            yield conn
+            self._writes_since_optimize += 1
+            if self.optimize_every and self._writes_since_optimize >= self.optimize_every:
+                self._writes_since_optimize = 0
+                await conn.execute("PRAGMA optimize")
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Check out a read-only connection.
+
+        Without readers this is the writer connection, held under the write
+        lock: don't write, or yield to code that might, while inside it.
+        """
+        if not self.readers:
+            # Reads share the writer, so wait out any open write transaction
+            # rather than see its uncommitted rows
+            conn = await self.writer_connection()
+            async with self._write_lock:
+                yield conn
+            return
+
+        idle = self._idle or await self._open_readers()
+        conn = await idle.get()
+        try:
+            yield conn
+        finally:
+            idle.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close all connections."""
+        for conn in self._read_conns:
+            await conn.close()
+        self._read_conns.clear()
+        self._idle = None
+
+        if self._writer is not None:
+            await self._writer.close()
+            self._writer = None
+
+
+class WriteBatcher:
+    """
+    Coalesce single-row writes into batched transactions on the writer.
+
+    Callers await submit(); a background task drains whatever writes are
+    queued, runs consecutive writes of the same statement as one
+    executemany(), and commits the whole batch once. A burst of concurrent
+    save_article() calls therefore costs a few transactions instead of one
+    commit (and thread hop) each. Statement order is preserved.
+    """
+
+    def __init__(
+        self,
+        pool: SQLitePool,
+        max_batch: int = MAX_WRITE_BATCH,
+        max_wait: float = WRITE_FLUSH_SECONDS,
+    ):
+        """
+        Initialize batcher (the drain task starts on first submit).
+
+        Args:
+            pool: Pool whose writer connection runs the batches
+            max_batch: Maximum writes per transaction
+            max_wait: Maximum seconds spent gathering one batch
+        """
+        self.pool = pool
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self._queue: asyncio.Queue[tuple[str, tuple, asyncio.Future[None]]] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def submit(self, sql: str, row: tuple) -> None:
+        """
+        Queue one write and wait until it is committed.
+
+        Args:
+            sql: Single-row write statement
+            row: Statement parameters
+
+        Raises:
+            Exception: Whatever the statement raised (other writes in the
+                same batch are unaffected)
+        """
+        if self._task is None or self._task.done():
+            # Queue and task belong to the running loop
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(self._queue))
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        assert self._queue is not None
+        self._queue.put_nowait((sql, row, future))
+        await future
+
+    async def _run(self, queue: asyncio.Queue[tuple[str, tuple, asyncio.Future[None]]]) -> None:
+        """Drain the queue into batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                if queue.empty():
+                    # Let writers scheduled in the same tick enqueue too
+                    await asyncio.sleep(0)
+                    if queue.empty() or loop.time() >= deadline:
+                        break
+                batch.append(queue.get_nowait())
+
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                # Opening the writer, a rollback or PRAGMA optimize failed:
+                # fail whatever wasn't settled and keep draining
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _flush(self, batch: list[tuple[str, tuple, asyncio.Future[None]]]) -> None:
+        """Commit a batch, falling back to one write at a time if it fails."""
+        runs: list[tuple[str, list[tuple]]] = []
+        for sql, row, _ in batch:
+            if runs and runs[-1][0] == sql:
+                runs[-1][1].append(row)
+            else:
+                runs.append((sql, [row]))
+
+        async with self.pool.writer() as db:
+            try:
+                for sql, rows in runs:
+                    await db.executemany(sql, rows)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                # Isolate the failing write so the rest still land
+                for sql, row, future in batch:
+                    try:
+                        await db.execute(sql, row)
+                        await db.commit()
+                    except Exception as e:
+                        await db.rollback()
+                        if not future.done():
+                            future.set_exception(e)
+                    else:
+                        if not future.done():
+                            future.set_result(None)
+                return
+
+            # Settle before leaving writer(), whose PRAGMA optimize may raise
+            self.batches += 1
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+    async def close(self) -> None:
+        """Commit queued writes, then stop the drain task."""
+        if self._task is None or self._queue is None:
+            return
+        if not self._task.done():
+            await self._queue.join()
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+class UserCache:
+    """
+    Small TTL LRU of decoded users, keyed by id and by email.
+
+    get_user() runs on nearly every request to check the subscription tier;
+    a hit skips the reader round-trip and the row decode. Entries expire
+    after ``ttl`` seconds so writes from other processes show up, and this
+    process's own writes invalidate them directly. Users are frozen, so
+    every caller can share the cached instance.
+    """
+
+    def __init__(self, maxsize: int = USER_CACHE_SIZE, ttl: float = USER_CACHE_SECONDS):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum cached lookups (least recently used evicted)
+            ttl: Seconds an entry stays valid (0 disables caching)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], tuple[User, float]] = OrderedDict()
+        # Bumped by every invalidation; a read that started before one
+        # must not store the (possibly stale) row it fetched
+        self.generation = 0
+
+    def get(self, key: tuple[str, str]) -> User | None:
+        """Get a copy of a live entry (key is ("id" | "email", value))."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return user
+
+    def put(self, key: tuple[str, str], user: User, generation: int) -> None:
+        """Store a user fetched while the cache was at ``generation``."""
+        if self.ttl <= 0 or generation != self.generation:
+            return
+        self._entries[key] = (user, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop every entry for a user (under any id or email)."""
+        self.generation += 1
+        for key in [k for k, (user, _) in self._entries.items() if user.id == user_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self.generation += 1
+        self._entries.clear()
+
+
+class SQLiteDatabase:
     """SQLite database implementation using aiosqlite."""
 
-    def __init__(self, db_path: str = "data/clearing.db"):
+    def __init__(
+        self,
+        db_path: str = "data/clearing.db",
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        cache_size_kb: int = 64000,
+        temp_store: str = "MEMORY",
+        mmap_size: int = 268435456,
+        busy_timeout_ms: int = 5000,
+        pool_readers: int = 4,
+        uri: bool = False,
+        user_cache_seconds: float = USER_CACHE_SECONDS,
+    ):
         """
         Initialize SQLite database.
 
+        The defaults suit a single-host app: WAL lets readers run alongside
+        the writer, and synchronous=NORMAL only syncs at checkpoints (safe
+        in WAL mode; a power loss can drop the last commits, not corrupt).
+
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, or a URI if ``uri``
+            journal_mode: Journal mode (WAL, DELETE, ...)
+            synchronous: Sync level (OFF, NORMAL, FULL, EXTRA)
+            cache_size_kb: Page cache size per connection
+            temp_store: Where temporary tables live (DEFAULT, FILE, MEMORY)
+            mmap_size: Bytes of the file to memory-map (0 disables)
+            busy_timeout_ms: How long to wait on a locked database
+            pool_readers: Read-only connections for concurrent reads
+                (ignored for ":memory:")
+            uri: Open ``db_path`` as a ``file:`` URI
+            user_cache_seconds: How long looked-up users stay cached in
+                process (0 disables)
         """
+        for name, value in (
+            ("journal_mode", journal_mode),
+            ("synchronous", synchronous),
+            ("temp_store", temp_store),
+        ):
+            if not value.isalpha():
+                raise ValueError(f"Invalid {name}: {value!r}")
+
         self.db_path = db_path
-        self._db: aiosqlite.Connection | None = None
+        # PRAGMAs are per connection; applied whenever one is opened
+        self.pragmas = {
+            "foreign_keys": "ON",
+            "journal_mode": journal_mode,
+            "synchronous": synchronous,
+            "cache_size": -int(cache_size_kb),  # negative = KiB, not pages
+            "temp_store": temp_store,
+            "mmap_size": int(mmap_size),
+            "busy_timeout": int(busy_timeout_ms),
+        }
+        self._pool = SQLitePool(db_path, self.pragmas, readers=pool_readers, uri=uri)
+        self._writes = WriteBatcher(self._pool)
+        self._users = UserCache(ttl=user_cache_seconds)
+        # Whether SQLite has FTS5 (checked on initialize); LIKE search if not
+        self._fts = True
         self._initialized = False
 
     async def _get_db(self) -> aiosqlite.Connection:
-        """Get database connection, creating if needed."""
-        if self._db is None:
-            # Ensure directory exists
-            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-
-            self._db = await aiosqlite.connect(self.db_path)
-            self._db.row_factory = aiosqlite.Row
-
-            # Enable foreign keys
-            await self._db.execute("PRAGMA foreign_keys = ON")
-
-        return self._db
+        """Get the writer connection, creating if needed."""
+        return await self._pool.writer_connection()
 
     async def initialize(self) -> None:
         """Initialize database schema."""
         if self._initialized:
             return
 
-        db = await self._get_db()
-        await db.executescript(SCHEMA_SQL)
-        await db.commit()
-        self._initialized = True
+        async with self._pool.writer() as db:
+            await self._migrate_column_types(db)
 
-    async def close(self) -> None:
-        """Close database connection."""
-        if self._db:
-            await self._db.close()
-            self._db = None
-            self._initialized = False
-
-    def _parse_datetime(self, value: str | None) -> datetime | None:
-        """Parse ISO datetime string."""
-        if not value:
-            return None
-        try:
-            return datetime.fromisoformat(value)
-        except ValueError:
-            return None
+            cursor = await db.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE name IN ('articles_search', 'idx_articles_topic_seen')"
+            )
+            existing = {row[0] for row in await cursor.fetchall()}
+            await cursor.close()
+            cursor = await db.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+            self._fts = bool((await cursor.fetchone())[0])
+            await cursor.close()
+
+            script = SCHEMA_SQL
+            if self._fts:
+                cursor = await db.execute("PRAGMA table_info(articles_fts)")
+                fts_columns = {row[1] for row in await cursor.fetchall()}
+                await cursor.close()
+                if fts_columns and "author" not in fts_columns:
+                    # Built before authors were indexed; rebuild it
+                    script += DROP_SEARCH_SQL
+                    existing.discard("articles_search")
+                script += SEARCH_SCHEMA_SQL
+                if "articles_search" not in existing:
+                    # Index articles stored before the search index existed
+                    script += BACKFILL_SEARCH_SQL
+            await apply_schema(db, script)
+            if "idx_articles_topic_seen" not in existing:
+                # Planner statistics for the new indexes; kept fresh by PRAGMA optimize on close
+                await db.execute("ANALYZE")
+            await db.commit()
+            self._initialized = True
 
-    # User operations
-    async def create_user(self, user: User) -> User:
-        """Create a new user."""
-        db = await self._get_db()
+    async def _migrate_column_types(self, db: aiosqlite.Connection) -> None:
+        """
+        Rewrite legacy TEXT timestamp and hash columns in their current types.
 
+        One-shot migration for databases created before timestamps were
+        stored as INTEGER milliseconds and hashes as BLOB digests. SQLite
+        can't change a column's type in place, so each affected table is
+        rebuilt and its rows converted; indexes and triggers are recreated
+        by the schema script afterwards.
+
+        Args:
+            db: Writer connection (outside any transaction)
+        """
+        legacy: dict[str, dict[str, Callable[[Any], Any]]] = {}
+        for table in TIMESTAMP_COLUMNS.keys() | BLOB_COLUMNS.keys():
+            cursor = await db.execute(f"PRAGMA table_info({table})")
+            types = {row[1]: row[2] for row in await cursor.fetchall()}
+            await cursor.close()
+
+            converters = {}
+            timestamps = TIMESTAMP_COLUMNS.get(table, ())
+            if timestamps and types.get(timestamps[0]) == "TEXT":
+                converters.update(dict.fromkeys(timestamps, _iso_to_epoch_ms))
+            for column in BLOB_COLUMNS.get(table, ()):
+                if types.get(column) == "TEXT":
+                    converters[column] = _hex_to_bytes
+            if converters:
+                legacy[table] = converters
+
+        if not legacy:
+            return
+
+        # Dropping a parent table must not cascade to the rows being kept
+        await db.execute("PRAGMA foreign_keys = OFF")
         try:
-            await db.execute(
-                """
-                INSERT INTO users (id, email, created_at, subscription_tier, preferences_json, last_digest_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    user.id,
-                    user.email,
-                    user.created_at.isoformat(),
-                    user.subscription_tier,
-                    user.preferences_json,
-                    user.last_digest_at.isoformat() if user.last_digest_at else None,
-                ),
-            )
+            await db.execute("BEGIN")
+            for table, converters in legacy.items():
+                await self._rebuild_table(db, table, converters)
             await db.commit()
-            return user
-        except aiosqlite.IntegrityError as e:
-            if "UNIQUE constraint" in str(e):
-                raise DuplicateError(f"User with email {user.email} already exists")
-            raise DatabaseError(f"Failed to create user: {e}")
+        except Exception:
+            await db.rollback()
+            raise
+        finally:
+            await db.execute("PRAGMA foreign_keys = ON")
 
-    async def get_user(self, user_id: str) -> User | None:
-        """Get user by ID."""
-        db = await self._get_db()
-        cursor = await db.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-        row = await cursor.fetchone()
-        await cursor.close()
+    async def _rebuild_table(
+        self,
+        db: aiosqlite.Connection,
+        table: str,
+        converters: dict[str, Callable[[Any], Any]],
+    ) -> None:
+        """Copy a table into the current schema, converting the given columns."""
+        await db.execute(
+            _table_sql(table).replace(
+                f"CREATE TABLE IF NOT EXISTS {table} (", f"CREATE TABLE {table}_new (", 1
+            )
+        )
 
-        if not row:
-            return None
+        cursor = await db.execute(f"SELECT * FROM {table}")
+        names = [column[0] for column in cursor.description]
+        rows = await cursor.fetchall()
+        await cursor.close()
 
-        return User(
-            id=row["id"],
-            email=row["email"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            subscription_tier=row["subscription_tier"],
-            preferences_json=row["preferences_json"],
-            last_digest_at=self._parse_datetime(row["last_digest_at"]),
+        positions = [(names.index(column), convert) for column, convert in converters.items()]
+        converted = []
+        for row in rows:
+            values = list(row)
+            for i, convert in positions:
+                values[i] = convert(values[i])
+            converted.append(values)
+
+        await db.executemany(
+            f"INSERT INTO {table}_new ({', '.join(names)}) "
+            f"VALUES ({', '.join('?' * len(names))})",
+            converted,
         )
+        await db.execute(f"DROP TABLE {table}")
+        await db.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+
+    async def close(self) -> None:
+        """Close database connections."""
+        await self._writes.close()
+        if self._initialized:
+            async with self._pool.writer() as db:
+                await db.execute("PRAGMA optimize")
+        await self._pool.close()
+        self._users.clear()
+        self._initialized = False
+
+    async def __aenter__(self) -> "SQLiteDatabase":
+        """Async context manager entry."""
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    async def _executemany(self, sql: str, rows: list[tuple]) -> None:
+        """Write many rows in one transaction (all or nothing)."""
+        if not rows:
+            return
+
+        async with self._pool.writer() as db:
+            try:
+                await db.executemany(sql, rows)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+    # User operations
+    async def create_user(self, user: User) -> User:
+        """Create a new user."""
+        async with self._pool.writer() as db:
+            try:
+                await db.execute(
+                    """
+                    INSERT INTO users (id, email, created_at, subscription_tier, preferences_json, last_digest_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    user.to_row(),
+                )
+                await db.commit()
+                return user
+            except aiosqlite.IntegrityError as e:
+                if "UNIQUE constraint" in str(e):
+                    raise DuplicateError(f"User with email {user.email} already exists")
+                raise DatabaseError(f"Failed to create user: {e}")
+
+    async def get_user(self, user_id: str) -> User | None:
+        """Get user by ID (cached briefly, see UserCache)."""
+        return await self._get_cached_user("id", user_id)
 
     async def get_user_by_email(self, email: str) -> User | None:
-        """Get user by email."""
-        db = await self._get_db()
-        cursor = await db.execute("SELECT * FROM users WHERE email = ?", (email,))
-        row = await cursor.fetchone()
-        await cursor.close()
+        """Get user by email (cached briefly, see UserCache)."""
+        return await self._get_cached_user("email", email)
+
+    async def _get_cached_user(self, column: str, value: str) -> User | None:
+        """Look a user up by a unique column, through the user cache."""
+        key = (column, value)
+        user = self._users.get(key)
+        if user is not None:
+            return user
+
+        generation = self._users.generation
+        async with self._pool.reader() as db:
+            cursor = await db.execute(USER_LOOKUP_SQL[column], (value,))
+            row = await cursor.fetchone()
+            await cursor.close()
 
         if not row:
             return None
 
-        return User(
-            id=row["id"],
-            email=row["email"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            subscription_tier=row["subscription_tier"],
-            preferences_json=row["preferences_json"],
-            last_digest_at=self._parse_datetime(row["last_digest_at"]),
-        )
+        user = User.from_row(row)
+        self._users.put(key, user, generation)
+        return user
 
     async def update_user(self, user: User) -> User:
         """Update user data."""
-        db = await self._get_db()
-
-        await db.execute(
-            """
-            UPDATE users
-            SET email = ?, subscription_tier = ?, preferences_json = ?, last_digest_at = ?
-            WHERE id = ?
-            """,
-            (
-                user.email,
-                user.subscription_tier,
-                user.preferences_json,
-                user.last_digest_at.isoformat() if user.last_digest_at else None,
-                user.id,
-            ),
-        )
-        await db.commit()
+        async with self._pool.writer() as db:
+            await db.execute(
+                """
+                UPDATE users
+                SET email = ?, subscription_tier = ?, preferences_json = ?, last_digest_at = ?
+                WHERE id = ?
+                """,
+                (
+                    user.email,
+                    user.subscription_tier,
+                    user.preferences_json,
+                    _opt_epoch_ms(user.last_digest_at),
+                    user.id,
+                ),
+            )
+            await db.commit()
+        # After the commit: a lookup racing the write can't re-cache the old row
+        self._users.invalidate(user.id)
         return user
 
     async def delete_user(self, user_id: str) -> bool:
         """Delete user and all associated data."""
-        db = await self._get_db()
-        cursor = await db.execute("DELETE FROM users WHERE id = ?", (user_id,))
-        await db.commit()
-        deleted = cursor.rowcount > 0
-        await cursor.close()
+        async with self._pool.writer() as db:
+            cursor = await db.execute("DELETE FROM users WHERE id = ?", (user_id,))
+            await db.commit()
+            deleted = cursor.rowcount > 0
+            await cursor.close()
+        self._users.invalidate(user_id)
         return deleted
 
     # Digest operations
     async def save_digest(self, digest: DigestRecord) -> DigestRecord:
-        """Save a digest record."""
-        db = await self._get_db()
-
-        await db.execute(
-            """
-            INSERT OR REPLACE INTO digests
-            (id, user_id, generated_at, period_start, period_end, frequency, r2_key, markdown, article_count, topics_json, cost_usd)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                digest.id,
-                digest.user_id,
-                digest.generated_at.isoformat(),
-                digest.period_start.isoformat(),
-                digest.period_end.isoformat(),
-                digest.frequency,
-                digest.r2_key,
-                digest.markdown,
-                digest.article_count,
-                digest.topics_json,
-                digest.cost_usd,
-            ),
-        )
-        await db.commit()
+        """Save a digest record (batched with concurrent single-row writes)."""
+        await self._writes.submit(INSERT_DIGEST_SQL, digest.to_row())
         return digest
 
+    async def save_digests(self, digests: list[DigestRecord]) -> list[DigestRecord]:
+        """Save digest records in one transaction."""
+        await self._executemany(INSERT_DIGEST_SQL, [d.to_row() for d in digests])
+        return digests
+
     async def get_digest(self, digest_id: str) -> DigestRecord | None:
         """Get digest by ID."""
-        db = await self._get_db()
-        cursor = await db.execute("SELECT * FROM digests WHERE id = ?", (digest_id,))
-        row = await cursor.fetchone()
-        await cursor.close()
+        async with self._pool.reader() as db:
+            cursor = await db.execute("SELECT * FROM digests WHERE id = ?", (digest_id,))
+            row = await cursor.fetchone()
+            await cursor.close()
 
-        if not row:
-            return None
+            if not row:
+                return None
 
-        return DigestRecord(
-            id=row["id"],
-            user_id=row["user_id"],
-            generated_at=datetime.fromisoformat(row["generated_at"]),
-            period_start=datetime.fromisoformat(row["period_start"]),
-            period_end=datetime.fromisoformat(row["period_end"]),
-            frequency=row["frequency"],
-            r2_key=row["r2_key"],
-            markdown=row["markdown"] or "",
-            article_count=row["article_count"],
-            topics_json=row["topics_json"],
-            cost_usd=row["cost_usd"],
-        )
+            return DigestRecord.from_row(row)
 
     async def get_user_digests(
         self,
         user_id: str,
         limit: int = 10,
-        offset: int = 0,
+        before: datetime | None = None,
+        before_id: str | None = None,
+        include_markdown: bool = True,
     ) -> list[DigestRecord]:
-        """Get user's digests, ordered by date descending."""
-        db = await self._get_db()
-        cursor = await db.execute(
-            """
-            SELECT * FROM digests
-            WHERE user_id = ?
-            ORDER BY generated_at DESC
-            LIMIT ? OFFSET ?
-            """,
-            (user_id, limit, offset),
-        )
-        rows = await cursor.fetchall()
-        await cursor.close()
+        """Get user's digests, ordered by date descending.
 
-        return [
-            DigestRecord(
-                id=row["id"],
-                user_id=row["user_id"],
-                generated_at=datetime.fromisoformat(row["generated_at"]),
-                period_start=datetime.fromisoformat(row["period_start"]),
-                period_end=datetime.fromisoformat(row["period_end"]),
-                frequency=row["frequency"],
-                r2_key=row["r2_key"],
-                markdown=row["markdown"] or "",
-                article_count=row["article_count"],
-                topics_json=row["topics_json"],
-                cost_usd=row["cost_usd"],
-            )
-            for row in rows
-        ]
+        Pages are keyset-based: pass the last digest's ``generated_at`` (and
+        ``id``, to break ties) as ``before``/``before_id`` to get the next
+        page. The index seeks straight to the cursor instead of reading and
+        discarding every earlier row as OFFSET would.
+
+        Args:
+            user_id: Owner of the digests
+            limit: Maximum number of digests to return
+            before: Only return digests generated before this time
+            before_id: Also return digests generated exactly at ``before``
+                whose id sorts below this one
+            include_markdown: Load each digest's body; listings that only
+                show metadata pass False and get ``markdown=""`` (use
+                get_digest for the body)
+
+        Returns:
+            Digests, newest first
+        """
+        async with self._pool.reader() as db:
+            if before is None:
+                sql = USER_DIGESTS_SQL if include_markdown else USER_DIGEST_LISTING_SQL
+                cursor = await db.execute(sql, (user_id, limit))
+            else:
+                sql = (
+                    USER_DIGESTS_BEFORE_SQL
+                    if include_markdown
+                    else USER_DIGEST_LISTING_BEFORE_SQL
+                )
+                cursor = await db.execute(
+                    sql, (user_id, _to_epoch_ms(before), before_id or "", limit)
+                )
+            rows = await cursor.fetchall()
+            await cursor.close()
+
+            return [DigestRecord.from_row(row) for row in rows]
 
     async def get_latest_digest(self, user_id: str) -> DigestRecord | None:
         """Get user's most recent digest."""
@@ -351,92 +1151,116 @@ class SQLiteDatabase(DatabaseInterface):
 
     async def delete_old_digests(self, user_id: str, keep_days: int = 30) -> int:
         """Delete digests older than keep_days."""
-        db = await self._get_db()
-        cutoff = (datetime.now() - timedelta(days=keep_days)).isoformat()
-
-        cursor = await db.execute(
-            """
-            DELETE FROM digests
-            WHERE user_id = ? AND generated_at < ?
-            """,
-            (user_id, cutoff),
-        )
-        await db.commit()
-        deleted = cursor.rowcount
-        await cursor.close()
-        return deleted
+        async with self._pool.writer() as db:
+            cutoff = _to_epoch_ms(datetime.now() - timedelta(days=keep_days))
+
+            cursor = await db.execute(
+                """
+                DELETE FROM digests
+                WHERE user_id = ? AND generated_at < ?
+                """,
+                (user_id, cutoff),
+            )
+            await db.commit()
+            deleted = cursor.rowcount
+            await cursor.close()
+            return deleted
 
     # Article operations
     async def save_article(self, article: ArticleRecord) -> ArticleRecord:
-        """Save an article record."""
-        db = await self._get_db()
+        """
+        Save an article record (one upsert; updates the row with the same ID or URL).
 
-        await db.execute(
-            """
-            INSERT OR REPLACE INTO articles
-            (id, url, title, source, content_hash, first_seen_at, topic, author, published_date, word_count, quality_score, relevance_score, bias_score)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                article.id,
-                article.url,
-                article.title,
-                article.source,
-                article.content_hash,
-                article.first_seen_at.isoformat(),
-                article.topic,
-                article.author,
-                article.published_date.isoformat() if article.published_date else None,
-                article.word_count,
-                article.quality_score,
-                article.relevance_score,
-                article.bias_score,
-            ),
-        )
-        await db.commit()
+        Batched with concurrent single-row writes into one transaction.
+        """
+        await self._writes.submit(INSERT_ARTICLE_SQL, article.to_row())
         return article
 
+    async def save_articles(self, articles: list[ArticleRecord]) -> list[ArticleRecord]:
+        """Save article records in one transaction."""
+        await self._executemany(INSERT_ARTICLE_SQL, [a.to_row() for a in articles])
+        return articles
+
     async def get_article(self, article_id: str) -> ArticleRecord | None:
         """Get article by ID."""
-        db = await self._get_db()
-        cursor = await db.execute("SELECT * FROM articles WHERE id = ?", (article_id,))
-        row = await cursor.fetchone()
-        await cursor.close()
+        async with self._pool.reader() as db:
+            cursor = await db.execute("SELECT * FROM articles WHERE id = ?", (article_id,))
+            row = await cursor.fetchone()
+            await cursor.close()
 
-        if not row:
-            return None
+            if not row:
+                return None
 
-        return self._row_to_article(row)
+            return ArticleRecord.from_row(row)
 
     async def get_article_by_url(self, url: str) -> ArticleRecord | None:
         """Get article by URL."""
-        db = await self._get_db()
-        cursor = await db.execute("SELECT * FROM articles WHERE url = ?", (url,))
-        row = await cursor.fetchone()
-        await cursor.close()
+        async with self._pool.reader() as db:
+            cursor = await db.execute("SELECT * FROM articles WHERE url = ?", (url,))
+            row = await cursor.fetchone()
+            await cursor.close()
+
+            if not row:
+                return None
+
+            return ArticleRecord.from_row(row)
+
+    async def get_articles_by_urls(self, urls: list[str]) -> dict[str, ArticleRecord]:
+        """Get stored articles for many URLs, in one query per URL_BATCH_SIZE."""
+        unique = list(dict.fromkeys(urls))
+        found: dict[str, ArticleRecord] = {}
+
+        async with self._pool.reader() as db:
+            for start in range(0, len(unique), URL_BATCH_SIZE):
+                batch = unique[start:start + URL_BATCH_SIZE]
+                cursor = await db.execute(_urls_sql(len(batch)), batch)
+                rows = await cursor.fetchall()
+                await cursor.close()
+
+                for row in rows:
+                    article = ArticleRecord.from_row(row)
+                    found[article.url] = article
+
+        return found
+
+    async def get_article_by_content_hash(self, content_hash: bytes) -> ArticleRecord | None:
+        """Get an article by content digest (for deduplication)."""
+        async with self._pool.reader() as db:
+            cursor = await db.execute(
+                "SELECT * FROM articles WHERE content_hash = ? LIMIT 1", (content_hash,)
+            )
+            row = await cursor.fetchone()
+            await cursor.close()
 
-        if not row:
-            return None
+            if not row:
+                return None
 
-        return self._row_to_article(row)
-
-    def _row_to_article(self, row: aiosqlite.Row) -> ArticleRecord:
-        """Convert database row to ArticleRecord."""
-        return ArticleRecord(
-            id=row["id"],
-            url=row["url"],
-            title=row["title"],
-            source=row["source"],
-            content_hash=row["content_hash"],
-            first_seen_at=datetime.fromisoformat(row["first_seen_at"]),
-            topic=row["topic"],
-            author=row["author"],
-            published_date=self._parse_datetime(row["published_date"]),
-            word_count=row["word_count"],
-            quality_score=row["quality_score"],
-            relevance_score=row["relevance_score"],
-            bias_score=row["bias_score"],
-        )
+            return ArticleRecord.from_row(row)
+
+    async def articles_existing_hashes(self, hashes: list[bytes]) -> set[bytes]:
+        """Return which content digests are already stored.
+
+        Ingestion can dedup a whole fetch with this instead of one
+        get_article_by_content_hash call per article; it runs one
+        index-only query per URL_BATCH_SIZE hashes.
+
+        Args:
+            hashes: Raw sha256 digests, as from ArticleRecord.hash_content
+
+        Returns:
+            The subset of ``hashes`` that some stored article has
+        """
+        unique = list(dict.fromkeys(hashes))
+        existing: set[bytes] = set()
+
+        async with self._pool.reader() as db:
+            for start in range(0, len(unique), URL_BATCH_SIZE):
+                batch = unique[start:start + URL_BATCH_SIZE]
+                cursor = await db.execute(_hashes_sql(len(batch)), batch)
+                existing.update(row[0] for row in await cursor.fetchall())
+                await cursor.close()
+
+        return existing
 
     async def search_articles(
         self,
@@ -446,44 +1270,58 @@ class SQLiteDatabase(DatabaseInterface):
         min_quality: float | None = None,
         limit: int = 50,
     ) -> list[ArticleRecord]:
-        """Search articles with filters."""
-        db = await self._get_db()
+        """Search articles with filters.
 
-        conditions = []
-        params: list[Any] = []
+        ``query`` is matched against titles, sources and authors through the
+        full-text index (word prefixes, best matches first); without it, or
+        on a SQLite build without FTS5 (substring matches), newest first.
+        """
+        return [
+            article
+            async for article in self.iter_search_articles(
+                query, topic, source, min_quality, limit
+            )
+        ]
 
-        if query:
-            conditions.append("(title LIKE ? OR source LIKE ?)")
-            params.extend([f"%{query}%", f"%{query}%"])
+    async def iter_search_articles(
+        self,
+        query: str | None = None,
+        topic: str | None = None,
+        source: str | None = None,
+        min_quality: float | None = None,
+        limit: int = 50,
+    ) -> AsyncIterator[ArticleRecord]:
+        """Stream search_articles results as SQLite fetches them.
 
+        A reader connection stays checked out until the iterator is
+        exhausted or closed, so break out early only inside
+        ``contextlib.aclosing``. A pool without readers fetches every row
+        first instead, so the loop body may write.
+        """
+        words = query.split() if query else []
+        params: list[Any] = []
+        if words and self._fts:
+            params.append(_fts_query(query))
+        else:
+            params += [f"%{word}%" for word in words for _ in range(3)]
+        sql = _search_sql(
+            self._fts,
+            min(len(words), 1) if self._fts else len(words),
+            bool(topic),
+            bool(source),
+            min_quality is not None,
+        )
         if topic:
-            conditions.append("topic = ?")
             params.append(topic)
-
         if source:
-            conditions.append("source LIKE ?")
             params.append(f"%{source}%")
-
         if min_quality is not None:
-            conditions.append("quality_score >= ?")
             params.append(min_quality)
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
         params.append(limit)
 
-        cursor = await db.execute(
-            f"""
-            SELECT * FROM articles
-            WHERE {where_clause}
-            ORDER BY first_seen_at DESC
-            LIMIT ?
-            """,
-            params,
-        )
-        rows = await cursor.fetchall()
-        await cursor.close()
-
-        return [self._row_to_article(row) for row in rows]
+        async with aclosing(self._iter_rows(sql, params)) as rows:
+            async for row in rows:
+                yield ArticleRecord.from_row(row)
 
     async def get_recent_articles(
         self,
@@ -491,104 +1329,90 @@ class SQLiteDatabase(DatabaseInterface):
         limit: int = 100,
     ) -> list[ArticleRecord]:
         """Get recently seen articles."""
-        db = await self._get_db()
-        cutoff = (datetime.now() - timedelta(hours=hours)).isoformat()
+        return [article async for article in self.iter_recent_articles(hours, limit)]
 
-        cursor = await db.execute(
-            """
+    async def iter_recent_articles(
+        self,
+        hours: int = 24,
+        limit: int = 100,
+    ) -> AsyncIterator[ArticleRecord]:
+        """Stream recently seen articles, newest first, as SQLite fetches them.
+
+        Holds a reader connection like iter_search_articles.
+        """
+        cutoff = _to_epoch_ms(datetime.now() - timedelta(hours=hours))
+        sql = """
             SELECT * FROM articles
             WHERE first_seen_at >= ?
             ORDER BY first_seen_at DESC
             LIMIT ?
-            """,
-            (cutoff, limit),
-        )
-        rows = await cursor.fetchall()
-        await cursor.close()
+        """
+        async with aclosing(self._iter_rows(sql, (cutoff, limit))) as rows:
+            async for row in rows:
+                yield ArticleRecord.from_row(row)
+
+    async def _iter_rows(
+        self,
+        sql: str,
+        params: Sequence[Any],
+    ) -> AsyncIterator[aiosqlite.Row]:
+        """Yield a query's rows from a reader connection as SQLite fetches them."""
+        if not self._pool.readers:
+            # Reads on the writer hold the write lock; a caller writing
+            # between rows would wait on it forever, so fetch everything first
+            async with self._pool.reader() as db:
+                rows = await db.execute_fetchall(sql, params)
+            for row in rows:
+                yield row
+            return
 
-        return [self._row_to_article(row) for row in rows]
+        async with self._pool.reader() as db, db.execute(sql, params) as cursor:
+            async for row in cursor:
+                yield row
 
     # Feedback operations
     async def save_feedback(self, feedback: FeedbackRecord) -> FeedbackRecord:
-        """Save user feedback."""
-        db = await self._get_db()
-
-        await db.execute(
-            """
-            INSERT INTO feedback
-            (id, user_id, digest_id, article_url, feedback_type, created_at, rating, comment)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                feedback.id,
-                feedback.user_id,
-                feedback.digest_id,
-                feedback.article_url,
-                feedback.feedback_type,
-                feedback.created_at.isoformat(),
-                feedback.rating,
-                feedback.comment,
-            ),
-        )
-        await db.commit()
+        """Save user feedback (batched with concurrent single-row writes)."""
+        await self._writes.submit(INSERT_FEEDBACK_SQL, feedback.to_row())
         return feedback
 
+    async def save_feedbacks(self, feedbacks: list[FeedbackRecord]) -> list[FeedbackRecord]:
+        """Save feedback records in one transaction."""
+        await self._executemany(INSERT_FEEDBACK_SQL, [f.to_row() for f in feedbacks])
+        return feedbacks
+
     async def get_user_feedback(
         self,
         user_id: str,
         limit: int = 100,
     ) -> list[FeedbackRecord]:
         """Get user's feedback history."""
-        db = await self._get_db()
-        cursor = await db.execute(
-            """
-            SELECT * FROM feedback
-            WHERE user_id = ?
-            ORDER BY created_at DESC
-            LIMIT ?
-            """,
-            (user_id, limit),
-        )
-        rows = await cursor.fetchall()
-        await cursor.close()
-
-        return [
-            FeedbackRecord(
-                id=row["id"],
-                user_id=row["user_id"],
-                digest_id=row["digest_id"],
-                article_url=row["article_url"],
-                feedback_type=row["feedback_type"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                rating=row["rating"],
-                comment=row["comment"],
+        async with self._pool.reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT * FROM feedback
+                WHERE user_id = ?
+                ORDER BY created_at DESC
+                LIMIT ?
+                """,
+                (user_id, limit),
             )
-            for row in rows
-        ]
+            rows = await cursor.fetchall()
+            await cursor.close()
+
+            return [FeedbackRecord.from_row(row) for row in rows]
 
     async def get_article_feedback(self, article_url: str) -> list[FeedbackRecord]:
         """Get all feedback for an article."""
-        db = await self._get_db()
-        cursor = await db.execute(
-            "SELECT * FROM feedback WHERE article_url = ? ORDER BY created_at DESC",
-            (article_url,),
-        )
-        rows = await cursor.fetchall()
-        await cursor.close()
-
-        return [
-            FeedbackRecord(
-                id=row["id"],
-                user_id=row["user_id"],
-                digest_id=row["digest_id"],
-                article_url=row["article_url"],
-                feedback_type=row["feedback_type"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                rating=row["rating"],
-                comment=row["comment"],
+        async with self._pool.reader() as db:
+            cursor = await db.execute(
+                "SELECT * FROM feedback WHERE article_url = ? ORDER BY created_at DESC",
+                (article_url,),
             )
-            for row in rows
-        ]
+            rows = await cursor.fetchall()
+            await cursor.close()
+
+            return [FeedbackRecord.from_row(row) for row in rows]
 
     # Usage tracking
     async def record_usage(
@@ -601,71 +1425,40 @@ class SQLiteDatabase(DatabaseInterface):
         searches: int = 0,
         articles: int = 0,
     ) -> UsageRecord:
-        """Record usage for current month."""
-        db = await self._get_db()
-        month = datetime.now().strftime("%Y-%m")
+        """Record usage for current month.
 
-        # Try to update existing record
-        cursor = await db.execute(
-            """
-            UPDATE usage
-            SET input_tokens = input_tokens + ?,
-                output_tokens = output_tokens + ?,
-                cost_usd = cost_usd + ?,
-                digest_count = digest_count + ?,
-                search_count = search_count + ?,
-                articles_analyzed = articles_analyzed + ?
-            WHERE user_id = ? AND month = ?
-            """,
-            (input_tokens, output_tokens, cost_usd, digests, searches, articles, user_id, month),
-        )
-        await db.commit()
-
-        if cursor.rowcount == 0:
-            # Insert new record
-            usage_id = str(uuid.uuid4())
-            await db.execute(
-                """
-                INSERT INTO usage
-                (id, user_id, month, input_tokens, output_tokens, cost_usd, digest_count, search_count, articles_analyzed)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (usage_id, user_id, month, input_tokens, output_tokens, cost_usd, digests, searches, articles),
-            )
+        A single UPSERT adds the deltas to the month's row (creating it on
+        first use) and returns the updated totals, so concurrent callers
+        never lose an increment and no follow-up read is needed.
+        """
+        month = datetime.now().strftime("%Y-%m")
+        async with self._pool.writer() as db:
+            async with db.execute(
+                RECORD_USAGE_SQL,
+                (str(uuid.uuid4()), user_id, month, input_tokens, output_tokens,
+                 cost_usd, digests, searches, articles),
+            ) as cursor:
+                row = await cursor.fetchone()
             await db.commit()
 
-        await cursor.close()
-
-        # Return current usage
-        usage = await self.get_usage(user_id, month)
-        if not usage:
+        if not row:
             raise DatabaseError("Failed to record usage")
-        return usage
+        return UsageRecord.from_row(row)
 
     async def get_usage(self, user_id: str, month: str) -> UsageRecord | None:
         """Get usage for a specific month."""
-        db = await self._get_db()
-        cursor = await db.execute(
-            "SELECT * FROM usage WHERE user_id = ? AND month = ?",
-            (user_id, month),
-        )
-        row = await cursor.fetchone()
-        await cursor.close()
+        async with self._pool.reader() as db:
+            cursor = await db.execute(
+                "SELECT * FROM usage WHERE user_id = ? AND month = ?",
+                (user_id, month),
+            )
+            row = await cursor.fetchone()
+            await cursor.close()
 
-        if not row:
-            return None
+            if not row:
+                return None
 
-        return UsageRecord(
-            id=row["id"],
-            user_id=row["user_id"],
-            month=row["month"],
-            input_tokens=row["input_tokens"],
-            output_tokens=row["output_tokens"],
-            cost_usd=row["cost_usd"],
-            digest_count=row["digest_count"],
-            search_count=row["search_count"],
-            articles_analyzed=row["articles_analyzed"],
-        )
+            return UsageRecord.from_row(row)
 
     async def get_usage_history(
         self,
@@ -673,69 +1466,25 @@ class SQLiteDatabase(DatabaseInterface):
         months: int = 6,
     ) -> list[UsageRecord]:
         """Get usage history for past N months."""
-        db = await self._get_db()
-        cursor = await db.execute(
-            """
-            SELECT * FROM usage
-            WHERE user_id = ?
-            ORDER BY month DESC
-            LIMIT ?
-            """,
-            (user_id, months),
-        )
-        rows = await cursor.fetchall()
-        await cursor.close()
-
-        return [
-            UsageRecord(
-                id=row["id"],
-                user_id=row["user_id"],
-                month=row["month"],
-                input_tokens=row["input_tokens"],
-                output_tokens=row["output_tokens"],
-                cost_usd=row["cost_usd"],
-                digest_count=row["digest_count"],
-                search_count=row["search_count"],
-                articles_analyzed=row["articles_analyzed"],
+        async with self._pool.reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT * FROM usage
+                WHERE user_id = ?
+                ORDER BY month DESC
+                LIMIT ?
+                """,
+                (user_id, months),
             )
-            for row in rows
-        ]
+            rows = await cursor.fetchall()
+            await cursor.close()
+
+            return [UsageRecord.from_row(row) for row in rows]
 
     # Statistics
     async def get_stats(self) -> dict[str, Any]:
-        """Get database statistics."""
-        db = await self._get_db()
-
-        stats = {}
-
-        # Count users
-        cursor = await db.execute("SELECT COUNT(*) as count FROM users")
-        row = await cursor.fetchone()
-        stats["total_users"] = row["count"] if row else 0
-        await cursor.close()
-
-        # Count digests
-        cursor = await db.execute("SELECT COUNT(*) as count FROM digests")
-        row = await cursor.fetchone()
-        stats["total_digests"] = row["count"] if row else 0
-        await cursor.close()
-
-        # Count articles
-        cursor = await db.execute("SELECT COUNT(*) as count FROM articles")
-        row = await cursor.fetchone()
-        stats["total_articles"] = row["count"] if row else 0
-        await cursor.close()
-
-        # Count feedback
-        cursor = await db.execute("SELECT COUNT(*) as count FROM feedback")
-        row = await cursor.fetchone()
-        stats["total_feedback"] = row["count"] if row else 0
-        await cursor.close()
-
-        # Database size
-        cursor = await db.execute("SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()")
-        row = await cursor.fetchone()
-        stats["database_size_bytes"] = row["size"] if row else 0
-        await cursor.close()
-
-        return stats
+        """Get database statistics (one query, one thread hop)."""
+        async with self._pool.reader() as db:
+            async with db.execute(STATS_SQL) as cursor:
+                row = await cursor.fetchone()
+            return dict(row)
@@ -1,12 +1,16 @@
 """Base class for LLM providers accessed via MCP."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 
+# Shared read-only default, so responses without metadata don't each get a dict
+_NO_METADATA: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class LLMResponse:
     """Standard response from LLM provider."""
     content: str
@@ -15,17 +19,14 @@ class LLMResponse:
     output_tokens: int
     cost_usd: float
     response_time_seconds: float = 0.0
-    metadata: Dict[str, Any] = None
+    metadata: Optional[Mapping[str, Any]] = None
+    total_tokens: int = field(init=False)
 
     def __post_init__(self):
-        """Initialize metadata if None."""
+        """Default metadata and compute total tokens once (the response is immutable)."""
         if self.metadata is None:
-            self.metadata = {}
-
-    @property
-    def total_tokens(self) -> int:
-        """Get total tokens used."""
-        return self.input_tokens + self.output_tokens
+            object.__setattr__(self, "metadata", _NO_METADATA)
+        object.__setattr__(self, "total_tokens", self.input_tokens + self.output_tokens)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -37,7 +38,7 @@ class LLMResponse:
             "total_tokens": self.total_tokens,
             "cost_usd": self.cost_usd,
             "response_time_seconds": self.response_time_seconds,
-            "metadata": self.metadata
+            "metadata": dict(self.metadata)
         }
 
 
@@ -65,6 +66,7 @@ class BaseLLMProvider(ABC):
         max_tokens: int,
         temperature: float = 0.7,
         system_prompt: Optional[str] = None,
+        system_prompt_cacheable: bool = True,
         **kwargs
     ) -> LLMResponse:
         """
@@ -75,6 +77,8 @@ class BaseLLMProvider(ABC):
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0-1)
             system_prompt: Optional system prompt
+            system_prompt_cacheable: Whether the system prompt is static and
+                may be cached by the provider
             **kwargs: Additional provider-specific arguments
 
         Returns:
@@ -6,6 +6,11 @@ from .base_provider import BaseLLMProvider, LLMResponse
 from ..utils.mock_clients import get_anthropic_client, is_mock_key
 
 
+# Prompt cache pricing relative to the base input rate
+CACHE_WRITE_COST_MULTIPLIER = 1.25
+CACHE_READ_COST_MULTIPLIER = 0.1
+
+
 class ClaudeMCPServer(BaseLLMProvider):
     """MCP server for Claude models (Haiku and Sonnet)."""
 
@@ -42,6 +47,7 @@ class ClaudeMCPServer(BaseLLMProvider):
         max_tokens: int,
         temperature: float = 0.7,
         system_prompt: Optional[str] = None,
+        system_prompt_cacheable: bool = True,
         **kwargs
     ) -> LLMResponse:
         """
@@ -52,6 +58,8 @@ class ClaudeMCPServer(BaseLLMProvider):
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0-1)
             system_prompt: Optional system prompt
+            system_prompt_cacheable: Mark the system prompt with a cache
+                breakpoint so repeated calls reuse the cached prefix
             **kwargs: Additional arguments (top_p, etc.)
 
         Returns:
@@ -73,7 +81,10 @@ class ClaudeMCPServer(BaseLLMProvider):
 
         # Add system prompt if provided
         if system_prompt:
-            request_params["system"] = system_prompt
+            system_block = {"type": "text", "text": system_prompt}
+            if system_prompt_cacheable:
+                system_block["cache_control"] = {"type": "ephemeral"}
+            request_params["system"] = [system_block]
 
         # Make API call
         response = self.client.messages.create(**request_params)
@@ -82,7 +93,13 @@ class ClaudeMCPServer(BaseLLMProvider):
         content = response.content[0].text
         input_tokens = response.usage.input_tokens
         output_tokens = response.usage.output_tokens
-        cost = self.get_cost(input_tokens, output_tokens)
+        cache_write_tokens = getattr(response.usage, "cache_creation_input_tokens", 0) or 0
+        cache_read_tokens = getattr(response.usage, "cache_read_input_tokens", 0) or 0
+        cost = self.get_cost(input_tokens, output_tokens) + self.get_cost(
+            cache_write_tokens * CACHE_WRITE_COST_MULTIPLIER
+            + cache_read_tokens * CACHE_READ_COST_MULTIPLIER,
+            0,
+        )
 
         response_time = time.time() - start_time
 
@@ -97,7 +114,9 @@ class ClaudeMCPServer(BaseLLMProvider):
             metadata={
                 "is_mock": self.is_mock,
                 "temperature": temperature,
-                "max_tokens": max_tokens
+                "max_tokens": max_tokens,
+                "cache_write_tokens": cache_write_tokens,
+                "cache_read_tokens": cache_read_tokens,
             }
         )
 
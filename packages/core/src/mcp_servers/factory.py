@@ -4,6 +4,7 @@ This module provides a wrapper around the provider factory to create
 LLM providers using the OpenRouter → Anthropic fallback strategy.
 """
 
+from functools import lru_cache
 from typing import Dict
 from .base_provider import BaseLLMProvider
 from ..providers.factory import get_tier1_provider, get_tier2_provider
@@ -49,16 +50,19 @@ def create_mcp_servers() -> Dict[str, BaseLLMProvider]:
         Dictionary mapping server names to MCP server instances
     """
     return {
-        "tier1": get_tier1_provider(),
-        "tier2": get_tier2_provider(),
+        "tier1": get_tier1_server(),
+        "tier2": get_tier2_server(),
     }
 
 
+@lru_cache(maxsize=1)
 def get_tier1_server() -> BaseLLMProvider:
     """
     Get Tier 1 provider (fast/cheap inference for simple tasks).
 
     Uses OpenRouter DeepSeek by default, falls back to Claude Haiku if unavailable.
+    Built once and shared by every Tier 1 agent, so they reuse one HTTP
+    client; get_tier1_server.cache_clear() forces a new one.
 
     Returns:
         BaseLLMProvider for Tier 1 agents
@@ -66,11 +70,13 @@ def get_tier1_server() -> BaseLLMProvider:
     return get_tier1_provider()
 
 
+@lru_cache(maxsize=1)
 def get_tier2_server() -> BaseLLMProvider:
     """
     Get Tier 2 provider (smart/capable inference for complex reasoning).
 
     Uses OpenRouter DeepSeek by default, falls back to Claude Sonnet if unavailable.
+    Built once and shared like get_tier1_server().
 
     Returns:
         BaseLLMProvider for Tier 2 agents
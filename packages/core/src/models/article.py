@@ -3,9 +3,59 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any
+from urllib.parse import urlparse
 import hashlib
 
+# Optional imports with fallbacks
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+
+def _short_hash(text: str) -> str:
+    """
+    12-hex-character fingerprint of text, for deduplication.
+
+    Uses xxh3 when xxhash is installed (the speedups extra), which is far
+    cheaper than MD5 on long article bodies; otherwise falls back to
+    truncated MD5. Values therefore depend on the environment: compare
+    them within a run, don't persist them as identifiers.
+    """
+    if HAS_XXHASH:
+        return xxhash.xxh3_64_hexdigest(text.encode())[:12]
+    return hashlib.md5(text.encode()).hexdigest()[:12]
+
+
+def _isoformat(
+    value: datetime,
+    memo: tuple[datetime, str] | None,
+) -> tuple[datetime, str]:
+    """(value, value.isoformat()), reusing memo if it was rendered from this datetime."""
+    if memo is None or memo[0] is not value:
+        memo = (value, value.isoformat())
+    return memo
+
+
+# Weights of QualityAnalysis.combined_score (sum to 1)
+RELEVANCE_WEIGHT = 0.3
+QUALITY_WEIGHT = 0.25
+NOVELTY_WEIGHT = 0.2
+DEPTH_WEIGHT = 0.15
+CREDIBILITY_WEIGHT = 0.1
+
+
+@lru_cache(maxsize=4096)
+def _url_domain(url: str) -> str | None:
+    """Domain of a URL without "www." (cached per URL), or None if unparsable."""
+    try:
+        return urlparse(url).netloc.replace("www.", "")
+    except Exception:
+        return None
+
 
 class ArticleFormat(Enum):
     """Article content format types."""
@@ -53,7 +103,7 @@ class ContentType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ArticleURL:
     """
     Article URL with metadata from search results.
@@ -71,21 +121,46 @@ class ArticleURL:
     search_rank: int = 0
     discovered_at: datetime = field(default_factory=datetime.now)
 
+    # (url, hash) memo for url_hash; recomputed only if url is reassigned
+    _url_hash: tuple[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (timestamp, ISO string) memos; re-rendered only if the field is reassigned
+    _published_iso: tuple[datetime, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _discovered_iso: tuple[datetime, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def url_hash(self) -> str:
-        """Generate a unique hash for this URL."""
-        return hashlib.md5(self.url.encode()).hexdigest()[:12]
+        """Generate a unique hash for this URL (computed once per URL)."""
+        cached = self._url_hash
+        if cached is None or cached[0] is not self.url:
+            cached = (self.url, _short_hash(self.url))
+            self._url_hash = cached
+        return cached[1]
+
+    @property
+    def published_iso(self) -> str | None:
+        """ISO string of published_date, or None (rendered once per timestamp)."""
+        if self.published_date is None:
+            return None
+        self._published_iso = memo = _isoformat(self.published_date, self._published_iso)
+        return memo[1]
+
+    @property
+    def discovered_iso(self) -> str:
+        """ISO string of discovered_at (rendered once per timestamp)."""
+        self._discovered_iso = memo = _isoformat(self.discovered_at, self._discovered_iso)
+        return memo[1]
 
     @property
     def domain(self) -> str:
         """Extract domain from URL."""
-        from urllib.parse import urlparse
-
-        try:
-            parsed = urlparse(self.url)
-            return parsed.netloc.replace("www.", "")
-        except Exception:
-            return self.source
+        domain = _url_domain(self.url)
+        return self.source if domain is None else domain
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -95,16 +170,16 @@ class ArticleURL:
             "source": self.source,
             "domain": self.domain,
             "snippet": self.snippet,
-            "published_date": self.published_date.isoformat() if self.published_date else None,
+            "published_date": self.published_iso,
             "initial_relevance_score": self.initial_relevance_score,
             "topic": self.topic,
             "search_rank": self.search_rank,
-            "discovered_at": self.discovered_at.isoformat(),
+            "discovered_at": self.discovered_iso,
             "url_hash": self.url_hash,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedArticle:
     """
     Parsed article with full content and metadata.
@@ -139,6 +214,18 @@ class ParsedArticle:
     parse_quality: float = 0.0  # 0-1 score of parse quality
     extraction_method: str = ""
 
+    # (content, hash) memo for content_hash; recomputed only if content is reassigned
+    _content_hash: tuple[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (timestamp, ISO string) memos; re-rendered only if the field is reassigned
+    _published_iso: tuple[datetime, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _extracted_iso: tuple[datetime, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Calculate derived fields after initialization."""
         if self.word_count == 0 and self.content:
@@ -160,36 +247,65 @@ class ParsedArticle:
 
     @property
     def content_hash(self) -> str:
-        """Generate hash of content for deduplication."""
-        return hashlib.md5(self.content.encode()).hexdigest()[:12]
+        """Generate hash of content for deduplication (computed once per content)."""
+        cached = self._content_hash
+        if cached is None or cached[0] is not self.content:
+            cached = (self.content, _short_hash(self.content))
+            self._content_hash = cached
+        return cached[1]
+
+    @property
+    def published_iso(self) -> str | None:
+        """ISO string of published_date, or None (rendered once per timestamp)."""
+        if self.published_date is None:
+            return None
+        self._published_iso = memo = _isoformat(self.published_date, self._published_iso)
+        return memo[1]
+
+    @property
+    def extracted_iso(self) -> str:
+        """ISO string of extracted_at (rendered once per timestamp)."""
+        self._extracted_iso = memo = _isoformat(self.extracted_at, self._extracted_iso)
+        return memo[1]
 
     @property
     def domain(self) -> str:
         """Extract domain from URL."""
-        from urllib.parse import urlparse
+        domain = _url_domain(self.url)
+        return self.source if domain is None else domain
+
+    def to_dict(
+        self,
+        *,
+        include_content: bool = True,
+        content_limit: int | None = 500,
+    ) -> dict[str, Any]:
+        """
+        Convert to dictionary.
+
+        Args:
+            include_content: Include the article body (None when False)
+            content_limit: Truncate the body past this many characters
+                (None for the full body)
+        """
+        content = self.content if include_content else None
+        if content is not None and content_limit is not None and len(content) > content_limit:
+            content = content[:content_limit] + "..."
 
-        try:
-            parsed = urlparse(self.url)
-            return parsed.netloc.replace("www.", "")
-        except Exception:
-            return self.source
-
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
         return {
             "article_id": self.article_id,
             "url": self.url,
             "title": self.title,
-            "content": self.content[:500] + "..." if len(self.content) > 500 else self.content,
+            "content": content,
             "author": self.author,
             "authors": self.authors,
-            "published_date": self.published_date.isoformat() if self.published_date else None,
+            "published_date": self.published_iso,
             "source": self.source,
             "domain": self.domain,
             "word_count": self.word_count,
             "reading_time_minutes": self.reading_time_minutes,
             "format": self.format.value,
-            "extracted_at": self.extracted_at.isoformat(),
+            "extracted_at": self.extracted_iso,
             "meta_description": self.meta_description,
             "meta_keywords": self.meta_keywords,
             "images": self.images[:3],
@@ -201,7 +317,7 @@ class ParsedArticle:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityAnalysis:
     """Quality analysis results for an article."""
 
@@ -229,19 +345,12 @@ class QualityAnalysis:
     @property
     def combined_score(self) -> float:
         """Weighted combined score."""
-        weights = {
-            "relevance": 0.3,
-            "quality": 0.25,
-            "novelty": 0.2,
-            "depth": 0.15,
-            "credibility": 0.1,
-        }
         return (
-            self.relevance_score * weights["relevance"]
-            + self.quality_score * weights["quality"]
-            + self.novelty_score * weights["novelty"]
-            + self.depth_score * weights["depth"]
-            + self.credibility_score * weights["credibility"]
+            self.relevance_score * RELEVANCE_WEIGHT
+            + self.quality_score * QUALITY_WEIGHT
+            + self.novelty_score * NOVELTY_WEIGHT
+            + self.depth_score * DEPTH_WEIGHT
+            + self.credibility_score * CREDIBILITY_WEIGHT
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -263,7 +372,7 @@ class QualityAnalysis:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BiasAnalysis:
     """Bias analysis results for an article."""
 
@@ -335,7 +444,7 @@ class BiasAnalysis:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossConnection:
     """Connection between articles for cross-story analysis."""
 
@@ -354,7 +463,7 @@ class CrossConnection:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyzedArticle:
     """
     Article with complete analysis results.
@@ -378,6 +487,17 @@ class AnalyzedArticle:
     analysis_cost_usd: float = 0.0
     analysis_tokens: int = 0
 
+    # (timestamp, ISO string) memo; re-rendered only if analyzed_at is reassigned
+    _analyzed_iso: tuple[datetime, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def analyzed_iso(self) -> str:
+        """ISO string of analyzed_at (rendered once per timestamp)."""
+        self._analyzed_iso = memo = _isoformat(self.analyzed_at, self._analyzed_iso)
+        return memo[1]
+
     @property
     def combined_score(self) -> float:
         """Get overall article score."""
@@ -392,9 +512,13 @@ class AnalyzedArticle:
     @property
     def should_include(self) -> bool:
         """Check if article should be included in digest."""
+        return self._should_include(self.combined_score)
+
+    def _should_include(self, combined_score: float) -> bool:
+        """should_include, given this article's already computed combined_score."""
         return (
             self.quality_analysis.should_include
-            and self.combined_score >= 0.4
+            and combined_score >= 0.4
             and not self.bias_analysis.is_highly_biased
         )
 
@@ -424,24 +548,30 @@ class AnalyzedArticle:
         """Legacy: get why it matters."""
         return self.quality_analysis.why_matters
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
+    def to_dict(self, *, include_content: bool = True) -> dict[str, Any]:
+        """
+        Convert to dictionary.
+
+        Args:
+            include_content: Include the (truncated) article body
+        """
+        combined_score = self.combined_score
         return {
-            "parsed_article": self.parsed_article.to_dict(),
+            "parsed_article": self.parsed_article.to_dict(include_content=include_content),
             "quality_analysis": self.quality_analysis.to_dict(),
             "bias_analysis": self.bias_analysis.to_dict(),
             "hn_style_summary": self.hn_style_summary,
             "technical_insights": self.technical_insights,
             "connections": [c.to_dict() for c in self.connections],
-            "combined_score": self.combined_score,
-            "should_include": self.should_include,
-            "analyzed_at": self.analyzed_at.isoformat(),
+            "combined_score": combined_score,
+            "should_include": self._should_include(combined_score),
+            "analyzed_at": self.analyzed_iso,
             "analysis_cost_usd": self.analysis_cost_usd,
             "analysis_tokens": self.analysis_tokens,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DigestSection:
     """A section of the digest covering one topic."""
 
@@ -460,7 +590,7 @@ class DigestSection:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DigestMetadata:
     """Metadata for a complete digest."""
 
@@ -523,7 +653,7 @@ class DigestMetadata:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Digest:
     """Complete digest with all sections and metadata."""
 
@@ -538,13 +668,23 @@ class Digest:
         """Total number of articles in digest."""
         return sum(len(section.articles) for section in self.sections)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
+    def to_dict(self, *, markdown_limit: int | None = 1000) -> dict[str, Any]:
+        """
+        Convert to dictionary.
+
+        Args:
+            markdown_limit: Truncate the markdown preview past this many
+                characters (None for the full markdown)
+        """
+        markdown = self.markdown
+        if markdown_limit is not None and len(markdown) > markdown_limit:
+            markdown = markdown[:markdown_limit] + "..."
+
         return {
             "metadata": self.metadata.to_dict(),
             "sections": [s.to_dict() for s in self.sections],
             "article_count": self.article_count,
             "cross_story_connections": self.cross_story_connections,
             "skeptics_summary": self.skeptics_summary,
-            "markdown_preview": self.markdown[:1000] + "..." if len(self.markdown) > 1000 else self.markdown,
+            "markdown_preview": markdown,
         }
@@ -28,6 +28,7 @@ from .base import (
 )
 from .openrouter import OpenRouterProvider
 from .anthropic import AnthropicProvider
+from .cache import LLMCache
 from .factory import (
     ProviderType,
     get_provider,
@@ -47,6 +48,8 @@ __all__ = [
     # Providers
     "OpenRouterProvider",
     "AnthropicProvider",
+    # Caching
+    "LLMCache",
     # Factory
     "ProviderType",
     "get_provider",
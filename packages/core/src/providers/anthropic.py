@@ -4,7 +4,9 @@ Direct integration with Anthropic's API for Claude models.
 Used as a fallback when OpenRouter is unavailable.
 """
 
+import json
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
@@ -91,6 +93,14 @@ ANTHROPIC_MODELS: dict[str, ModelInfo] = {
 DEFAULT_TIER1_MODEL = "claude-haiku-4-20250514"
 DEFAULT_TIER2_MODEL = "claude-sonnet-4-20250514"
 
+# Prompt cache pricing relative to the base input rate
+CACHE_WRITE_COST_MULTIPLIER = 1.25
+CACHE_READ_COST_MULTIPLIER = 0.1
+
+# Tool the model is forced to call when a response_schema is given; its
+# input is returned as the response content (JSON)
+STRUCTURED_OUTPUT_TOOL = "submit_response"
+
 
 class AnthropicProvider(BaseLLMProvider):
     """
@@ -167,6 +177,7 @@ class AnthropicProvider(BaseLLMProvider):
         temperature: float = 0.7,
         system_prompt: str | None = None,
         stop_sequences: list[str] | None = None,
+        system_prompt_cacheable: bool = True,
         **kwargs: Any,
     ) -> LLMResponse:
         """
@@ -178,7 +189,8 @@ class AnthropicProvider(BaseLLMProvider):
             temperature: Sampling temperature (0-1)
             system_prompt: Optional system prompt
             stop_sequences: Optional stop sequences
-            **kwargs: Additional arguments (top_p, top_k, etc.)
+            system_prompt_cacheable: Mark the system prompt for prompt caching
+            **kwargs: Additional arguments (top_p, top_k, response_schema, etc.)
 
         Returns:
             LLMResponse with generated content and metadata
@@ -189,27 +201,15 @@ class AnthropicProvider(BaseLLMProvider):
             AuthenticationError: If authentication fails
         """
         start_time = time.time()
-
-        # Build messages
-        messages = [{"role": "user", "content": prompt}]
-
-        # Build request payload
-        payload: dict[str, Any] = {
-            "model": self.model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
-
-        # Add optional parameters
-        if system_prompt:
-            payload["system"] = system_prompt
-        if stop_sequences:
-            payload["stop_sequences"] = stop_sequences
-        if "top_p" in kwargs:
-            payload["top_p"] = kwargs["top_p"]
-        if "top_k" in kwargs:
-            payload["top_k"] = kwargs["top_k"]
+        payload = self._build_payload(
+            prompt,
+            max_tokens,
+            temperature,
+            system_prompt,
+            stop_sequences,
+            system_prompt_cacheable,
+            **kwargs,
+        )
 
         try:
             response = await self._client.post("/messages", json=payload)
@@ -233,6 +233,164 @@ class AnthropicProvider(BaseLLMProvider):
                 provider="anthropic",
             )
 
+        return self._parse_message(data, temperature, max_tokens, start_time)
+
+    async def stream_complete(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        system_prompt: str | None = None,
+        stop_sequences: list[str] | None = None,
+        system_prompt_cacheable: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Complete a prompt using Anthropic's streaming API.
+
+        Unlike complete(), rate-limited requests are not retried, since
+        text may already have been yielded.
+
+        Args:
+            prompt: User prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0-1)
+            system_prompt: Optional system prompt
+            stop_sequences: Optional stop sequences
+            system_prompt_cacheable: Mark the system prompt for prompt caching
+            **kwargs: Additional arguments (top_p, top_k, response_schema, etc.)
+
+        Yields:
+            Text deltas in generation order
+
+        Raises:
+            ProviderError: If the request fails
+            RateLimitError: If rate limit is exceeded
+            AuthenticationError: If authentication fails
+        """
+        start_time = time.time()
+        payload = self._build_payload(
+            prompt,
+            max_tokens,
+            temperature,
+            system_prompt,
+            stop_sequences,
+            system_prompt_cacheable,
+            **kwargs,
+        )
+        payload["stream"] = True
+
+        # Reassembled into the non-streaming response shape for accounting
+        message: dict[str, Any] = {"content": [], "usage": {}}
+        text_parts: list[str] = []
+
+        try:
+            async with self._client.stream("POST", "/messages", json=payload) as response:
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    event = json.loads(line[5:])
+                    event_type = event.get("type")
+
+                    if event_type == "content_block_delta":
+                        # Text, or the tool input JSON for structured output
+                        delta = event.get("delta", {})
+                        text = delta.get("text") or delta.get("partial_json", "")
+                        if text:
+                            text_parts.append(text)
+                            yield text
+                    elif event_type == "message_start":
+                        start = event.get("message", {})
+                        message["id"] = start.get("id")
+                        message["model"] = start.get("model")
+                        message["usage"].update(start.get("usage", {}))
+                    elif event_type == "message_delta":
+                        message["stop_reason"] = event.get("delta", {}).get("stop_reason") or "end_turn"
+                        message["usage"].update(event.get("usage", {}))
+                    elif event_type == "error":
+                        self.record_error()
+                        raise ProviderError(
+                            f"Stream failed: {event.get('error', {}).get('message', '')}",
+                            provider="anthropic",
+                        )
+
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+
+        except httpx.TimeoutException as e:
+            self.record_error()
+            raise ProviderError(
+                f"Request timed out after {self.timeout}s",
+                provider="anthropic",
+            ) from e
+
+        except httpx.RequestError as e:
+            self.record_error()
+            raise ProviderError(
+                f"Request failed: {str(e)}",
+                provider="anthropic",
+            ) from e
+
+        message["content"] = [{"type": "text", "text": "".join(text_parts)}]
+        self._parse_message(message, temperature, max_tokens, start_time)
+
+    def _build_payload(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: str | None,
+        stop_sequences: list[str] | None,
+        system_prompt_cacheable: bool,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build a Messages API request payload."""
+        # Build messages
+        messages = [{"role": "user", "content": prompt}]
+
+        # Build request payload
+        payload: dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+        # Add optional parameters
+        if system_prompt:
+            system_block: dict[str, Any] = {"type": "text", "text": system_prompt}
+            if system_prompt_cacheable:
+                system_block["cache_control"] = {"type": "ephemeral"}
+            payload["system"] = [system_block]
+        if stop_sequences:
+            payload["stop_sequences"] = stop_sequences
+        if "top_p" in kwargs:
+            payload["top_p"] = kwargs["top_p"]
+        if "top_k" in kwargs:
+            payload["top_k"] = kwargs["top_k"]
+        if kwargs.get("response_schema"):
+            # Structured output: force a tool call whose input is the response
+            payload["tools"] = [{
+                "name": STRUCTURED_OUTPUT_TOOL,
+                "description": "Submit the response.",
+                "input_schema": kwargs["response_schema"],
+            }]
+            payload["tool_choice"] = {"type": "tool", "name": STRUCTURED_OUTPUT_TOOL}
+
+        return payload
+
+    def _parse_message(
+        self,
+        data: dict[str, Any],
+        temperature: float,
+        max_tokens: int,
+        start_time: float,
+    ) -> LLMResponse:
+        """Convert a Messages API response into an LLMResponse and record stats."""
         # Parse response
         try:
             content_blocks = data.get("content", [])
@@ -240,12 +398,16 @@ class AnthropicProvider(BaseLLMProvider):
             for block in content_blocks:
                 if block.get("type") == "text":
                     content += block.get("text", "")
+                elif block.get("type") == "tool_use":
+                    content += json.dumps(block.get("input", {}))
 
             finish_reason = data.get("stop_reason", "end_turn")
 
             usage = data.get("usage", {})
             input_tokens = usage.get("input_tokens", 0)
             output_tokens = usage.get("output_tokens", 0)
+            cache_write_tokens = usage.get("cache_creation_input_tokens", 0)
+            cache_read_tokens = usage.get("cache_read_input_tokens", 0)
 
         except (KeyError, IndexError) as e:
             self.record_error()
@@ -257,6 +419,12 @@ class AnthropicProvider(BaseLLMProvider):
 
         # Calculate cost
         cost = self.calculate_cost(input_tokens, output_tokens)
+        model_info = self.get_model_info()
+        if model_info:
+            cost += model_info.input_cost_per_token * (
+                cache_write_tokens * CACHE_WRITE_COST_MULTIPLIER
+                + cache_read_tokens * CACHE_READ_COST_MULTIPLIER
+            )
         response_time = time.time() - start_time
 
         # Build response
@@ -274,6 +442,8 @@ class AnthropicProvider(BaseLLMProvider):
                 "model_version": data.get("model"),
                 "temperature": temperature,
                 "max_tokens": max_tokens,
+                "cache_write_tokens": cache_write_tokens,
+                "cache_read_tokens": cache_read_tokens,
             },
         )
 
@@ -1,6 +1,8 @@
 """Base LLM provider interface and common types."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -217,6 +219,7 @@ class BaseLLMProvider(ABC):
         temperature: float = 0.7,
         system_prompt: str | None = None,
         stop_sequences: list[str] | None = None,
+        system_prompt_cacheable: bool = True,
         **kwargs: Any,
     ) -> LLMResponse:
         """
@@ -228,7 +231,10 @@ class BaseLLMProvider(ABC):
             temperature: Sampling temperature (0-2)
             system_prompt: Optional system prompt
             stop_sequences: Optional stop sequences
-            **kwargs: Additional provider-specific arguments
+            system_prompt_cacheable: Mark the system prompt for provider prompt caching
+            **kwargs: Additional provider-specific arguments. Providers that
+                support structured output accept response_schema (a JSON
+                schema) and constrain the content to valid JSON matching it.
 
         Returns:
             LLMResponse with generated content and metadata
@@ -240,6 +246,66 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def stream_complete(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Complete a prompt, yielding text as it is generated.
+
+        The default implementation yields the full complete() result as a
+        single chunk. Providers with a streaming endpoint override this.
+
+        Args:
+            prompt: User prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0-2)
+            system_prompt: Optional system prompt
+            **kwargs: Additional complete() arguments
+
+        Yields:
+            Text deltas in generation order
+        """
+        response = await self.complete(
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system_prompt=system_prompt,
+            **kwargs,
+        )
+        yield response.content
+
+    async def complete_batch(
+        self,
+        requests: list[dict[str, Any]],
+        max_concurrent: int = 50,
+    ) -> list[LLMResponse]:
+        """
+        Complete multiple prompts.
+
+        The default implementation fans out concurrent complete() calls
+        bounded by a semaphore. Providers with a native batch endpoint
+        can override this.
+
+        Args:
+            requests: List of complete() keyword arguments, one per prompt
+            max_concurrent: Maximum in-flight requests (size to rate limit)
+
+        Returns:
+            List of LLMResponse in same order as requests
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def complete_with_limit(request: dict[str, Any]) -> LLMResponse:
+            async with semaphore:
+                return await self.complete(**request)
+
+        return list(await asyncio.gather(*(complete_with_limit(r) for r in requests)))
+
     @abstractmethod
     async def health_check(self) -> bool:
         """
@@ -0,0 +1,381 @@
+"""Response cache for deterministic LLM calls.
+
+Agent prompts are built deterministically from article content and a fixed
+system prompt, so re-running the same articles (dev loops, overlapping topic
+comparisons) would otherwise re-hit the provider every time.
+
+Usage:
+    from src.providers import LLMCache
+
+    cache = LLMCache(cache_dir=".cache/llm")
+    response, hit = await cache.complete(provider, prompt, max_tokens=1200, temperature=0.4)
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .base import BaseLLMProvider, LLMResponse
+
+
+# Only low-temperature calls are deterministic enough to replay
+MAX_CACHEABLE_TEMPERATURE = 0.4
+
+# Finish reasons of a complete response (Anthropic and OpenAI-style); anything
+# else, such as a max_tokens/length cut-off, is not replayed
+COMPLETE_FINISH_REASONS = frozenset({"stop", "end_turn", "stop_sequence", "tool_use", "tool_calls"})
+
+# Default bound on in-memory entries (least recently used are evicted)
+MAX_MEMORY_ENTRIES = 4096
+
+
+@dataclass
+class CacheEntry:
+    """A cached response payload with optional expiry."""
+
+    content: str
+    model: str
+    provider: str
+    finish_reason: str = "stop"
+    expires_at: float | None = None
+    metadata: dict = field(default_factory=dict)
+
+    @property
+    def is_expired(self) -> bool:
+        """Check whether the entry has passed its TTL."""
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+    def to_response(self) -> LLMResponse:
+        """
+        Replay the entry as an LLMResponse.
+
+        Token counts and cost are zeroed so replayed responses are not
+        double-counted in agent or provider statistics.
+        """
+        return LLMResponse(
+            content=self.content,
+            model=self.model,
+            provider=self.provider,
+            input_tokens=0,
+            output_tokens=0,
+            cost_usd=0.0,
+            response_time_seconds=0.0,
+            finish_reason=self.finish_reason,
+            metadata={**self.metadata, "cache_hit": True},
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "content": self.content,
+            "model": self.model,
+            "provider": self.provider,
+            "finish_reason": self.finish_reason,
+            "expires_at": self.expires_at,
+            "metadata": self.metadata,
+        }
+
+
+class LLMCache:
+    """
+    Two-level (memory + optional file) cache for LLM responses.
+
+    Memory lookups are always tried first; when a cache directory is
+    configured, entries are also persisted as JSON files so they survive
+    process restarts. The memory tier holds at most max_entries responses,
+    evicting the least recently used.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        default_ttl: float | None = None,
+        max_entries: int = MAX_MEMORY_ENTRIES,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory for the file backend (memory-only if None)
+            default_ttl: Default time-to-live in seconds (no expiry if None)
+            max_entries: Maximum responses held in memory
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._memory: OrderedDict[str, CacheEntry] = OrderedDict()
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(
+        system_prompt: str | None,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> str:
+        """
+        Build a cache key for a completion request.
+
+        Args:
+            system_prompt: System prompt sent with the request
+            prompt: User prompt
+            model: Model identifier
+            max_tokens: Maximum tokens requested
+            temperature: Sampling temperature
+
+        Returns:
+            Hex-encoded sha256 digest of the request parameters
+        """
+        payload = json.dumps(
+            {
+                "sys": system_prompt or "",
+                "prompt": prompt,
+                "model": model,
+                "max_tokens": max_tokens,
+                "temp": temperature,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def is_cacheable(temperature: float) -> bool:
+        """Check whether a request at this temperature may be replayed."""
+        return temperature <= MAX_CACHEABLE_TEMPERATURE
+
+    @staticmethod
+    def is_complete(response: LLMResponse) -> bool:
+        """Check whether a response finished normally (not truncated or filtered)."""
+        return response.finish_reason in COMPLETE_FINISH_REASONS
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        """Hold an entry in memory, evicting the least recently used."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _path_for(self, key: str) -> Path:
+        """Get file backend path for a key."""
+        assert self.cache_dir is not None
+        return self.cache_dir / f"{key}.json"
+
+    def _read_file(self, key: str) -> CacheEntry | None:
+        """Read an entry from the file backend."""
+        path = self._path_for(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                return CacheEntry(**json.load(f))
+        except (json.JSONDecodeError, TypeError, OSError):
+            return None
+
+    def _write_file(self, key: str, entry: CacheEntry) -> None:
+        """Write an entry to the file backend."""
+        with open(self._path_for(key), "w", encoding="utf-8") as f:
+            json.dump(entry.to_dict(), f)
+
+    async def get(self, key: str) -> LLMResponse | None:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Replayed LLMResponse on hit, None on miss or expiry
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        elif self.cache_dir:
+            entry = await asyncio.to_thread(self._read_file, key)
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is None:
+            return None
+
+        if entry.is_expired:
+            await self.delete(key)
+            return None
+
+        return entry.to_response()
+
+    async def set(
+        self,
+        key: str,
+        value: LLMResponse,
+        ttl: float | None = None,
+    ) -> None:
+        """
+        Store a response.
+
+        Responses that did not finish normally (e.g. cut off at max_tokens)
+        are not stored, so they are retried instead of replayed.
+
+        Args:
+            key: Cache key from make_key()
+            value: Response to cache
+            ttl: Time-to-live in seconds (uses default_ttl if None)
+        """
+        if not self.is_complete(value):
+            return
+
+        ttl = ttl if ttl is not None else self.default_ttl
+        entry = CacheEntry(
+            content=value.content,
+            model=value.model,
+            provider=value.provider,
+            finish_reason=value.finish_reason,
+            expires_at=time.time() + ttl if ttl is not None else None,
+        )
+        self._remember(key, entry)
+
+        if self.cache_dir:
+            await asyncio.to_thread(self._write_file, key, entry)
+
+    async def complete(
+        self,
+        provider: BaseLLMProvider,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: str | None = None,
+    ) -> tuple[LLMResponse, bool]:
+        """
+        Complete a prompt through the cache.
+
+        Args:
+            provider: Provider to call on a miss
+            prompt: User prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system_prompt: Optional system prompt
+
+        Returns:
+            Tuple of (response, whether it was a cache hit)
+        """
+        key = self.make_key(system_prompt, prompt, provider.model, max_tokens, temperature)
+
+        cached = await self.get(key)
+        if cached is not None:
+            return cached, True
+
+        response = await provider.complete(
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system_prompt=system_prompt,
+        )
+        await self.set(key, response)
+        return response, False
+
+    @staticmethod
+    async def complete_if_cacheable(
+        cache: "LLMCache | None",
+        provider: BaseLLMProvider,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: str | None = None,
+    ) -> tuple[LLMResponse, bool | None]:
+        """
+        Complete a prompt through an optional cache.
+
+        Calls the provider directly when there is no cache or the request is
+        too random to replay.
+
+        Args:
+            cache: Cache to use, or None
+            provider: Provider to call on a miss
+            prompt: User prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system_prompt: Optional system prompt
+
+        Returns:
+            Tuple of (response, whether it was a cache hit, or None if the
+            cache was bypassed)
+        """
+        if cache is None or not LLMCache.is_cacheable(temperature):
+            response = await provider.complete(
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system_prompt=system_prompt,
+            )
+            return response, None
+        return await cache.complete(provider, prompt, max_tokens, temperature, system_prompt)
+
+    async def complete_batch(
+        self,
+        provider: BaseLLMProvider,
+        requests: list[dict[str, Any]],
+        max_concurrent: int = 50,
+    ) -> tuple[list[LLMResponse], int]:
+        """
+        Complete multiple prompts through the cache.
+
+        Each response is stored as soon as it arrives, so with a file
+        backend an interrupted batch resumes where it stopped.
+
+        Args:
+            provider: Provider to call on a miss
+            requests: List of complete() keyword arguments, one per prompt
+            max_concurrent: Maximum in-flight provider requests
+
+        Returns:
+            Tuple of (responses in request order, number of cache hits)
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def complete_one(request: dict[str, Any]) -> tuple[LLMResponse, bool]:
+            if not self.is_cacheable(request["temperature"]):
+                async with semaphore:
+                    return await provider.complete(**request), False
+
+            key = self.make_key(
+                request.get("system_prompt"),
+                request["prompt"],
+                provider.model,
+                request["max_tokens"],
+                request["temperature"],
+            )
+            cached = await self.get(key)
+            if cached is not None:
+                return cached, True
+
+            async with semaphore:
+                response = await provider.complete(**request)
+            await self.set(key, response)
+            return response, False
+
+        results = await asyncio.gather(*(complete_one(r) for r in requests))
+        return [response for response, _ in results], sum(hit for _, hit in results)
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry from all backends."""
+        self._memory.pop(key, None)
+        if self.cache_dir:
+            self._path_for(key).unlink(missing_ok=True)
+
+    async def clear(self) -> None:
+        """Remove all entries from all backends."""
+        self._memory.clear()
+        if self.cache_dir:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        """Number of entries held in memory."""
+        return len(self._memory)
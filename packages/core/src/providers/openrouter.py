@@ -11,7 +11,9 @@ This is the default provider for The Daily Clearing due to:
 3. Zero data retention with X-Data-Policy header
 """
 
+import json
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
@@ -230,6 +232,7 @@ class OpenRouterProvider(BaseLLMProvider):
         temperature: float = 0.7,
         system_prompt: str | None = None,
         stop_sequences: list[str] | None = None,
+        system_prompt_cacheable: bool = True,
         **kwargs: Any,
     ) -> LLMResponse:
         """
@@ -241,7 +244,8 @@ class OpenRouterProvider(BaseLLMProvider):
             temperature: Sampling temperature (0-2)
             system_prompt: Optional system prompt
             stop_sequences: Optional stop sequences
-            **kwargs: Additional arguments (top_p, frequency_penalty, etc.)
+            system_prompt_cacheable: Mark the system prompt for prompt caching
+            **kwargs: Additional arguments (top_p, frequency_penalty, response_schema, etc.)
 
         Returns:
             LLMResponse with generated content and metadata
@@ -252,11 +256,158 @@ class OpenRouterProvider(BaseLLMProvider):
             AuthenticationError: If authentication fails
         """
         start_time = time.time()
+        payload = self._build_payload(
+            prompt,
+            max_tokens,
+            temperature,
+            system_prompt,
+            stop_sequences,
+            system_prompt_cacheable,
+            **kwargs,
+        )
+
+        try:
+            response = await self._client.post("/chat/completions", json=payload)
+            response.raise_for_status()
+            data = response.json()
+
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+
+        except httpx.TimeoutException:
+            self.record_error()
+            raise ProviderError(
+                f"Request timed out after {self.timeout}s",
+                provider="openrouter",
+            )
+
+        except httpx.RequestError as e:
+            self.record_error()
+            raise ProviderError(
+                f"Request failed: {str(e)}",
+                provider="openrouter",
+            )
+
+        return self._parse_completion(data, temperature, max_tokens, start_time)
+
+    async def stream_complete(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        system_prompt: str | None = None,
+        stop_sequences: list[str] | None = None,
+        system_prompt_cacheable: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Complete a prompt using OpenRouter's streaming API.
+
+        Unlike complete(), rate-limited requests are not retried, since
+        text may already have been yielded.
+
+        Args:
+            prompt: User prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0-2)
+            system_prompt: Optional system prompt
+            stop_sequences: Optional stop sequences
+            system_prompt_cacheable: Mark the system prompt for prompt caching
+            **kwargs: Additional arguments (top_p, frequency_penalty, response_schema, etc.)
+
+        Yields:
+            Text deltas in generation order
+
+        Raises:
+            ProviderError: If the request fails
+            RateLimitError: If rate limit is exceeded
+            AuthenticationError: If authentication fails
+        """
+        start_time = time.time()
+        payload = self._build_payload(
+            prompt,
+            max_tokens,
+            temperature,
+            system_prompt,
+            stop_sequences,
+            system_prompt_cacheable,
+            **kwargs,
+        )
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
+
+        # Reassembled into the non-streaming response shape for accounting
+        data: dict[str, Any] = {}
+        finish_reason = "stop"
+        text_parts: list[str] = []
+
+        try:
+            async with self._client.stream("POST", "/chat/completions", json=payload) as response:
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    # Skip SSE comments (keep-alives) and the terminator
+                    if not line.startswith("data:") or line[5:].strip() == "[DONE]":
+                        continue
+                    chunk = json.loads(line[5:])
+                    if "error" in chunk:
+                        self.record_error()
+                        raise ProviderError(
+                            f"Stream failed: {chunk['error'].get('message', '')}",
+                            provider="openrouter",
+                        )
+
+                    data["id"] = chunk.get("id", data.get("id"))
+                    if chunk.get("usage"):
+                        data["usage"] = chunk["usage"]
+                    for choice in chunk.get("choices", []):
+                        text = choice.get("delta", {}).get("content")
+                        if text:
+                            text_parts.append(text)
+                            yield text
+                        finish_reason = choice.get("finish_reason") or finish_reason
 
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e)
+
+        except httpx.TimeoutException as e:
+            self.record_error()
+            raise ProviderError(
+                f"Request timed out after {self.timeout}s",
+                provider="openrouter",
+            ) from e
+
+        except httpx.RequestError as e:
+            self.record_error()
+            raise ProviderError(
+                f"Request failed: {str(e)}",
+                provider="openrouter",
+            ) from e
+
+        data["choices"] = [
+            {"message": {"content": "".join(text_parts)}, "finish_reason": finish_reason}
+        ]
+        self._parse_completion(data, temperature, max_tokens, start_time)
+
+    def _build_payload(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: str | None,
+        stop_sequences: list[str] | None,
+        system_prompt_cacheable: bool,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build a chat completions request payload."""
         # Build messages
         messages = []
         if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+            messages.append(
+                {"role": "system", "content": self._system_content(system_prompt, system_prompt_cacheable)}
+            )
         messages.append({"role": "user", "content": prompt})
 
         # Build request payload
@@ -276,29 +427,26 @@ class OpenRouterProvider(BaseLLMProvider):
             payload["frequency_penalty"] = kwargs["frequency_penalty"]
         if "presence_penalty" in kwargs:
             payload["presence_penalty"] = kwargs["presence_penalty"]
+        if kwargs.get("response_schema"):
+            payload["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "response",
+                    "strict": True,
+                    "schema": kwargs["response_schema"],
+                },
+            }
 
-        try:
-            response = await self._client.post("/chat/completions", json=payload)
-            response.raise_for_status()
-            data = response.json()
-
-        except httpx.HTTPStatusError as e:
-            self._handle_http_error(e)
-
-        except httpx.TimeoutException:
-            self.record_error()
-            raise ProviderError(
-                f"Request timed out after {self.timeout}s",
-                provider="openrouter",
-            )
-
-        except httpx.RequestError as e:
-            self.record_error()
-            raise ProviderError(
-                f"Request failed: {str(e)}",
-                provider="openrouter",
-            )
+        return payload
 
+    def _parse_completion(
+        self,
+        data: dict[str, Any],
+        temperature: float,
+        max_tokens: int,
+        start_time: float,
+    ) -> LLMResponse:
+        """Convert a chat completions response into an LLMResponse and record stats."""
         # Parse response
         try:
             choice = data["choices"][0]
@@ -308,6 +456,7 @@ class OpenRouterProvider(BaseLLMProvider):
             usage = data.get("usage", {})
             input_tokens = usage.get("prompt_tokens", 0)
             output_tokens = usage.get("completion_tokens", 0)
+            cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
 
         except (KeyError, IndexError) as e:
             self.record_error()
@@ -336,6 +485,7 @@ class OpenRouterProvider(BaseLLMProvider):
                 "system_fingerprint": data.get("system_fingerprint"),
                 "temperature": temperature,
                 "max_tokens": max_tokens,
+                "cache_read_tokens": cached_tokens,
             },
         )
 
@@ -344,6 +494,33 @@ class OpenRouterProvider(BaseLLMProvider):
 
         return llm_response
 
+    def _system_content(self, system_prompt: str, cacheable: bool) -> str | list[dict[str, Any]]:
+        """
+        Build system message content.
+
+        Anthropic models only cache prompts with explicit cache_control
+        breakpoints; other upstream providers cache prefixes automatically,
+        so a plain string is sent for them.
+
+        Args:
+            system_prompt: System prompt text
+            cacheable: Whether to mark the prompt for caching
+
+        Returns:
+            Message content (string or content-part list)
+        """
+        model_info = self.get_model_info()
+        if not cacheable or not model_info or model_info.provider != "anthropic":
+            return system_prompt
+
+        return [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
     def _handle_http_error(self, error: httpx.HTTPStatusError) -> None:
         """Handle HTTP errors from OpenRouter."""
         status_code = error.response.status_code
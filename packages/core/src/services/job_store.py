@@ -0,0 +1,240 @@
+"""Job state storage for the HTTP API.
+
+Digest jobs are created by one request and polled by later ones. Keeping
+job state in process memory only works with a single API worker; with
+Redis, every worker sees the same jobs and state survives restarts.
+
+Each job is a Redis hash (one JSON-encoded value per field), so progress
+updates write only the fields that changed instead of a read-modify-write
+of the whole job.
+
+Usage:
+    from src.services.job_store import create_job_store
+
+    # Redis when REDIS_URL is set, in-memory otherwise
+    store = create_job_store()
+
+    await store.create("job-1", {"status": "pending", "progress": 0})
+    await store.update("job-1", {"progress": 50})
+    job = await store.get("job-1")
+"""
+
+import json
+import os
+from abc import ABC, abstractmethod
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from typing import Any
+
+# Optional imports with fallbacks
+try:
+    import redis.asyncio as aioredis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Finished jobs are polled shortly after completion; expire an hour after
+# the last write
+JOB_TTL_SECONDS = 3600
+
+JOB_KEY_PREFIX = "job:"
+
+# Create the hash only if the job doesn't exist. ARGV: ttl, field, value, ...
+_CREATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then return 0 end
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+# Update fields only if the job still exists, and restart its TTL.
+# ARGV: ttl, field, value, ...
+_UPDATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return 0 end
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values stdlib json can't handle."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(value: Any) -> str:
+    """Encode a field value."""
+    if HAS_ORJSON:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, default=_json_default)
+
+
+def _loads(value: str) -> Any:
+    """Decode a field value."""
+    if HAS_ORJSON:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+class JobStore(ABC):
+    """Storage for digest job state."""
+
+    @abstractmethod
+    async def create(self, job_id: str, state: dict[str, Any]) -> bool:
+        """
+        Create a job.
+
+        Args:
+            job_id: Job identifier
+            state: Initial job fields
+
+        Returns:
+            False if the job already exists
+        """
+
+    @abstractmethod
+    async def get(self, job_id: str) -> dict[str, Any] | None:
+        """
+        Get a job's state.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job fields, or None if the job doesn't exist
+        """
+
+    @abstractmethod
+    async def update(self, job_id: str, fields: dict[str, Any]) -> bool:
+        """
+        Update some fields of a job.
+
+        Args:
+            job_id: Job identifier
+            fields: Fields to set
+
+        Returns:
+            False if the job doesn't exist (nothing is written)
+        """
+
+    @abstractmethod
+    async def delete(self, job_id: str) -> bool:
+        """
+        Delete a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            False if the job didn't exist
+        """
+
+    async def close(self) -> None:
+        """Release any connections."""
+        return None
+
+
+class MemoryJobStore(JobStore):
+    """In-process job store; only valid with a single API worker."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._jobs: dict[str, dict[str, Any]] = {}
+
+    async def create(self, job_id: str, state: dict[str, Any]) -> bool:
+        if job_id in self._jobs:
+            return False
+        self._jobs[job_id] = dict(state)
+        return True
+
+    async def get(self, job_id: str) -> dict[str, Any] | None:
+        job = self._jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+    async def update(self, job_id: str, fields: dict[str, Any]) -> bool:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return False
+        job.update(fields)
+        return True
+
+    async def delete(self, job_id: str) -> bool:
+        return self._jobs.pop(job_id, None) is not None
+
+
+class RedisJobStore(JobStore):
+    """Redis-backed job store shared by all API workers."""
+
+    def __init__(self, url: str, ttl_seconds: int = JOB_TTL_SECONDS):
+        """
+        Initialize Redis job store.
+
+        Args:
+            url: Redis URL (e.g. redis://localhost:6379/0)
+            ttl_seconds: Expiry for each job, counted from its last write
+        """
+        if not HAS_REDIS:
+            raise ImportError("redis is required for RedisJobStore: pip install redis")
+
+        self.ttl_seconds = ttl_seconds
+        self._redis = aioredis.from_url(url, decode_responses=True)
+        self._create = self._redis.register_script(_CREATE_SCRIPT)
+        self._update = self._redis.register_script(_UPDATE_SCRIPT)
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"{JOB_KEY_PREFIX}{job_id}"
+
+    @staticmethod
+    def _flatten(fields: dict[str, Any]) -> list[str]:
+        """Flatten fields into HSET's field, value, ... arguments."""
+        return [item for key, value in fields.items() for item in (key, _dumps(value))]
+
+    async def create(self, job_id: str, state: dict[str, Any]) -> bool:
+        args = [self.ttl_seconds, *self._flatten(state)]
+        return bool(await self._create(keys=[self._key(job_id)], args=args))
+
+    async def get(self, job_id: str) -> dict[str, Any] | None:
+        data = await self._redis.hgetall(self._key(job_id))
+        if not data:
+            return None
+        return {key: _loads(value) for key, value in data.items()}
+
+    async def update(self, job_id: str, fields: dict[str, Any]) -> bool:
+        if not fields:
+            return bool(await self._redis.expire(self._key(job_id), self.ttl_seconds))
+        args = [self.ttl_seconds, *self._flatten(fields)]
+        return bool(await self._update(keys=[self._key(job_id)], args=args))
+
+    async def delete(self, job_id: str) -> bool:
+        return await self._redis.delete(self._key(job_id)) > 0
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def create_job_store(redis_url: str | None = None) -> JobStore:
+    """
+    Create the job store for this deployment.
+
+    Args:
+        redis_url: Redis URL (defaults to the REDIS_URL environment variable)
+
+    Returns:
+        RedisJobStore if a URL is configured, otherwise MemoryJobStore
+    """
+    url = redis_url or os.environ.get("REDIS_URL")
+    if url:
+        return RedisJobStore(url)
+    return MemoryJobStore()
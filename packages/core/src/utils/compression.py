@@ -0,0 +1,256 @@
+"""Rule-based prompt compression for article content.
+
+Article bodies carry boilerplate (newsletter plugs, share prompts, repeated
+disclaimers) that costs input tokens on every LLM call. This module strips
+that boilerplate and, when content still exceeds the budget, keeps the
+paragraphs most relevant to the task as ranked by BM25.
+
+Paragraph text is never rewritten, so quotes, numbers, and proper nouns
+reach the model verbatim.
+
+Budgets are measured in tokens. When tiktoken is installed (and its
+encoding can be loaded) counts are exact for its BPE vocabulary, a close
+proxy for the models we use; otherwise they are estimated per word and
+punctuation mark, which tracks URLs and code far better than a flat
+characters-per-token ratio.
+"""
+
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+
+# Optional imports with fallbacks
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+
+# Rough estimate: ~4 characters per token for English
+CHARS_PER_TOKEN = 4
+
+# BPE vocabulary used for exact counts when available
+TOKENIZER_ENCODING = "cl100k_base"
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_WORD_RE = re.compile(r"\w+")
+_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+_SPACES_RE = re.compile(r"[ \t\r\f\v]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n+")
+
+# Short standalone lines matching these are dropped as navigation/promo
+# boilerplate. Each pattern must cover the whole line, so a real paragraph
+# that merely starts with "Recommended" or "Copyright" is kept.
+BOILERPLATE_MAX_CHARS = 100
+_BOILERPLATE_RE = re.compile(
+    r"^\W*(?:"
+    r"advertisement|sponsored content|"
+    r"(?:subscribe|sign up)(?: (?:now|today|here)| (?:to|for)\b.*)?|"
+    r"sign in|log in|click here\b.*|read more\b.*|"
+    r"share (?:this(?: article| story| post)?|on \w+)|follow us(?: on \w+)?|"
+    r"related(?: articles| stories| content| posts)?|"
+    r"recommended(?: for you| reading| stories| articles)?|"
+    r"(?:©|copyright)\s*©?\s*\d{4}\b.*|.*\ball rights reserved|"
+    r"(?:we|this (?:site|website)) uses? cookies\b.*|accept (?:all )?cookies"
+    r")\W*$",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tiktoken encoding, or None if unavailable (e.g. offline)."""
+    if not HAS_TIKTOKEN:
+        return None
+    try:
+        return tiktoken.get_encoding(TOKENIZER_ENCODING)
+    except Exception:
+        return None
+
+
+def load_tokenizer() -> bool:
+    """
+    Load the tiktoken encoding now rather than on the first count.
+
+    On a cold cache tiktoken downloads the BPE file synchronously, with no
+    timeout. Agents whose async paths count tokens call this from their
+    constructors so that download never blocks the event loop mid-request.
+    Offline (or without tiktoken) counts fall back to the per-piece
+    estimate, and this returns False.
+
+    Returns:
+        Whether exact token counts are available
+    """
+    return _get_encoding() is not None
+
+
+def _piece_tokens(piece: str) -> int:
+    """Estimate tokens for a single word or punctuation mark."""
+    return -(-len(piece) // CHARS_PER_TOKEN)
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens in text.
+
+    Args:
+        text: Text to count
+
+    Returns:
+        Exact count with tiktoken, otherwise an estimate
+    """
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return sum(_piece_tokens(piece) for piece in _PIECE_RE.findall(text))
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to a token budget.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum tokens to keep
+
+    Returns:
+        Leading portion of text within the budget
+    """
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return encoding.decode(tokens[:max_tokens])
+
+    used = 0
+    for match in _PIECE_RE.finditer(text):
+        cost = _piece_tokens(match.group())
+        if used + cost > max_tokens:
+            if used:
+                return text[:match.start()].rstrip()
+            # Single oversized piece (e.g. an encoded blob): cut inside it
+            return text[:match.start() + max_tokens * CHARS_PER_TOKEN]
+        used += cost
+    return text
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase word tokens."""
+    return _WORD_RE.findall(text.lower())
+
+
+def _is_boilerplate(line: str) -> bool:
+    """Whether a normalized line is a standalone boilerplate line."""
+    return len(line) <= BOILERPLATE_MAX_CHARS and _BOILERPLATE_RE.match(line) is not None
+
+
+def _clean_paragraphs(text: str) -> list[str]:
+    """Normalize whitespace and drop boilerplate and duplicate paragraphs."""
+    paragraphs = []
+    seen = set()
+
+    for block in _BLANK_LINES_RE.split(text):
+        lines = [
+            line
+            for line in (_SPACES_RE.sub(" ", raw).strip() for raw in block.split("\n"))
+            if line and not _is_boilerplate(line)
+        ]
+        if not lines:
+            continue
+
+        paragraph = "\n".join(lines)
+        if paragraph in seen:
+            continue
+        seen.add(paragraph)
+        paragraphs.append(paragraph)
+
+    return paragraphs
+
+
+def bm25_scores(paragraphs: list[str], query_terms: list[str]) -> list[float]:
+    """
+    Score paragraphs against query terms with Okapi BM25.
+
+    Args:
+        paragraphs: Candidate paragraphs
+        query_terms: Query text fragments (tokenized internally)
+
+    Returns:
+        One score per paragraph
+    """
+    docs = [_tokenize(p) for p in paragraphs]
+    query = set(_tokenize(" ".join(query_terms)))
+    if not docs or not query:
+        return [0.0] * len(paragraphs)
+
+    n_docs = len(docs)
+    avg_len = sum(len(d) for d in docs) / n_docs or 1.0
+    doc_freq = Counter(term for doc in docs for term in set(doc) & query)
+
+    scores = []
+    for doc in docs:
+        term_counts = Counter(doc)
+        score = 0.0
+        for term in query:
+            tf = term_counts.get(term, 0)
+            if not tf:
+                continue
+            idf = math.log((n_docs - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5) + 1)
+            norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * len(doc) / avg_len)
+            score += idf * tf * (BM25_K1 + 1) / norm
+        scores.append(score)
+
+    return scores
+
+
+def compress_content(
+    text: str,
+    budget_tokens: int,
+    query_terms: list[str] | None = None,
+) -> str:
+    """
+    Compress article content to fit a token budget.
+
+    Strips whitespace runs and boilerplate, then, if still over budget,
+    greedily packs the highest-scoring paragraphs (BM25 against the query
+    terms) and returns them in their original order. The lead paragraph is
+    always preferred since it usually carries the story's core claim.
+
+    Args:
+        text: Raw article content
+        budget_tokens: Maximum tokens to keep
+        query_terms: Task keywords used to rank paragraphs
+
+    Returns:
+        Compressed content, no longer than the budget
+    """
+    paragraphs = _clean_paragraphs(text)
+    costs = [count_tokens(p) for p in paragraphs]
+
+    # Paragraph separators cost about a token each
+    if sum(costs) + max(len(paragraphs) - 1, 0) <= budget_tokens:
+        return "\n\n".join(paragraphs)
+
+    scores = bm25_scores(paragraphs, query_terms or [])
+    # Lead paragraph first, then by relevance (stable for ties)
+    order = [0] + sorted(range(1, len(paragraphs)), key=lambda i: -scores[i])
+
+    selected = []
+    used = 0
+    for i in order:
+        cost = costs[i] + (1 if selected else 0)
+        if used + cost <= budget_tokens:
+            selected.append(i)
+            used += cost
+
+    if not selected:
+        # Single oversized paragraph: fall back to plain truncation
+        return truncate_tokens("\n\n".join(paragraphs), budget_tokens)
+
+    return "\n\n".join(paragraphs[i] for i in sorted(selected))
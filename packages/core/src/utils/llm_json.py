@@ -0,0 +1,167 @@
+"""JSON decoding for LLM responses.
+
+Models frequently wrap JSON output in markdown code fences even when told
+not to. This module strips the fences with plain prefix/suffix checks and
+decodes with orjson when it is installed, falling back to the standard
+library otherwise.
+
+Usage:
+    from src.utils.llm_json import loads_llm_json
+
+    data = loads_llm_json(response.content)
+
+    # Streaming: top-level fields as soon as each one is complete
+    parser = JSONFieldStream()
+    async for chunk in provider.stream_complete(prompt):
+        for key, value in parser.feed(chunk):
+            ...
+"""
+
+import json
+import re
+from typing import Any
+
+# Optional imports with fallbacks
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+_FENCE = "```"
+
+_WHITESPACE_RE = re.compile(r"\s*")
+_SEPARATOR_RE = re.compile(r"[\s,]*")
+_DECODER = json.JSONDecoder()
+
+
+def strip_code_fence(content: str) -> str:
+    """
+    Strip surrounding whitespace and markdown code fences.
+
+    Args:
+        content: Raw LLM output
+
+    Returns:
+        Content without fences
+    """
+    content = content.strip()
+    if content.startswith(_FENCE):
+        content = (
+            content.removeprefix(_FENCE)
+            .removeprefix("json")
+            .removesuffix(_FENCE)
+            .strip()
+        )
+    return content
+
+
+def loads_llm_json(content: str) -> Any:
+    """
+    Decode JSON from an LLM response.
+
+    Args:
+        content: Raw LLM output, optionally fenced
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+            (orjson's decode error subclasses it)
+    """
+    content = strip_code_fence(content)
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def clamp01(value: Any, default: float = 0.5) -> float:
+    """
+    Coerce a model-emitted score into [0, 1].
+
+    Args:
+        value: Raw value (number, numeric string, or junk)
+        default: Returned when value is not numeric
+
+    Returns:
+        Clamped float
+    """
+    # Schema-constrained responses almost always carry an in-range float
+    if type(value) is float and 0.0 <= value <= 1.0:
+        return value
+    try:
+        return max(0.0, min(1.0, float(value)))
+    except (TypeError, ValueError):
+        return default
+
+
+class JSONFieldStream:
+    """
+    Incremental parser for the top-level fields of a streamed JSON object.
+
+    Feed text chunks as they arrive; each call returns the (key, value)
+    pairs completed so far. Anything before the opening brace (such as a
+    markdown fence) is ignored. A value is only emitted once the following
+    delimiter has arrived, so numbers and literals are never cut short.
+    """
+
+    def __init__(self):
+        """Initialize an empty parser."""
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._done = False
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """
+        Add a chunk of text.
+
+        Args:
+            chunk: Next piece of streamed output
+
+        Returns:
+            Newly completed (key, value) pairs, in order
+        """
+        self._buffer += chunk
+        fields = []
+        while not self._done and (field := self._next_field()) is not None:
+            fields.append(field)
+        return fields
+
+    def _next_field(self) -> tuple[str, Any] | None:
+        """Parse the next complete field, or return None if more input is needed."""
+        buffer = self._buffer
+
+        if not self._started:
+            start = buffer.find("{")
+            if start < 0:
+                return None
+            self._started = True
+            self._pos = start + 1
+
+        pos = _SEPARATOR_RE.match(buffer, self._pos).end()
+        if pos >= len(buffer):
+            return None
+        if buffer[pos] == "}":
+            self._done = True
+            return None
+
+        try:
+            key, pos = _DECODER.raw_decode(buffer, pos)
+            pos = _WHITESPACE_RE.match(buffer, pos).end()
+            if buffer[pos:pos + 1] != ":":
+                return None
+            pos = _WHITESPACE_RE.match(buffer, pos + 1).end()
+            value, pos = _DECODER.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            return None
+
+        # Wait for the delimiter so a truncated scalar is not emitted
+        pos = _WHITESPACE_RE.match(buffer, pos).end()
+        if buffer[pos:pos + 1] not in (",", "}"):
+            return None
+
+        self._pos = pos
+        return key, value
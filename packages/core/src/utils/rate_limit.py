@@ -0,0 +1,114 @@
+"""Request and token rate limiting for concurrent LLM calls.
+
+Providers enforce limits on requests per minute and tokens per minute.
+A semaphore only bounds how many calls are in flight; with fast responses
+a batch still bursts past the provider's per-minute limits and spends its
+time in 429 retries. This limiter spaces calls out with two token buckets
+(requests and LLM tokens) that refill continuously, and can be paused for
+everyone when the provider does return a 429.
+
+Usage:
+    from src.utils.rate_limit import RateLimiter
+
+    limiter = RateLimiter(requests_per_minute=500, tokens_per_minute=400_000)
+
+    await limiter.acquire(tokens=estimated_tokens)
+    response = await provider.complete(prompt)
+"""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Token-bucket limiter on requests and tokens per minute."""
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float | None = None,
+    ):
+        """
+        Initialize rate limiter.
+
+        Both buckets start full, so up to a minute's budget may be spent at
+        once before calls are spaced out.
+
+        Args:
+            requests_per_minute: Maximum requests per minute; below 1 the
+                bucket still holds one request, refilled at this rate
+            tokens_per_minute: Maximum LLM tokens per minute (None for no limit)
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if tokens_per_minute is not None and tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be positive")
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        # A bucket smaller than one request could never be drawn from
+        self._request_capacity = max(1.0, float(requests_per_minute))
+        self._requests = self._request_capacity
+        self._tokens = float(tokens_per_minute or 0)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        # Waiters are served in arrival order
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add budget accrued since the last update."""
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(
+            self._request_capacity,
+            self._requests + elapsed * self.requests_per_minute / 60,
+        )
+        if self.tokens_per_minute is not None:
+            self._tokens = min(
+                self.tokens_per_minute,
+                self._tokens + elapsed * self.tokens_per_minute / 60,
+            )
+
+    def _wait_time(self, now: float, tokens: float) -> float:
+        """Seconds until a request for this many tokens fits both buckets."""
+        wait = max(
+            self._paused_until - now,
+            (1 - self._requests) * 60 / self.requests_per_minute,
+        )
+        if self.tokens_per_minute is not None:
+            wait = max(wait, (tokens - self._tokens) * 60 / self.tokens_per_minute)
+        return wait
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        Wait until a request may be sent, then take its budget.
+
+        Args:
+            tokens: Expected tokens for the request (prompt plus completion);
+                capped at the per-minute limit so large requests still run
+        """
+        if self.tokens_per_minute is not None:
+            tokens = min(tokens, self.tokens_per_minute)
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_time(now, tokens)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            self._requests -= 1
+            if self.tokens_per_minute is not None:
+                self._tokens -= tokens
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold all requests for a while (e.g. after a 429).
+
+        Args:
+            seconds: How long to hold new requests
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
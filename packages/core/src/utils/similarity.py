@@ -0,0 +1,144 @@
+"""Local lexical similarity for article pre-screening.
+
+Sends fewer article pairs to the LLM by scoring them locally first. Articles
+are represented as TF-IDF vectors over their content words and compared by
+cosine similarity; only pairs above a threshold are worth an LLM's attention.
+
+Term counts are computed per article and can be cached, while IDF weights
+are derived from whichever set of articles is being compared.
+
+Usage:
+    from src.utils.similarity import similar_pairs, term_counts
+
+    counts = [term_counts(f"{a.title}\\n{a.content}") for a in articles]
+    for i, j, score in similar_pairs(counts, threshold=0.2, top_k=10):
+        ...
+"""
+
+import math
+import re
+from collections import Counter
+from itertools import combinations
+
+
+_WORD_RE = re.compile(r"[a-z][a-z0-9]+")
+
+# Common function words that carry no topical signal
+STOPWORDS = frozenset(
+    """
+    about above after again against all also and any are because been before
+    being below between both but can could did does doing down during each
+    few for from further had has have having her here hers him his how into
+    its itself just more most much new not now off once only other our ours
+    out over own said same says she should some such than that the their
+    theirs them then there these they this those through too under until
+    very was were what when where which while who whom why will with would
+    you your yours year years
+    """.split()
+)
+
+
+def term_counts(text: str) -> Counter[str]:
+    """
+    Count content words in text.
+
+    Args:
+        text: Article text
+
+    Returns:
+        Counter of lowercase terms, excluding stopwords
+    """
+    return Counter(
+        word for word in _WORD_RE.findall(text.lower()) if word not in STOPWORDS
+    )
+
+
+def tfidf_vectors(counts: list[Counter[str]]) -> list[dict[str, float]]:
+    """
+    Build L2-normalized TF-IDF vectors.
+
+    Uses sublinear term frequency and smoothed IDF over the given documents.
+
+    Args:
+        counts: Term counts per document
+
+    Returns:
+        Sparse vectors (term -> weight), one per document
+    """
+    n_docs = len(counts)
+    doc_freq = Counter(term for doc in counts for term in doc)
+
+    vectors = []
+    for doc in counts:
+        vector = {
+            term: (1 + math.log(tf)) * (math.log((1 + n_docs) / (1 + doc_freq[term])) + 1)
+            for term, tf in doc.items()
+        }
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        if norm:
+            vector = {term: w / norm for term, w in vector.items()}
+        vectors.append(vector)
+
+    return vectors
+
+
+def unit_vector(counts: Counter[str]) -> dict[str, float]:
+    """
+    Build an L2-normalized sublinear TF vector for one document.
+
+    Unlike tfidf_vectors(), weights don't depend on other documents, so
+    vectors stay comparable as a collection grows.
+
+    Args:
+        counts: Term counts for the document
+
+    Returns:
+        Sparse vector (term -> weight)
+    """
+    vector = {term: 1 + math.log(tf) for term, tf in counts.items()}
+    norm = math.sqrt(sum(w * w for w in vector.values()))
+    if norm:
+        vector = {term: w / norm for term, w in vector.items()}
+    return vector
+
+
+def cosine(a: dict[str, float], b: dict[str, float]) -> float:
+    """
+    Cosine similarity of two normalized sparse vectors.
+
+    Args:
+        a: First vector
+        b: Second vector
+
+    Returns:
+        Similarity in [0, 1]
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(term, 0.0) for term, w in a.items())
+
+
+def similar_pairs(
+    counts: list[Counter[str]],
+    threshold: float,
+    top_k: int,
+) -> list[tuple[int, int, float]]:
+    """
+    Find the most similar document pairs.
+
+    Args:
+        counts: Term counts per document
+        threshold: Minimum cosine similarity to keep a pair
+        top_k: Maximum number of pairs to return
+
+    Returns:
+        (i, j, similarity) tuples with i < j, most similar first
+    """
+    vectors = tfidf_vectors(counts)
+    pairs = [
+        (i, j, score)
+        for (i, a), (j, b) in combinations(enumerate(vectors), 2)
+        if (score := cosine(a, b)) >= threshold
+    ]
+    pairs.sort(key=lambda pair: -pair[2])
+    return pairs[:top_k]
@@ -0,0 +1,37 @@
+"""
+Shared fixtures for agent tests.
+"""
+
+import pytest
+
+from src.agents.tier2_reasoning._article_cache import clear_features
+from src.models.article import ParsedArticle
+
+
+@pytest.fixture(autouse=True)
+def empty_feature_cache():
+    """Start each test with an empty Tier 2 article feature cache."""
+    clear_features()
+    yield
+    clear_features()
+
+
+@pytest.fixture
+def make_article():
+    """Factory for test articles; the ID and URL follow the source."""
+
+    def make(
+        *,
+        title: str = "Test Article",
+        content: str = "Test content for the article.",
+        source: str = "test.com",
+    ) -> ParsedArticle:
+        return ParsedArticle(
+            article_id=f"{source}-001",
+            url=f"https://{source}/article",
+            title=title,
+            content=content,
+            source=source,
+        )
+
+    return make
@@ -0,0 +1,86 @@
+"""
+Tests for the shared Tier 2 article feature cache.
+"""
+
+from src.agents.tier2_reasoning import _article_cache
+from src.agents.tier2_reasoning._article_cache import (
+    ANALYSIS_CONTENT_TOKENS,
+    QUALITY_CONTENT_CHARS,
+    TRUNCATION_NOTE,
+    get_features,
+    quality_content,
+)
+
+
+class TestArticleFeatures:
+    """Tests for feature computation and reuse."""
+
+    def test_features_computed_once(self, monkeypatch, make_article):
+        """Test that repeated lookups reuse the same features."""
+        calls = []
+        compute = _article_cache._compute_features
+        monkeypatch.setattr(
+            _article_cache,
+            "_compute_features",
+            lambda *args: calls.append(args) or compute(*args),
+        )
+
+        first = get_features(make_article())
+        second = get_features(make_article())
+
+        assert first is second
+        assert len(calls) == 1
+
+    def test_one_version_held_per_article(self, make_article):
+        """Test that entries are keyed by article ID, replacing older versions."""
+        get_features(make_article(content="Old text."))
+        get_features(make_article(content="New text."))
+
+        assert len(_article_cache._features) == 1
+
+    def test_least_recently_used_evicted(self, monkeypatch, make_article):
+        """Test that the cache stays within its bound."""
+        monkeypatch.setattr(_article_cache, "MAX_CACHED_ARTICLES", 2)
+        for article_id in ("a", "b", "a", "c"):
+            article = make_article()
+            article.article_id = article_id
+            get_features(article)
+
+        assert list(_article_cache._features) == ["a", "c"]
+
+    def test_changed_content_recomputed(self, make_article):
+        """Test that a new version of an article gets fresh features."""
+        old = get_features(make_article(content="Old text."))
+        new = get_features(make_article(content="New text."))
+
+        assert old.analysis_content == "Old text."
+        assert new.analysis_content == "New text."
+
+    def test_feature_values(self, make_article):
+        """Test the derived features."""
+        features = get_features(
+            make_article(title="Revenue Report", content="The company said revenue rose.")
+        )
+
+        assert features.token_count > 0
+        assert not features.analysis_truncated
+        assert features.preview == "The company said revenue rose."
+        assert features.term_counts["revenue"] == 2  # title + content
+
+    def test_long_content_flagged_truncated(self, make_article):
+        """Test that over-budget content is compressed and flagged."""
+        features = get_features(make_article(content="word " * (ANALYSIS_CONTENT_TOKENS * 2)))
+        assert features.analysis_truncated
+
+    def test_quality_content_truncated(self, make_article):
+        """Test that quality prompt content is cut to its budget and marked."""
+        article = make_article(content="x" * (QUALITY_CONTENT_CHARS + 10))
+
+        assert quality_content(article) == "x" * QUALITY_CONTENT_CHARS + TRUNCATION_NOTE
+        assert quality_content(make_article(content="Short.")) == "Short."
+
+    def test_quality_content_skips_feature_computation(self, make_article):
+        """Test that quality prompts don't compute the expensive features."""
+        quality_content(make_article())
+
+        assert not _article_cache._features
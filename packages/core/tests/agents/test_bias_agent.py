@@ -6,13 +6,14 @@ import pytest
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from src.agents.tier2_reasoning._neutral_filter import NEUTRAL_BYPASS_THRESHOLD
 from src.agents.tier2_reasoning.bias_agent import BiasAgent
 from src.models.article import (
     BiasAnalysis,
     BiasDirection,
-    ParsedArticle,
 )
 from src.providers.base import LLMResponse
+from src.providers.cache import LLMCache
 
 
 # ============================================================================
@@ -130,27 +131,18 @@ class TestBiasAgentInit:
         agent = BiasAgent(provider=mock_provider)
         assert agent.provider == mock_provider
 
+    def test_init_loads_tokenizer(self):
+        """Test that the tokenizer loads at construction, not inside a request."""
+        with patch("src.agents.tier2_reasoning.bias_agent.load_tokenizer") as load:
+            BiasAgent(provider=MagicMock())
+        load.assert_called_once_with()
+
 
 # ============================================================================
 # Bias Agent Analysis Tests
 # ============================================================================
 
 
-def _make_article(
-    title: str = "Test Article",
-    content: str = "Test content",
-    source: str = "test.com",
-) -> ParsedArticle:
-    """Helper to create test articles."""
-    return ParsedArticle(
-        article_id="test-001",
-        url=f"https://{source}/article",
-        title=title,
-        content=content,
-        source=source,
-    )
-
-
 class TestBiasAgentAnalyze:
     """Tests for Bias Agent analyze method."""
 
@@ -168,9 +160,9 @@ class TestBiasAgentAnalyze:
         return BiasAgent(provider=mock_provider)
 
     @pytest.fixture
-    def neutral_article(self):
+    def neutral_article(self, make_article):
         """Create a neutral article."""
-        return _make_article(
+        return make_article(
             title="Study Finds Mixed Results on Policy",
             content="""
             A new study examines the effects of the policy from multiple angles.
@@ -182,9 +174,9 @@ class TestBiasAgentAnalyze:
         )
 
     @pytest.fixture
-    def biased_article(self):
+    def biased_article(self, make_article):
         """Create a biased article."""
-        return _make_article(
+        return make_article(
             title="Radical New Policy Threatens Economy",
             content="""
             The dangerous new policy pushed by extremists will destroy jobs
@@ -320,9 +312,9 @@ class TestSkepticsCorner:
         )
 
     @pytest.mark.asyncio
-    async def test_generates_skeptics_corner(self, agent, mock_provider):
+    async def test_generates_skeptics_corner(self, agent, mock_provider, make_article):
         """Test that skeptic's corner is generated for concerning content."""
-        article = _make_article(
+        article = make_article(
             title="Miracle Cure Discovered",
             content="Scientists claim to have found a miracle cure...",
             source="news.example.com",
@@ -341,9 +333,9 @@ class TestSkepticsCorner:
         assert "skepticism" in analysis.skeptics_corner.lower()
 
     @pytest.mark.asyncio
-    async def test_no_skeptics_corner_for_neutral(self, agent, mock_provider):
+    async def test_no_skeptics_corner_for_neutral(self, agent, mock_provider, make_article):
         """Test that neutral content may not need skeptic's corner."""
-        article = _make_article(
+        article = make_article(
             title="Research Study Published",
             content="Researchers published findings in peer-reviewed journal...",
             source="nature.com",
@@ -396,9 +388,9 @@ class TestRedFlags:
         )
 
     @pytest.mark.asyncio
-    async def test_detects_unsourced_claims(self, agent, mock_provider):
+    async def test_detects_unsourced_claims(self, agent, mock_provider, make_article):
         """Test detection of unsourced claims."""
-        article = _make_article(
+        article = make_article(
             title="Experts Say X",
             content="Experts say that X is true. Studies show Y.",
             source="blog.example.com",
@@ -415,9 +407,9 @@ class TestRedFlags:
         assert any("source" in flag.lower() for flag in analysis.red_flags)
 
     @pytest.mark.asyncio
-    async def test_detects_emotional_manipulation(self, agent, mock_provider):
+    async def test_detects_emotional_manipulation(self, agent, mock_provider, make_article):
         """Test detection of emotional manipulation."""
-        article = _make_article(
+        article = make_article(
             title="Shocking Truth Revealed",
             content="You won't believe what happened. This will make you furious.",
             source="clickbait.example.com",
@@ -468,17 +460,17 @@ class TestBiasAgentErrors:
         )
 
     @pytest.mark.asyncio
-    async def test_handles_provider_error(self, agent, mock_provider):
+    async def test_handles_provider_error(self, agent, mock_provider, make_article):
         """Test handling of provider errors."""
         mock_provider.complete.side_effect = Exception("API Error")
 
-        article = _make_article()
+        article = make_article()
 
         with pytest.raises(Exception):
             await agent.analyze(article)
 
     @pytest.mark.asyncio
-    async def test_handles_invalid_direction(self, agent, mock_provider):
+    async def test_handles_invalid_direction(self, agent, mock_provider, make_article):
         """Test handling of invalid bias direction."""
         mock_provider.complete.return_value = self._make_response({
             "bias_score": 0.5,
@@ -486,11 +478,24 @@ class TestBiasAgentErrors:
             "bias_confidence": 0.5,
         })
 
-        article = _make_article()
+        article = make_article()
         analysis = await agent.analyze(article)
         # Should default to unknown
         assert analysis.bias_direction == BiasDirection.UNKNOWN
 
+    @pytest.mark.asyncio
+    async def test_bounds_and_validates_list_fields(self, agent, mock_provider, make_article):
+        """Test that list fields are capped and non-list values are dropped."""
+        mock_provider.complete.return_value = self._make_response({
+            "loaded_language": [f"phrase{i}" for i in range(200)],
+            "red_flags": "none",
+        })
+
+        analysis = await agent.analyze(make_article())
+
+        assert len(analysis.loaded_language) == 10
+        assert analysis.red_flags == []
+
 
 # ============================================================================
 # Factual Claims Tests
@@ -526,9 +531,9 @@ class TestFactualClaims:
         )
 
     @pytest.mark.asyncio
-    async def test_extracts_factual_claims(self, agent, mock_provider):
+    async def test_extracts_factual_claims(self, agent, mock_provider, make_article):
         """Test extraction of verifiable claims."""
-        article = _make_article(
+        article = make_article(
             title="Report Shows 50% Increase",
             content="The report shows a 50% increase in X and 30% decrease in Y.",
             source="news.example.com",
@@ -547,3 +552,315 @@ class TestFactualClaims:
         analysis = await agent.analyze(article)
         # BiasAnalysis has verifiable_claims, not factual_claims
         assert len(analysis.verifiable_claims) >= 0
+
+
+# ============================================================================
+# Batch Analysis Tests
+# ============================================================================
+
+
+class TestBiasAgentBatch:
+    """Tests for Bias Agent batch analysis."""
+
+    @pytest.mark.asyncio
+    async def test_batch_analyze_submits_one_batch(self, make_article):
+        """Test that all prompts are submitted in a single batch call."""
+        provider = MagicMock()
+        provider.complete_batch = AsyncMock(return_value=[
+            LLMResponse(
+                content=json.dumps({"bias_score": score, "bias_confidence": 0.9}),
+                model="test-model",
+                provider="test",
+                input_tokens=100,
+                output_tokens=50,
+                cost_usd=0.001,
+                response_time_seconds=1.0,
+            )
+            for score in (0.1, 0.5, 0.9)
+        ])
+        agent = BiasAgent(provider=provider)
+        articles = [make_article(title=f"Article {i}") for i in range(3)]
+
+        analyses = await agent.batch_analyze(articles)
+
+        provider.complete_batch.assert_awaited_once()
+        assert len(provider.complete_batch.await_args.args[0]) == 3
+        assert [a.bias_score for a in analyses] == [0.1, 0.5, 0.9]
+        assert agent._stats.total_analyzed == 3
+        assert agent._stats.highly_biased == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_analyze_submits_shortest_first(self, make_article):
+        """Test that requests are length-ordered but results keep input order."""
+        scores = {"long": 0.1, "short": 0.5, "medium": 0.9}
+
+        async def complete_batch(requests, max_concurrent):
+            return [
+                LLMResponse(
+                    content=json.dumps({"bias_score": next(
+                        score for title, score in scores.items() if f"Title: {title}" in r["prompt"]
+                    )}),
+                    model="test-model",
+                    provider="test",
+                    input_tokens=100,
+                    output_tokens=50,
+                    cost_usd=0.001,
+                    response_time_seconds=1.0,
+                )
+                for r in requests
+            ]
+
+        provider = MagicMock()
+        provider.complete_batch = AsyncMock(side_effect=complete_batch)
+        agent = BiasAgent(provider=provider)
+        articles = [
+            make_article(title="long", content="word " * 500),
+            make_article(title="short", content="word"),
+            make_article(title="medium", content="word " * 50),
+        ]
+
+        analyses = await agent.batch_analyze(articles)
+
+        submitted = provider.complete_batch.await_args.args[0]
+        assert "Title: short" in submitted[0]["prompt"]
+        assert "Title: long" in submitted[2]["prompt"]
+        assert [a.bias_score for a in analyses] == [0.1, 0.5, 0.9]
+
+    @pytest.mark.asyncio
+    async def test_compare_coverage_aggregates(self, make_article):
+        """Test coverage comparison aggregates across analyses."""
+        payloads = [
+            {"bias_score": 0.1, "bias_confidence": 0.9, "red_flags": ["spin"], "missing_perspectives": ["a"]},
+            {"bias_score": 0.5, "bias_confidence": 0.9, "red_flags": ["spin", "rare"], "missing_perspectives": ["a", "b"]},
+            {"bias_score": 0.9, "bias_confidence": 0.9, "red_flags": [], "missing_perspectives": []},
+        ]
+        provider = MagicMock()
+        provider.complete_batch = AsyncMock(return_value=[
+            LLMResponse(
+                content=json.dumps(payload),
+                model="test-model",
+                provider="test",
+                input_tokens=100,
+                output_tokens=50,
+                cost_usd=0.001,
+                response_time_seconds=1.0,
+            )
+            for payload in payloads
+        ])
+        agent = BiasAgent(provider=provider)
+        articles = [make_article(title=f"Article {i}") for i in range(3)]
+
+        result = await agent.compare_coverage(articles, "AI")
+
+        assert result["average_bias_score"] == pytest.approx(0.5)
+        assert result["bias_range"] == pytest.approx(0.8)
+        assert result["bias_distribution"] == {"left": 1, "center": 1, "right": 1}
+        assert sorted(result["missing_perspectives_across_all"]) == ["a", "b"]
+        assert result["common_red_flags"] == ["spin"]
+        assert result["highly_biased_count"] == 2
+
+
+# ============================================================================
+# Response Cache Tests
+# ============================================================================
+
+
+class TestBiasAgentCache:
+    """Tests for Bias Agent response caching."""
+
+    @pytest.fixture
+    def mock_provider(self):
+        """Create a mock LLM provider."""
+        provider = MagicMock()
+        provider.model = "test-model"
+        provider.complete = AsyncMock(return_value=LLMResponse(
+            content=json.dumps({"bias_score": 0.5, "bias_confidence": 0.8}),
+            model="test-model",
+            provider="test",
+            input_tokens=100,
+            output_tokens=50,
+            cost_usd=0.001,
+            response_time_seconds=1.0,
+        ))
+        provider.get_stats = MagicMock(return_value={})
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_repeated_analysis_uses_cache(self, mock_provider, make_article):
+        """Test that re-analyzing the same article replays the cached response."""
+        agent = BiasAgent(provider=mock_provider, cache=LLMCache())
+        article = make_article()
+
+        first = await agent.analyze(article)
+        second = await agent.analyze(article)
+
+        assert mock_provider.complete.await_count == 1
+        assert first.bias_score == second.bias_score
+
+        stats = agent.get_stats()
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 1
+        assert stats["total_tokens"] == 150  # replay is not double-counted
+
+    @pytest.mark.asyncio
+    async def test_batch_analyze_uses_cache(self, mock_provider, make_article):
+        """Test that batch analysis replays cached articles."""
+        agent = BiasAgent(provider=mock_provider, cache=LLMCache())
+        article = make_article()
+
+        await agent.analyze(article)
+        analyses = await agent.batch_analyze([article, make_article(title="Other")])
+
+        assert len(analyses) == 2
+        assert mock_provider.complete.await_count == 2
+        assert agent.get_stats()["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_misses_count_only_cacheable(self, mock_provider):
+        """Test that uncacheable batch requests are not counted as misses."""
+        agent = BiasAgent(provider=mock_provider, cache=LLMCache())
+        requests = [
+            {"prompt": "a", "max_tokens": 100, "temperature": 0.4},
+            {"prompt": "b", "max_tokens": 100, "temperature": 0.9},
+        ]
+
+        await agent._complete_batch(requests, max_concurrent=2)
+
+        stats = agent.get_stats()
+        assert stats["cache_hits"] == 0
+        assert stats["cache_misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_cache_by_default(self, mock_provider, make_article):
+        """Test that agents without a cache always call the provider."""
+        agent = BiasAgent(provider=mock_provider)
+        article = make_article()
+
+        await agent.analyze(article)
+        await agent.analyze(article)
+
+        assert mock_provider.complete.await_count == 2
+
+
+# ============================================================================
+# Streaming Tests
+# ============================================================================
+
+
+class TestBiasAgentStreaming:
+    """Tests for streamed bias analysis."""
+
+    @pytest.mark.asyncio
+    async def test_on_field_receives_fields_as_streamed(self, make_article):
+        """Test that fields are reported during the stream and the analysis is complete."""
+        events = []
+        chunks = ['{"bias_score": 0.2, ', '"bias_confidence": 0.9, ', '"red_flags": ["spin"]}']
+
+        async def stream_complete(**kwargs):
+            for chunk in chunks:
+                events.append(("chunk", chunk))
+                yield chunk
+
+        provider = MagicMock()
+        provider.model = "test-model"
+        provider.provider_name = "test"
+        provider.stream_complete = stream_complete
+        provider.estimate_tokens = MagicMock(return_value=10)
+        provider.calculate_cost = MagicMock(return_value=0.001)
+        agent = BiasAgent(provider=provider)
+
+        analysis = await agent.analyze(
+            make_article(), on_field=lambda key, value: events.append((key, value))
+        )
+
+        assert events == [
+            ("chunk", chunks[0]),
+            ("bias_score", 0.2),
+            ("chunk", chunks[1]),
+            ("bias_confidence", 0.9),
+            ("chunk", chunks[2]),
+            ("red_flags", ["spin"]),
+        ]
+        assert analysis.bias_score == 0.2
+        assert analysis.red_flags == ["spin"]
+        assert agent._stats.total_analyzed == 1
+
+
+# ============================================================================
+# BiasAgent Neutral Pre-filter Tests
+# ============================================================================
+
+
+TECHNICAL_TEXT = (
+    "The compiler release improves benchmark performance and cuts latency "
+    "on the gpu runtime, developers reported. "
+) * 20
+
+
+class TestBiasAgentNeutralBypass:
+    """Tests for skipping the LLM on confidently neutral articles."""
+
+    @pytest.fixture
+    def mock_provider(self):
+        """Create a mock LLM provider."""
+        provider = MagicMock()
+        provider.complete = AsyncMock(return_value=LLMResponse(
+            content=json.dumps({"bias_score": 0.2, "bias_confidence": 0.9}),
+            model="test-model",
+            provider="test",
+            input_tokens=100,
+            output_tokens=50,
+            cost_usd=0.01,
+            response_time_seconds=0.5,
+        ))
+        provider.get_stats = MagicMock(return_value={})
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_neutral_article_skips_llm(self, mock_provider, make_article):
+        """Test that a technical article is answered locally."""
+        agent = BiasAgent(mock_provider, neutral_threshold=NEUTRAL_BYPASS_THRESHOLD)
+
+        analysis = await agent.analyze(make_article(content=TECHNICAL_TEXT))
+
+        mock_provider.complete.assert_not_awaited()
+        assert analysis.bias_score == 0.5
+        assert analysis.bias_direction == BiasDirection.CENTER
+        assert analysis.bias_confidence == 0.0
+        assert analysis.skeptics_corner == ""
+        stats = agent.get_stats()
+        assert stats["neutral_bypassed"] == 1
+        assert stats["bypass_rate"] == 100.0
+        assert stats["total_cost_usd"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_bypass_off_by_default(self, mock_provider, make_article):
+        """Test that the LLM is always called unless a threshold is given."""
+        agent = BiasAgent(mock_provider)
+
+        analysis = await agent.analyze(make_article(content=TECHNICAL_TEXT))
+
+        mock_provider.complete.assert_awaited_once()
+        assert analysis.bias_score == 0.2
+
+    @pytest.mark.asyncio
+    async def test_batch_submits_only_non_neutral(self, mock_provider, make_article):
+        """Test that batches submit only articles needing the LLM."""
+        mock_provider.complete_batch = AsyncMock(
+            side_effect=lambda requests, max_concurrent: [
+                mock_provider.complete.return_value for _ in requests
+            ]
+        )
+        agent = BiasAgent(mock_provider, neutral_threshold=NEUTRAL_BYPASS_THRESHOLD)
+        articles = [
+            make_article(title="opinion", content="Critics say the plan fails."),
+            make_article(title="tech", content=TECHNICAL_TEXT),
+        ]
+
+        analyses = await agent.batch_analyze(articles)
+
+        requests = mock_provider.complete_batch.await_args.args[0]
+        assert len(requests) == 1
+        assert "opinion" in requests[0]["prompt"]
+        assert [a.bias_score for a in analyses] == [0.2, 0.5]
+        assert agent.get_stats()["neutral_bypassed"] == 1
@@ -6,6 +6,10 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 
+from src.agents.tier2_reasoning.connection_agent import ConnectionAgent
+from src.models.article import ParsedArticle
+from src.providers.base import LLMResponse
+
 
 class MockConnectionAgent:
     """Mock Connection Agent for testing."""
@@ -505,3 +509,189 @@ class TestConnectionStrength:
 
         similarity = connection_agent._calculate_similarity(article1, article2)
         assert similarity < 0.2  # Weak connection
+
+
+# ============================================================================
+# ConnectionAgent Parallel Request Tests
+# ============================================================================
+
+
+def _make_parsed(i: int):
+    """Create a ParsedArticle for the real agent."""
+    return ParsedArticle(
+        article_id=f"article-{i}",
+        url=f"https://example.com/{i}",
+        title=f"Article {i}",
+        content=f"Content for article {i}",
+        source="example.com",
+    )
+
+
+def _make_llm_response(content: str):
+    """Create an LLMResponse with the given content."""
+    return LLMResponse(
+        content=content,
+        model="test-model",
+        provider="test",
+        input_tokens=10,
+        output_tokens=5,
+        cost_usd=0.0,
+        response_time_seconds=0.1,
+    )
+
+
+class TestParallelRequests:
+    """Tests for the real ConnectionAgent's split per-article/per-pair requests."""
+
+    @pytest.mark.asyncio
+    async def test_find_contradictions_checks_each_pair(self):
+        """Test that every article pair gets its own request."""
+        provider = MagicMock()
+
+        async def complete(prompt, **kwargs):
+            if "Article 1" in prompt and "Article 3" in prompt:
+                return _make_llm_response('{"contradicts": true, "claim_1": "x", "claim_2": "not x"}')
+            return _make_llm_response('{"contradicts": false}')
+
+        provider.complete = AsyncMock(side_effect=complete)
+        agent = ConnectionAgent(provider)
+
+        contradictions = await agent.find_contradictions([_make_parsed(i) for i in range(1, 5)])
+
+        assert provider.complete.await_count == 6  # C(4, 2)
+        assert len(contradictions) == 1
+        assert contradictions[0]["article_indices"] == [1, 3]
+        assert contradictions[0]["claim_2"] == "not x"
+
+    @pytest.mark.asyncio
+    async def test_identify_trends_aggregates_tags(self):
+        """Test that trends are aggregated from per-article tags only."""
+        provider = MagicMock()
+
+        async def complete(prompt, **kwargs):
+            if prompt.startswith("Tag this article"):
+                return _make_llm_response('{"tags": ["open weights"]}')
+            assert "Content for article" not in prompt
+            assert "open weights" in prompt
+            return _make_llm_response('{"trends": [{"trend_name": "Open weights"}], "hot_topics": [], "prediction": ""}')
+
+        provider.complete = AsyncMock(side_effect=complete)
+        agent = ConnectionAgent(provider)
+
+        result = await agent.identify_trends([_make_parsed(i) for i in range(3)], "AI")
+
+        assert provider.complete.await_count == 4  # 3 tag calls + 1 aggregation
+        assert result["trends"][0]["trend_name"] == "Open weights"
+
+    @pytest.mark.parametrize(
+        "content",
+        ['{"tags": null}', '{"tags": "ai, chips"}', '["ai"]', "not json"],
+    )
+    def test_malformed_trend_tags_ignored(self, content):
+        """Test that tag responses without a list of tags yield no tags."""
+        agent = ConnectionAgent(MagicMock())
+        assert agent._parse_trend_tags(_make_llm_response(content)) == []
+
+    @pytest.mark.asyncio
+    async def test_only_literal_true_is_a_contradiction(self):
+        """Test that truthy non-boolean verdicts like "false" are not contradictions."""
+        provider = MagicMock()
+        provider.complete = AsyncMock(
+            return_value=_make_llm_response('{"contradicts": "false", "claim_1": "x"}')
+        )
+        agent = ConnectionAgent(provider)
+
+        assert await agent.find_contradictions([_make_parsed(i) for i in range(1, 3)]) == []
+
+    @pytest.mark.asyncio
+    async def test_identify_trends_empty(self):
+        """Test that no articles means no requests."""
+        provider = MagicMock()
+        provider.complete = AsyncMock()
+        agent = ConnectionAgent(provider)
+
+        result = await agent.identify_trends([], "AI")
+
+        assert result["trends"] == []
+        provider.complete.assert_not_awaited()
+
+
+# ============================================================================
+# ConnectionAgent Candidate Pair Screening Tests
+# ============================================================================
+
+
+def _make_story(article_id: str, title: str, content: str):
+    """Create a ParsedArticle with real text for similarity screening."""
+    return ParsedArticle(
+        article_id=article_id,
+        url=f"https://example.com/{article_id}",
+        title=title,
+        content=content,
+        source="example.com",
+    )
+
+
+class TestCandidateScreening:
+    """Tests for local pair screening before the connection LLM call."""
+
+    @pytest.fixture
+    def stories(self):
+        """Two related stories and one unrelated story."""
+        return [
+            _make_story("gpt", "OpenAI releases GPT-5 language model",
+                        "OpenAI announced GPT-5 with improved reasoning benchmarks."),
+            _make_story("fed", "Federal Reserve holds interest rates",
+                        "The Fed kept rates unchanged citing inflation data."),
+            _make_story("rival", "Rivals respond to GPT-5 launch",
+                        "The GPT-5 language model from OpenAI pressures rivals on reasoning."),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_only_candidate_pairs_sent(self, stories):
+        """Test that unrelated articles are left out of the prompt."""
+        provider = MagicMock()
+        provider.complete = AsyncMock(return_value=_make_llm_response(
+            '{"connections": [{"article1_id": "gpt", "article2_id": "rival", '
+            '"connection_type": "extends", "strength": 0.8, "summary": "Same launch"}]}'
+        ))
+        agent = ConnectionAgent(provider)
+
+        connections = await agent.find_connections(stories)
+
+        prompt = provider.complete.await_args.kwargs["prompt"]
+        assert "gpt <-> rival" in prompt
+        assert "Federal Reserve" not in prompt
+        assert [(a, b) for a, b, _ in connections] == [("gpt", "rival")]
+        assert agent.get_stats()["pairs_screened"] == 3
+        assert agent.get_stats()["pairs_sent"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unrelated_articles_skip_llm(self, stories):
+        """Test that no candidate pairs means no LLM call."""
+        provider = MagicMock()
+        provider.complete = AsyncMock()
+        agent = ConnectionAgent(provider)
+
+        connections = await agent.find_connections([stories[0], stories[1]])
+
+        assert connections == []
+        provider.complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalid_connections_dropped(self, stories):
+        """Test unknown IDs, self-links and bad strengths are filtered."""
+        provider = MagicMock()
+        provider.complete = AsyncMock(return_value=_make_llm_response(
+            '{"connections": ['
+            '{"article1_id": "gpt", "article2_id": "nope", "strength": 0.9},'
+            '{"article1_id": "gpt", "article2_id": "gpt", "strength": 0.9},'
+            '{"article1_id": "gpt", "article2_id": "rival", "strength": "strong"},'
+            '{"article1_id": "rival", "article2_id": "gpt", "strength": 1.7}]}'
+        ))
+        agent = ConnectionAgent(provider)
+
+        connections = await agent.find_connections(stories)
+
+        assert [(a, b) for a, b, _ in connections] == [("rival", "gpt")]
+        assert connections[0][2].connection_strength == 1.0
@@ -0,0 +1,41 @@
+"""
+Tests for the Tier 2 neutrality pre-filter.
+"""
+
+from src.agents.tier2_reasoning._neutral_filter import (
+    NEUTRAL_BYPASS_THRESHOLD,
+    neutral_probability,
+)
+
+
+TECHNICAL_TEXT = (
+    "The compiler release improves benchmark performance and cuts latency "
+    "on the gpu runtime, developers reported. "
+) * 20
+
+CONTESTED_TEXT = (
+    "Republicans slammed the outrageous immigration bill after a shocking "
+    "senate vote on the software update. "
+) * 20
+
+
+class TestNeutralProbability:
+    """Tests for neutral probability scoring."""
+
+    def test_technical_article_is_neutral(self, make_article):
+        """Test that technical coverage clears the bypass threshold."""
+        assert neutral_probability(make_article(content=TECHNICAL_TEXT)) > NEUTRAL_BYPASS_THRESHOLD
+
+    def test_loaded_contested_article_is_not(self, make_article):
+        """Test that loaded language on contested topics outweighs tech terms."""
+        assert neutral_probability(make_article(content=CONTESTED_TEXT)) < 0.1
+
+    def test_plain_article_stays_below_threshold(self, make_article):
+        """Test that text with no signal is sent to the LLM."""
+        text = "The committee met on Tuesday to discuss the schedule for spring. " * 30
+        assert neutral_probability(make_article(content=text)) < NEUTRAL_BYPASS_THRESHOLD
+
+    def test_short_article_never_bypassed(self, make_article):
+        """Test that too little text scores zero."""
+        article = make_article(content="Researchers released the benchmark.")
+        assert neutral_probability(article) == 0.0
@@ -8,15 +8,18 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from dataclasses import dataclass
 
 from src.agents.tier2_reasoning.quality_agent import (
+    ANALYSIS_SYSTEM_PROMPT,
+    CHARS_PER_TOKEN,
     QualityAgent,
     TopicConfig,
 )
+from src.agents.tier2_reasoning.semantic_cache import SemanticCache
 from src.models.article import (
     QualityAnalysis,
     ContentType,
-    ParsedArticle,
 )
-from src.providers.base import LLMResponse
+from src.providers.base import LLMResponse, RateLimitError
+from src.utils.rate_limit import RateLimiter
 
 
 # ============================================================================
@@ -140,27 +143,22 @@ class TestQualityAgentInit:
         assert agent.default_config.name == "AI"
         assert agent.default_config.min_quality == 0.6
 
+    def test_topic_prompt_terms(self):
+        """Test the keyword lists shown in analysis prompts."""
+        config = TopicConfig(name="AI", keywords=[f"k{i}" for i in range(12)])
+
+        assert config.keywords_prompt == ", ".join(f"k{i}" for i in range(10))
+        assert config.exclude_prompt == "none"
+
+        config = TopicConfig(name="AI", exclude_keywords=["crypto", "nft"])
+        assert config.exclude_prompt == "crypto, nft"
+
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
 
-def _make_article(
-    title: str = "Test Article",
-    content: str = "Test content for the article.",
-    source: str = "test.com",
-) -> ParsedArticle:
-    """Helper to create test articles."""
-    return ParsedArticle(
-        article_id="test-001",
-        url=f"https://{source}/article",
-        title=title,
-        content=content,
-        source=source,
-    )
-
-
 def _make_response(data: dict) -> LLMResponse:
     """Create a mock LLM response with JSON content."""
     return LLMResponse(
@@ -196,9 +194,9 @@ class TestQualityAgentAnalyze:
         return QualityAgent(provider=mock_provider)
 
     @pytest.fixture
-    def sample_article(self):
+    def sample_article(self, make_article):
         """Create a sample article for testing."""
-        return _make_article(
+        return make_article(
             title="AI Breakthrough: New Model Achieves Record Performance",
             content="""
             Researchers have developed a new AI model that achieves state-of-the-art
@@ -235,6 +233,17 @@ class TestQualityAgentAnalyze:
         assert isinstance(analysis, QualityAnalysis)
         assert analysis.relevance_score == 0.85
 
+    @pytest.mark.asyncio
+    async def test_response_format_in_system_prompt(self, agent, mock_provider, sample_article):
+        """Test that the static JSON format is in the cacheable system prompt."""
+        mock_provider.complete.return_value = _make_response({"relevance_score": 0.8})
+
+        await agent.analyze(sample_article)
+
+        kwargs = mock_provider.complete.await_args.kwargs
+        assert '"relevance_score"' in kwargs["system_prompt"]
+        assert '"relevance_score"' not in kwargs["prompt"]
+
     @pytest.mark.asyncio
     async def test_analyze_with_topic_config(self, agent, mock_provider, sample_article):
         """Test analysis with topic configuration."""
@@ -279,9 +288,9 @@ class TestQualityAgentAnalyze:
         assert analysis.content_type == ContentType.RESEARCH
 
     @pytest.mark.asyncio
-    async def test_analyze_handles_low_quality(self, agent, mock_provider):
+    async def test_analyze_handles_low_quality(self, agent, mock_provider, make_article):
         """Test analysis of low-quality content."""
-        low_quality_article = _make_article(
+        low_quality_article = make_article(
             title="Click Here!!!",
             content="Buy now! Limited offer!",
             source="spam.com",
@@ -321,9 +330,9 @@ class TestQualityScoring:
         return QualityAgent(provider=mock_provider)
 
     @pytest.mark.asyncio
-    async def test_high_quality_research_paper(self, agent, mock_provider):
+    async def test_high_quality_research_paper(self, agent, mock_provider, make_article):
         """Test scoring of high-quality research paper."""
-        article = _make_article(
+        article = make_article(
             title="Novel Approach to Neural Architecture Search",
             content="We present a comprehensive study..." * 100,
             source="arxiv.org",
@@ -342,9 +351,9 @@ class TestQualityScoring:
         assert analysis.quality_score >= 0.8
 
     @pytest.mark.asyncio
-    async def test_news_article_scoring(self, agent, mock_provider):
+    async def test_news_article_scoring(self, agent, mock_provider, make_article):
         """Test scoring of news article."""
-        article = _make_article(
+        article = make_article(
             title="Company Announces New Product",
             content="Today, the company revealed..." * 50,
             source="techcrunch.com",
@@ -362,9 +371,9 @@ class TestQualityScoring:
         assert analysis.content_type == ContentType.NEWS
 
     @pytest.mark.asyncio
-    async def test_opinion_piece_scoring(self, agent, mock_provider):
+    async def test_opinion_piece_scoring(self, agent, mock_provider, make_article):
         """Test scoring of opinion piece."""
-        article = _make_article(
+        article = make_article(
             title="Why AI Will Change Everything",
             content="In my opinion..." * 50,
             source="medium.com",
@@ -380,6 +389,21 @@ class TestQualityScoring:
         analysis = await agent.analyze(article)
         assert analysis.content_type == ContentType.OPINION
 
+    @pytest.mark.asyncio
+    async def test_below_thresholds_excluded(self, agent, mock_provider, make_article):
+        """Test that scores under the topic thresholds exclude the article."""
+        mock_provider.complete.return_value = _make_response({
+            "relevance_score": 0.3,
+            "quality_score": 0.9,
+            "should_include": True,
+        })
+
+        analysis = await agent.analyze(make_article(), TopicConfig(name="AI", min_relevance=0.5))
+
+        assert analysis.should_include is False
+        assert analysis.skip_reason == "Below relevance threshold"
+        assert agent.get_stats()["failed_relevance"] == 1
+
 
 # ============================================================================
 # Error Handling Tests
@@ -403,17 +427,17 @@ class TestQualityAgentErrors:
         return QualityAgent(provider=mock_provider)
 
     @pytest.mark.asyncio
-    async def test_handles_provider_error(self, agent, mock_provider):
+    async def test_handles_provider_error(self, agent, mock_provider, make_article):
         """Test handling of provider errors."""
         mock_provider.complete.side_effect = Exception("API Error")
 
-        article = _make_article()
+        article = make_article()
 
         with pytest.raises(Exception):
             await agent.analyze(article)
 
     @pytest.mark.asyncio
-    async def test_handles_invalid_response(self, agent, mock_provider):
+    async def test_handles_invalid_response(self, agent, mock_provider, make_article):
         """Test handling of invalid LLM response."""
         mock_provider.complete.return_value = LLMResponse(
             content='{"invalid": "response"}',
@@ -425,13 +449,35 @@ class TestQualityAgentErrors:
             response_time_seconds=0.5,
         )
 
-        article = _make_article()
+        article = make_article()
         analysis = await agent.analyze(article)
         # Should use default values
         assert analysis.relevance_score == 0.5  # Default on parse error
 
     @pytest.mark.asyncio
-    async def test_handles_empty_content(self, agent, mock_provider):
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("Press_Release", ContentType.PRESS_RELEASE),
+            ("podcast", ContentType.UNKNOWN),
+            (None, ContentType.UNKNOWN),
+        ],
+    )
+    async def test_content_type_lookup(self, agent, mock_provider, value, expected, make_article):
+        """Test that content types match case-insensitively with an UNKNOWN fallback."""
+        mock_provider.complete.return_value = _make_response({
+            "relevance_score": 0.8,
+            "quality_score": 0.8,
+            "content_type": value,
+        })
+
+        analysis = await agent.analyze(make_article())
+
+        assert analysis.content_type == expected
+        assert analysis.relevance_score == 0.8
+
+    @pytest.mark.asyncio
+    async def test_handles_empty_content(self, agent, mock_provider, make_article):
         """Test handling of empty article content."""
         mock_provider.complete.return_value = _make_response({
             "relevance_score": 0.0,
@@ -440,7 +486,7 @@ class TestQualityAgentErrors:
             "should_include": False,
         })
 
-        article = _make_article(title="", content="")
+        article = make_article(title="", content="")
         analysis = await agent.analyze(article)
         assert analysis.skip_reason is not None
 
@@ -467,10 +513,10 @@ class TestQualityAgentIntegration:
         return QualityAgent(provider=mock_provider)
 
     @pytest.mark.asyncio
-    async def test_batch_analyze(self, agent, mock_provider):
+    async def test_batch_analyze(self, agent, mock_provider, make_article):
         """Test analyzing multiple articles via batch_analyze."""
         articles = [
-            _make_article(title=f"Article {i}", content=f"Content {i}" * 50)
+            make_article(title=f"Article {i}", content=f"Content {i}" * 50)
             for i in range(5)
         ]
 
@@ -485,7 +531,7 @@ class TestQualityAgentIntegration:
         assert all(isinstance(r, QualityAnalysis) for r in results)
 
     @pytest.mark.asyncio
-    async def test_analyze_with_config(self, agent, mock_provider):
+    async def test_analyze_with_config(self, agent, mock_provider, make_article):
         """Test analysis respects topic configuration."""
         config = TopicConfig(
             name="AI",
@@ -500,7 +546,194 @@ class TestQualityAgentIntegration:
             "should_include": True,
         })
 
-        article = _make_article(title="AI News", content="Content about AI")
+        article = make_article(title="AI News", content="Content about AI")
         analysis = await agent_with_config.analyze(article)
 
         assert analysis.quality_score >= 0.7
+
+
+# ============================================================================
+# Quality Agent Semantic Cache Tests
+# ============================================================================
+
+
+class TestQualityAgentSemanticCache:
+    """Tests for reusing analyses of repeated articles."""
+
+    @pytest.fixture
+    def mock_provider(self):
+        """Create a mock LLM provider."""
+        provider = MagicMock()
+        provider.complete = AsyncMock(return_value=_make_response({
+            "relevance_score": 0.8,
+            "quality_score": 0.75,
+            "key_points": ["one"],
+        }))
+        provider.get_stats = MagicMock(return_value={})
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_repeated_article_uses_cache(self, mock_provider, make_article):
+        """Test that a repeated article skips the LLM."""
+        agent = QualityAgent(provider=mock_provider, semantic_cache=SemanticCache())
+
+        first = await agent.analyze(make_article())
+        second = await agent.analyze(make_article())
+
+        mock_provider.complete.assert_awaited_once()
+        assert second.quality_score == first.quality_score
+        assert second is not first
+        stats = agent.get_stats()
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 1
+        assert stats["total_analyzed"] == 2
+        assert stats["total_tokens"] == 150
+
+    @pytest.mark.asyncio
+    async def test_cache_scoped_to_topic(self, mock_provider, make_article):
+        """Test that a different topic config is analyzed again."""
+        agent = QualityAgent(provider=mock_provider, semantic_cache=SemanticCache())
+
+        await agent.analyze(make_article(), TopicConfig(name="AI"))
+        await agent.analyze(make_article(), TopicConfig(name="Finance"))
+
+        assert mock_provider.complete.await_count == 2
+
+
+# ============================================================================
+# Quality Agent Rate Limit Tests
+# ============================================================================
+
+
+class TestQualityAgentRateLimit:
+    """Tests for rate-limited batch analysis."""
+
+    @pytest.fixture
+    def mock_provider(self):
+        """Create a mock LLM provider."""
+        provider = MagicMock()
+        provider.complete = AsyncMock(return_value=_make_response({
+            "relevance_score": 0.8,
+            "quality_score": 0.75,
+        }))
+        provider.get_stats = MagicMock(return_value={})
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_limiter_acquired_per_request(self, mock_provider, make_article):
+        """Test that each LLM call takes budget for its expected tokens."""
+        limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=1_000_000)
+        agent = QualityAgent(provider=mock_provider, rate_limiter=limiter)
+
+        await agent.batch_analyze([make_article(), make_article()])
+
+        assert mock_provider.complete.await_count == 2
+        # Both requests drew budget, system prompt included (allowing for a
+        # few ms of refill)
+        system_tokens = len(ANALYSIS_SYSTEM_PROMPT) // CHARS_PER_TOKEN
+        assert limiter._requests < 599
+        assert limiter._tokens < 1_000_000 - 2 * (1000 + system_tokens) + 500
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_pauses_and_retries(self, mock_provider, make_article):
+        """Test that a 429 pauses the limiter and the request is retried."""
+        response = mock_provider.complete.return_value
+        mock_provider.complete.side_effect = [
+            RateLimitError("slow down", provider="test", retry_after=0.01),
+            response,
+        ]
+        limiter = RateLimiter(requests_per_minute=600)
+        agent = QualityAgent(provider=mock_provider, rate_limiter=limiter)
+
+        analysis = await agent.analyze(make_article())
+
+        assert analysis.quality_score == 0.75
+        assert mock_provider.complete.await_count == 2
+        assert agent.get_stats()["rate_limit_retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_without_limiter_raises(self, mock_provider, make_article):
+        """Test that agents without a limiter leave retries to the provider."""
+        mock_provider.complete.side_effect = RateLimitError("slow down", provider="test")
+        agent = QualityAgent(provider=mock_provider)
+
+        with pytest.raises(RateLimitError):
+            await agent.analyze(make_article())
+        mock_provider.complete.assert_awaited_once()
+
+
+# ============================================================================
+# Quality Agent Quick Filter Tests
+# ============================================================================
+
+
+class TestQuickFilter:
+    """Tests for the lexical pre-check in quick_filter."""
+
+    @pytest.fixture
+    def mock_provider(self):
+        """Create a mock LLM provider answering yes."""
+        provider = MagicMock()
+        provider.complete = AsyncMock(return_value=LLMResponse(
+            content="yes",
+            model="test-model",
+            provider="test",
+            input_tokens=10,
+            output_tokens=1,
+            cost_usd=0.0001,
+            response_time_seconds=0.1,
+        ))
+        return provider
+
+    @pytest.fixture
+    def config(self):
+        """Topic config with keywords and exclusions."""
+        return TopicConfig(name="AI", keywords=["LLM", "C++"], exclude_keywords=["crypto"])
+
+    @pytest.mark.asyncio
+    async def test_excluded_keyword_rejects_locally(self, mock_provider, config, make_article):
+        """Test that an excluded keyword skips the LLM."""
+        agent = QualityAgent(provider=mock_provider)
+        article = make_article(title="LLM agents for crypto trading")
+
+        assert not await agent.quick_filter(article, config)
+        mock_provider.complete.assert_not_awaited()
+        assert agent.get_stats()["quick_filter_lexical"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_keyword_rejects_locally(self, mock_provider, config, make_article):
+        """Test that an article without any topic keyword skips the LLM."""
+        agent = QualityAgent(provider=mock_provider)
+        article = make_article(title="Local bakery wins award", content="Bread news.")
+
+        assert not await agent.quick_filter(article, config)
+        mock_provider.complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_keyword_match_asks_llm(self, mock_provider, config, make_article):
+        """Test that keyword matches (including plurals and symbols) go to the LLM."""
+        agent = QualityAgent(provider=mock_provider)
+
+        assert await agent.quick_filter(make_article(title="Open LLMs catch up"), config)
+        assert await agent.quick_filter(make_article(title="Modern c++ tooling"), config)
+        assert mock_provider.complete.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_keyword_inside_longer_word_asks_llm(self, mock_provider, make_article):
+        """Test that keywords match as substrings, e.g. "AI" in "OpenAI"."""
+        agent = QualityAgent(provider=mock_provider)
+        config = TopicConfig(name="AI", keywords=["AI"])
+
+        assert await agent.quick_filter(make_article(title="OpenAI ships GPT-5"), config)
+        assert await agent.quick_filter(make_article(title="GenAI budgets grow"), config)
+        assert mock_provider.complete.await_count == 2
+
+    def test_exclusions_match_whole_words(self, config):
+        """Test that excluded keywords don't match inside longer words."""
+        assert config.exclude_pattern.search("cryptography basics") is None
+        assert config.exclude_pattern.search("Crypto markets") is not None
+
+    def test_patterns_compiled_once(self, config):
+        """Test that each keyword list is compiled once."""
+        assert config.keyword_pattern is config.keyword_pattern
+        assert TopicConfig(name="Empty").keyword_pattern is None
@@ -0,0 +1,62 @@
+"""
+Tests for the near-duplicate result cache.
+"""
+
+from src.agents.tier2_reasoning.semantic_cache import SemanticCache
+
+
+STORY = (
+    "OpenAI released GPT-5 on Tuesday, claiming large gains on reasoning "
+    "benchmarks and lower inference costs for developers. The model ships "
+    "to paying subscribers first, with API access following next month."
+)
+
+
+class TestSemanticCache:
+    """Tests for exact and near-duplicate lookup."""
+
+    def test_exact_hit(self, make_article):
+        """Test that the same article returns the stored value."""
+        cache = SemanticCache()
+        cache.set(make_article(source="a.com", content=STORY), "result")
+
+        assert cache.get(make_article(source="a.com", content=STORY)) == "result"
+
+    def test_near_duplicate_hit(self, make_article):
+        """Test that a syndicated copy with minor edits hits."""
+        cache = SemanticCache()
+        cache.set(make_article(source="a.com", content=STORY), "result")
+
+        copy = make_article(source="b.com", content=STORY + " Reporting by staff.")
+
+        assert cache.get(copy) == "result"
+
+    def test_different_story_misses(self, make_article):
+        """Test that an unrelated article misses."""
+        cache = SemanticCache()
+        cache.set(make_article(source="a.com", content=STORY), "result")
+
+        other = make_article(
+            source="b.com",
+            title="Fed holds rates",
+            content="The Federal Reserve held interest rates steady, citing inflation.",
+        )
+
+        assert cache.get(other) is None
+
+    def test_scope_isolates_entries(self, make_article):
+        """Test that results are only reused within the same scope."""
+        cache = SemanticCache()
+        cache.set(make_article(source="a.com", content=STORY), "ai", scope="AI")
+
+        assert cache.get(make_article(source="a.com", content=STORY), scope="Finance") is None
+        assert cache.get(make_article(source="b.com", content=STORY), scope="Finance") is None
+
+    def test_evicts_oldest(self, make_article):
+        """Test that the cache stays bounded."""
+        cache = SemanticCache(max_entries=2)
+        for i in range(3):
+            cache.set(make_article(source="a.com", content=f"story {i} " * 5, title=f"t{i}"), i)
+
+        assert len(cache) == 2
+        assert cache.get(make_article(source="a.com", content="story 0 " * 5, title="t0")) is None
@@ -0,0 +1,99 @@
+"""
+Tests for Synthesis Agent.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from src.agents.tier2_reasoning import synthesis_agent
+from src.agents.tier2_reasoning.synthesis_agent import SynthesisAgent
+from src.models.article import DigestMetadata, ParsedArticle
+
+
+def _make_article(topic: str) -> ParsedArticle:
+    """Helper to create test articles."""
+    return ParsedArticle(
+        article_id=f"{topic}-001",
+        url=f"https://example.com/{topic}",
+        title=f"{topic} news",
+        content=f"Content about {topic}.",
+        source="example.com",
+    )
+
+
+def _make_metadata() -> DigestMetadata:
+    """Helper to create digest metadata."""
+    return DigestMetadata(
+        digest_id="2025-01-01",
+        generated_at=datetime(2025, 1, 1),
+        topics_covered=[],
+        total_articles_found=0,
+        total_articles_parsed=0,
+        total_articles_analyzed=0,
+        total_articles_included=0,
+        total_tokens_used=0,
+        total_cost_usd=0.0,
+    )
+
+
+def _make_agent() -> SynthesisAgent:
+    """Create a Synthesis Agent without a real MCP server."""
+    with patch.object(synthesis_agent, "get_tier2_server", return_value=MagicMock()):
+        return SynthesisAgent()
+
+
+class TestCreateDigest:
+    """Tests for concurrent topic section synthesis."""
+
+    @pytest.fixture
+    def agent(self):
+        """Create a Synthesis Agent with a stubbed section writer."""
+        agent = _make_agent()
+
+        in_flight = {"now": 0, "max": 0}
+
+        async def fake_section(topic_name, articles, user_preferences):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            # Earlier topics finish last, so ordering must come from gather
+            await asyncio.sleep(0.01 * (10 - len(topic_name)))
+            in_flight["now"] -= 1
+            return f"## {topic_name}"
+
+        agent._synthesize_topic_section = fake_section
+        agent.in_flight = in_flight
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_sections_keep_topic_order(self, agent):
+        """Test that sections appear in topic order, skipping empty topics."""
+        topics = {"a": [_make_article("a")], "bb": [], "ccc": [_make_article("ccc")]}
+
+        digest = await agent.create_digest(topics, {}, _make_metadata())
+
+        assert digest.index("## a") < digest.index("## ccc")
+        assert "## bb" not in digest
+
+    @pytest.mark.asyncio
+    async def test_stream_matches_create_digest(self, agent):
+        """Test that streamed chunks join to the buffered digest, header first."""
+        topics = {"a": [_make_article("a")], "ccc": [_make_article("ccc")]}
+
+        chunks = [c async for c in agent.stream_digest(topics, {}, _make_metadata())]
+        digest = await agent.create_digest(topics, {}, _make_metadata())
+
+        assert chunks[0].startswith("# Daily Tech Digest")
+        assert len(chunks) == 4
+        assert "".join(chunks) == digest
+
+    @pytest.mark.asyncio
+    async def test_sections_run_concurrently_within_limit(self, agent):
+        """Test that sections overlap but stay within the concurrency cap."""
+        topics = {"t" * i: [_make_article(f"t{i}")] for i in range(1, 9)}
+
+        await agent.create_digest(topics, {}, _make_metadata())
+
+        assert agent.in_flight["max"] == synthesis_agent.MAX_CONCURRENT_SECTIONS
+
@@ -6,10 +6,34 @@ import pytest
 from datetime import datetime, timedelta
 import json
 import asyncio
+import dataclasses
+import contextlib
 import uuid
-import hashlib
-
-from src.database.sqlite import SQLiteDatabase
+from pathlib import Path
+import sqlite3
+import subprocess
+import sys
+import time
+
+import aiosqlite
+
+from src.database import sqlite as sqlite_module
+from src.database import factory as factory_module
+from src.database.base import DatabaseInterface, DatabaseType
+from src.database.factory import (
+    apply_schema,
+    create_sqlite_database,
+    get_d1_schema,
+    get_d1_statements,
+    get_database,
+)
+from src.database.sqlite import (
+    INSERT_ARTICLE_SQL,
+    SCHEMA_SQL,
+    STATEMENT_CACHE_SIZE,
+    USER_DIGESTS_BEFORE_SQL,
+    SQLiteDatabase,
+)
 from src.database.base import (
     User,
     DigestRecord,
@@ -31,6 +55,82 @@ def temp_db_path(tmp_path):
     return str(tmp_path / "test.db")
 
 
+# ============================================================================
+# Record Row Conversion Tests
+# ============================================================================
+
+
+class TestRecordRows:
+    """Tests for record <-> table row conversion."""
+
+    def test_article_round_trip(self):
+        """Test that an article survives to_row/from_row."""
+        article = ArticleRecord(
+            id="row-1",
+            url="https://example.com/row",
+            title="Row",
+            source="example.com",
+            content_hash=ArticleRecord.hash_content("Row"),
+            first_seen_at=datetime(2025, 1, 1, 12, 0),
+            published_date=None,
+            quality_score=0.7,
+        )
+        assert ArticleRecord.from_row(article.to_row()) == article
+
+    def test_usage_round_trip(self):
+        """Test that usage survives to_row/from_row."""
+        usage = UsageRecord(id="u-1", user_id="user", month="2025-01", input_tokens=10)
+        assert UsageRecord.from_row(usage.to_row()) == usage
+
+    def test_malformed_optional_datetime_ignored(self):
+        """Test that a bad optional timestamp reads as None."""
+        row = ("user-1", "a@example.com", 1735689600000, "free", "{}", "not-a-date")
+        assert User.from_row(row).last_digest_at is None
+
+    def test_timestamps_stored_as_epoch_ms(self):
+        """Test that datetimes become integer milliseconds and back."""
+        created = datetime(2025, 1, 1, 12, 0, 0, 250000)
+        row = User(id="u", email="e", created_at=created).to_row()
+
+        assert row[2] == round(created.timestamp() * 1000)
+        assert User.from_row(row).created_at == created
+
+    @pytest.mark.parametrize(
+        "record, table",
+        [
+            (User, "users"),
+            (DigestRecord, "digests"),
+            (ArticleRecord, "articles"),
+            (FeedbackRecord, "feedback"),
+            (UsageRecord, "usage"),
+        ],
+    )
+    def test_fields_match_table_columns(self, record, table):
+        """Test that field order matches the table, which to_row/from_row rely on."""
+        conn = sqlite3.connect(":memory:")
+        conn.executescript(SCHEMA_SQL)
+        columns = tuple(row[1] for row in conn.execute(f"PRAGMA table_info({table})"))
+        conn.close()
+
+        assert tuple(f.name for f in dataclasses.fields(record)) == columns
+
+    def test_records_are_frozen_and_hashable(self):
+        """Test that records are immutable values usable as set members."""
+        created = datetime(2025, 1, 1)
+        user = User(id="u", email="e", created_at=created)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            user.email = "other"
+        with pytest.raises(TypeError):
+            User("u", "e", created)  # keyword-only
+        assert len({user, User(id="u", email="e", created_at=created)}) == 1
+
+    def test_records_use_slots(self):
+        """Test that records don't carry a per-instance __dict__."""
+        user = User(id="u", email="e", created_at=datetime.now())
+        assert not hasattr(user, "__dict__")
+
+
 # ============================================================================
 # Database Initialization Tests
 # ============================================================================
@@ -62,6 +162,62 @@ class TestSQLiteInit:
 
         await db.close()
 
+    @pytest.mark.asyncio
+    async def test_factory_checks_interface(self):
+        """Test that the factory returns a conforming, initialized database."""
+        db = await get_database(DatabaseType.MEMORY)
+        try:
+            assert isinstance(db, DatabaseInterface)
+            assert DatabaseInterface not in type(db).__mro__  # structural, not inherited
+        finally:
+            await db.close()
+
+    def test_nonconforming_database_rejected(self):
+        """Test that an object missing interface methods is refused."""
+        with pytest.raises(TypeError, match="does not implement DatabaseInterface"):
+            factory_module._checked(object())
+
+    @pytest.mark.asyncio
+    async def test_context_manager(self, temp_db_path):
+        """Test that async with initializes and closes the database."""
+        async with SQLiteDatabase(temp_db_path) as db:
+            assert db._initialized
+        assert not db._initialized
+
+    @pytest.mark.asyncio
+    async def test_apply_schema_is_all_or_nothing(self):
+        """Test that a failing schema script leaves nothing behind."""
+        conn = await aiosqlite.connect(":memory:")
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                await apply_schema(conn, "CREATE TABLE t (x); CREATE TABLE t (x);")
+            cursor = await conn.execute("SELECT name FROM sqlite_master WHERE name = 't'")
+            assert await cursor.fetchone() is None
+        finally:
+            await conn.close()
+
+    def test_d1_statements_match_script(self):
+        """Test that the split D1 statements build the same schema as the script."""
+        statements = get_d1_statements()
+        assert all(sqlite3.complete_statement(statement) for statement in statements)
+        assert get_d1_statements() is statements
+
+        def schema(apply):
+            conn = sqlite3.connect(":memory:")
+            try:
+                apply(conn)
+                return conn.execute(
+                    "SELECT type, name FROM sqlite_master ORDER BY type, name"
+                ).fetchall()
+            finally:
+                conn.close()
+
+        def run_each(conn):
+            for statement in statements:
+                conn.execute(statement)
+
+        assert schema(run_each) == schema(lambda conn: conn.executescript(get_d1_schema()))
+
     @pytest.mark.asyncio
     async def test_init_creates_indexes(self, temp_db_path):
         """Test that initialization creates indexes."""
@@ -78,6 +234,129 @@ class TestSQLiteInit:
         await db.close()
         assert len(indexes) > 0
 
+    @pytest.mark.asyncio
+    async def test_init_migrates_legacy_column_types(self, temp_db_path):
+        """Test that TEXT timestamps and hashes are rewritten as epoch ms and bytes."""
+        legacy_schema = SCHEMA_SQL.replace("content_hash BLOB", "content_hash TEXT")
+        for column in ("created_at", "generated_at", "period_start", "period_end",
+                       "first_seen_at", "published_date", "last_digest_at"):
+            legacy_schema = legacy_schema.replace(f"{column} INTEGER", f"{column} TEXT")
+        seen = datetime(2025, 1, 2, 3, 4, 5)
+
+        conn = sqlite3.connect(temp_db_path)
+        try:
+            conn.executescript(legacy_schema)
+            conn.execute(
+                "INSERT INTO users (id, email, created_at) VALUES (?, ?, ?)",
+                ("user-1", "a@example.com", seen.isoformat()),
+            )
+            conn.execute(
+                "INSERT INTO digests (id, user_id, generated_at, period_start, period_end, "
+                "frequency) VALUES (?, ?, ?, ?, ?, ?)",
+                ("digest-1", "user-1", seen.isoformat(), seen.isoformat(), seen.isoformat(),
+                 "daily"),
+            )
+            conn.execute(
+                "INSERT INTO articles (id, url, title, source, content_hash, first_seen_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                ("a-1", "https://example.com/a", "Legacy story", "example.com", "ab12",
+                 seen.isoformat()),
+            )
+            conn.execute(
+                "INSERT INTO feedback (id, user_id, digest_id, feedback_type, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ("f-1", "user-1", "digest-1", "like", seen.isoformat()),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        db = SQLiteDatabase(temp_db_path)
+        try:
+            await db.initialize()
+            user = await db.get_user("user-1")
+            digest = await db.get_digest("digest-1")
+            article = await db.get_article("a-1")
+            feedback = await db.get_user_feedback("user-1")
+            found = await db.search_articles(query="legacy")
+            conn = await db._get_db()
+            cursor = await conn.execute("SELECT typeof(first_seen_at) FROM articles")
+            stored_type = (await cursor.fetchone())[0]
+            await cursor.close()
+        finally:
+            await db.close()
+
+        assert stored_type == "integer"
+        assert user.created_at == seen
+        assert digest.period_end == seen
+        assert article.first_seen_at == seen
+        assert article.content_hash == bytes.fromhex("ab12")
+        assert [f.created_at for f in feedback] == [seen]
+        assert [a.id for a in found] == ["a-1"]
+
+    @pytest.mark.asyncio
+    async def test_init_replaces_single_column_indexes(self, temp_db_path):
+        """Test that composite indexes replace the old single-column ones."""
+        db = SQLiteDatabase(temp_db_path)
+        await db.initialize()
+        await db.close()
+
+        conn = sqlite3.connect(temp_db_path)
+        try:
+            conn.executescript(
+                """
+                CREATE INDEX idx_articles_source ON articles(source);
+                CREATE INDEX idx_articles_topic ON articles(topic);
+                CREATE INDEX idx_articles_url ON articles(url);
+                CREATE INDEX idx_articles_topic_source_quality
+                    ON articles(topic, source, quality_score);
+                """
+            )
+        finally:
+            conn.close()
+
+        db = SQLiteDatabase(temp_db_path)
+        try:
+            await db.initialize()
+            conn = await db._get_db()
+            cursor = await conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+            indexes = {row[0] for row in await cursor.fetchall()}
+            await cursor.close()
+        finally:
+            await db.close()
+
+        assert "idx_articles_source" not in indexes
+        assert "idx_articles_topic" not in indexes
+        assert "idx_articles_url" not in indexes  # url's UNIQUE index covers it
+        assert "idx_articles_topic_source_quality" not in indexes
+        assert "idx_articles_topic_seen" in indexes
+
+    @pytest.mark.asyncio
+    async def test_init_analyzes_and_search_uses_composite_index(self, temp_db_path):
+        """Test that ANALYZE runs and filtered searches use the composite index."""
+        db = SQLiteDatabase(temp_db_path)
+        try:
+            await db.initialize()
+            conn = await db._get_db()
+            cursor = await conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            )
+            analyzed = await cursor.fetchone()
+            await cursor.close()
+            # The statement search_articles issues for topic + source + min_quality
+            cursor = await conn.execute(
+                "EXPLAIN QUERY PLAN " + sqlite_module._search_sql(True, 0, True, True, True),
+                ("AI", "%example%", 0.5, 10),
+            )
+            plan = " ".join(str(row[-1]) for row in await cursor.fetchall())
+            await cursor.close()
+        finally:
+            await db.close()
+
+        assert analyzed is not None
+        assert "idx_articles_topic_seen" in plan
+        assert "TEMP B-TREE" not in plan  # rows come off the index already ordered
+
     @pytest.mark.asyncio
     async def test_init_is_idempotent(self, temp_db_path):
         """Test that initialization can be called multiple times."""
@@ -86,6 +365,60 @@ class TestSQLiteInit:
         await db.initialize()  # Should not raise
         await db.close()
 
+    @pytest.mark.asyncio
+    async def test_connection_pragmas_applied(self, temp_db_path):
+        """Test that connections are tuned for WAL by default."""
+        db = SQLiteDatabase(temp_db_path)
+        await db.initialize()
+
+        conn = await db._get_db()
+        values = {}
+        for pragma in ("journal_mode", "synchronous", "cache_size", "busy_timeout", "foreign_keys"):
+            cursor = await conn.execute(f"PRAGMA {pragma}")
+            values[pragma] = (await cursor.fetchone())[0]
+            await cursor.close()
+        await db.close()
+
+        assert values == {
+            "journal_mode": "wal",
+            "synchronous": 1,  # NORMAL
+            "cache_size": -64000,
+            "busy_timeout": 5000,
+            "foreign_keys": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_factory_passes_tuning(self, temp_db_path):
+        """Test that create_sqlite_database forwards tuning options."""
+        db = create_sqlite_database(temp_db_path, journal_mode="DELETE")
+        await db.initialize()
+
+        conn = await db._get_db()
+        cursor = await conn.execute("PRAGMA journal_mode")
+        mode = (await cursor.fetchone())[0]
+        await cursor.close()
+        await db.close()
+
+        assert mode == "delete"
+
+    def test_d1_path_does_not_load_aiosqlite(self):
+        """Test that the package and D1 schema load without the SQLite backend."""
+        code = (
+            "import sys\n"
+            "import src.database\n"
+            "from src.database.factory import get_d1_statements\n"
+            "get_d1_statements()\n"
+            "assert 'aiosqlite' not in sys.modules\n"
+            "assert src.database.SQLiteDatabase.__name__ == 'SQLiteDatabase'\n"
+            "assert 'aiosqlite' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[2])
+
+    def test_rejects_invalid_pragma_values(self, temp_db_path):
+        """Test that PRAGMA values can't carry SQL."""
+        with pytest.raises(ValueError):
+            SQLiteDatabase(temp_db_path, journal_mode="WAL; DROP TABLE users")
+
 
 # ============================================================================
 # User Operations Tests
@@ -171,8 +504,11 @@ class TestUserOperations:
         await db.create_user(user)
 
         # Update preferences
-        user.preferences_json = json.dumps({"topics": ["AI", "Science"], "frequency": "daily"})
-        user.subscription_tier = "basic"
+        user = dataclasses.replace(
+            user,
+            preferences_json=json.dumps({"topics": ["AI", "Science"], "frequency": "daily"}),
+            subscription_tier="basic",
+        )
         await db.update_user(user)
 
         found = await db.get_user("user-005")
@@ -214,6 +550,56 @@ class TestUserOperations:
         with pytest.raises(DuplicateError):
             await db.create_user(user2)
 
+    @pytest.mark.asyncio
+    async def test_repeat_lookups_skip_the_database(self, db, monkeypatch):
+        """Test that a cached user is served without a reader round-trip."""
+        await db.create_user(User(id="hot", email="hot@example.com", created_at=datetime.now()))
+        assert (await db.get_user("hot")).email == "hot@example.com"
+        assert (await db.get_user_by_email("hot@example.com")).id == "hot"
+
+        def no_reader():
+            raise AssertionError("cache miss")
+
+        monkeypatch.setattr(db._pool, "reader", no_reader)
+        cached = await db.get_user("hot")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cached.subscription_tier = "pro"  # shared, so it must not change
+
+        assert await db.get_user("hot") is cached
+        assert (await db.get_user_by_email("hot@example.com")).id == "hot"
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cached_user(self, db):
+        """Test that update and delete are visible to the next lookup."""
+        user = User(id="edit", email="old@example.com", created_at=datetime.now())
+        await db.create_user(user)
+        await db.get_user("edit")
+        await db.get_user_by_email("old@example.com")
+
+        await db.update_user(dataclasses.replace(user, email="new@example.com"))
+        assert (await db.get_user("edit")).email == "new@example.com"
+        assert await db.get_user_by_email("old@example.com") is None
+
+        await db.delete_user("edit")
+        assert await db.get_user("edit") is None
+        assert await db.get_user_by_email("new@example.com") is None
+
+    @pytest.mark.asyncio
+    async def test_cached_user_expires(self, db, monkeypatch):
+        """Test that entries expire so other processes' writes show up."""
+        await db.create_user(User(id="ttl", email="ttl@example.com", created_at=datetime.now()))
+        await db.get_user("ttl")
+
+        # Another process upgrades the user behind this one's back
+        async with db._pool.writer() as conn:
+            await conn.execute("UPDATE users SET subscription_tier = 'pro' WHERE id = 'ttl'")
+            await conn.commit()
+        assert (await db.get_user("ttl")).subscription_tier == "free"
+
+        now = time.monotonic()
+        monkeypatch.setattr(sqlite_module.time, "monotonic", lambda: now + 61)
+        assert (await db.get_user("ttl")).subscription_tier == "pro"
+
 
 # ============================================================================
 # Digest Operations Tests
@@ -255,6 +641,25 @@ class TestDigestOperations:
         assert result.id == "digest-001"
         assert result.article_count == 10
 
+    @pytest.mark.asyncio
+    async def test_save_digests_batch(self, db):
+        """Test saving several digests at once."""
+        digests = [
+            DigestRecord(
+                id=f"batch-digest-{i}",
+                user_id="test-user",
+                generated_at=datetime.now() - timedelta(days=i),
+                period_start=datetime.now() - timedelta(days=i + 1),
+                period_end=datetime.now() - timedelta(days=i),
+                frequency="daily",
+            )
+            for i in range(3)
+        ]
+        result = await db.save_digests(digests)
+
+        assert result == digests
+        assert len(await db.get_user_digests("test-user")) == 3
+
     @pytest.mark.asyncio
     async def test_get_digest(self, db):
         """Test getting a digest by ID."""
@@ -302,13 +707,91 @@ class TestDigestOperations:
             )
             await db.save_digest(digest)
 
-        page1 = await db.get_user_digests("test-user", limit=5, offset=0)
-        page2 = await db.get_user_digests("test-user", limit=5, offset=5)
+        page1 = await db.get_user_digests("test-user", limit=5)
+        last = page1[-1]
+        page2 = await db.get_user_digests(
+            "test-user", limit=5, before=last.generated_at, before_id=last.id
+        )
 
         assert len(page1) == 5
         assert len(page2) == 5
-        # Should be different digests
-        assert page1[0].id != page2[0].id
+        # Should be different digests, continuing in date order
+        assert not {d.id for d in page1} & {d.id for d in page2}
+        assert page1[-1].generated_at > page2[0].generated_at
+
+    @pytest.mark.asyncio
+    async def test_get_user_digests_pages_through_ties(self, db):
+        """Test that digests sharing a timestamp are split across pages by id."""
+        generated_at = datetime.now()
+        for i in range(6):
+            await db.save_digest(
+                DigestRecord(
+                    id=f"tie-digest-{i:03d}",
+                    user_id="test-user",
+                    generated_at=generated_at,
+                    period_start=generated_at,
+                    period_end=generated_at,
+                    frequency="daily",
+                )
+            )
+
+        seen = []
+        before = before_id = None
+        while page := await db.get_user_digests(
+            "test-user", limit=4, before=before, before_id=before_id
+        ):
+            seen.extend(d.id for d in page)
+            before, before_id = page[-1].generated_at, page[-1].id
+
+        assert seen == [f"tie-digest-{i:03d}" for i in reversed(range(6))]
+
+    @pytest.mark.asyncio
+    async def test_get_user_digests_seeks_index(self, db):
+        """Test that keyset pages seek the digest index without sorting."""
+        async with db._pool.reader() as conn:
+            cursor = await conn.execute(
+                "EXPLAIN QUERY PLAN " + USER_DIGESTS_BEFORE_SQL, ("test-user", 0, "", 10)
+            )
+            plan = " ".join(str(row[-1]) for row in await cursor.fetchall())
+            await cursor.close()
+
+        assert "idx_digests_user_page" in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.asyncio
+    async def test_get_user_digests_without_markdown(self, db):
+        """Test that listings can skip digest bodies while keeping metadata."""
+        generated_at = datetime.now()
+        for i in range(3):
+            await db.save_digest(
+                DigestRecord(
+                    id=f"body-digest-{i:03d}",
+                    user_id="test-user",
+                    generated_at=generated_at + timedelta(seconds=i),
+                    period_start=generated_at,
+                    period_end=generated_at,
+                    frequency="daily",
+                    markdown="# Digest\n" + "x" * 100_000,
+                    article_count=i,
+                    cost_usd=0.01,
+                )
+            )
+
+        listing = await db.get_user_digests("test-user", include_markdown=False)
+        page = await db.get_user_digests(
+            "test-user",
+            limit=1,
+            before=listing[0].generated_at,
+            before_id=listing[0].id,
+            include_markdown=False,
+        )
+        full = await db.get_digest("body-digest-002")
+
+        assert [d.id for d in listing] == [f"body-digest-{i:03d}" for i in (2, 1, 0)]
+        assert all(d.markdown == "" for d in listing + page)
+        assert [d.article_count for d in listing] == [2, 1, 0]
+        assert page[0].id == "body-digest-001"
+        assert full.markdown.startswith("# Digest") and len(full.markdown) > 100_000
 
     @pytest.mark.asyncio
     async def test_get_latest_digest(self, db):
@@ -385,25 +868,30 @@ class TestArticleOperations:
         yield db
         await db.close()
 
-    def _make_article(self, article_id: str, url: str, title: str = "Test Article") -> ArticleRecord:
-        """Helper to create article records."""
+    def _make_article(
+        self, article_id: str, url: str, title: str = "Test Article", **fields
+    ) -> ArticleRecord:
+        """Helper to create article records (``fields`` override the defaults)."""
         return ArticleRecord(
             id=article_id,
             url=url,
             title=title,
-            source="example.com",
-            content_hash=hashlib.md5(url.encode()).hexdigest(),
-            first_seen_at=datetime.now(),
-            quality_score=0.78,
-            relevance_score=0.85,
+            **{
+                "source": "example.com",
+                "content_hash": ArticleRecord.hash_content(url),
+                "first_seen_at": datetime.now(),
+                "quality_score": 0.78,
+                "relevance_score": 0.85,
+                **fields,
+            },
         )
 
     @pytest.mark.asyncio
     async def test_save_article(self, db):
         """Test saving an article record."""
-        article = self._make_article("article-001", "https://example.com/article")
-        article.relevance_score = 0.85
-        article.quality_score = 0.78
+        article = self._make_article(
+            "article-001", "https://example.com/article", relevance_score=0.85, quality_score=0.78
+        )
 
         result = await db.save_article(article)
         assert result.id == "article-001"
@@ -412,8 +900,7 @@ class TestArticleOperations:
     @pytest.mark.asyncio
     async def test_get_article(self, db):
         """Test getting an article by ID."""
-        article = self._make_article("article-002", "https://example.com/2")
-        article.title = "Article 2"
+        article = self._make_article("article-002", "https://example.com/2", "Article 2")
         await db.save_article(article)
 
         found = await db.get_article("article-002")
@@ -430,12 +917,92 @@ class TestArticleOperations:
         assert found is not None
         assert found.id == "article-003"
 
+    @pytest.mark.asyncio
+    async def test_get_articles_by_urls(self, db):
+        """Test bulk URL lookup returns only stored articles, keyed by URL."""
+        await db.save_articles([
+            self._make_article(f"bulk-{i}", f"https://example.com/bulk/{i}") for i in range(3)
+        ])
+
+        found = await db.get_articles_by_urls([
+            "https://example.com/bulk/0",
+            "https://example.com/bulk/2",
+            "https://example.com/bulk/2",
+            "https://example.com/missing",
+        ])
+
+        assert sorted(found) == ["https://example.com/bulk/0", "https://example.com/bulk/2"]
+        assert found["https://example.com/bulk/2"].id == "bulk-2"
+
+    @pytest.mark.asyncio
+    async def test_get_articles_by_urls_batches(self, db, monkeypatch):
+        """Test that large lookups are split across IN (...) batches."""
+        monkeypatch.setattr(sqlite_module, "URL_BATCH_SIZE", 2)
+        await db.save_articles([
+            self._make_article(f"batched-{i}", f"https://example.com/batched/{i}")
+            for i in range(5)
+        ])
+
+        found = await db.get_articles_by_urls(
+            [f"https://example.com/batched/{i}" for i in range(5)]
+        )
+
+        assert len(found) == 5
+        assert await db.get_articles_by_urls([]) == {}
+
+    @pytest.mark.asyncio
+    async def test_get_article_by_content_hash(self, db):
+        """Test dedup lookup by raw content digest."""
+        article = self._make_article(
+            "hash-1",
+            "https://example.com/hash",
+            content_hash=ArticleRecord.hash_content("same body"),
+        )
+        await db.save_article(article)
+
+        found = await db.get_article_by_content_hash(ArticleRecord.hash_content("same body"))
+        assert found is not None
+        assert found.id == "hash-1"
+        assert len(found.content_hash) == 32
+        assert await db.get_article_by_content_hash(ArticleRecord.hash_content("other")) is None
+
+    @pytest.mark.asyncio
+    async def test_articles_existing_hashes(self, db, monkeypatch):
+        """Test bulk dedup returns only stored digests, across IN (...) batches."""
+        monkeypatch.setattr(sqlite_module, "URL_BATCH_SIZE", 2)
+        await db.save_articles([
+            self._make_article(
+                f"dedup-{i}",
+                f"https://example.com/dedup/{i}",
+                content_hash=ArticleRecord.hash_content(f"body {i}"),
+            )
+            for i in range(3)
+        ])
+        stored = {ArticleRecord.hash_content(f"body {i}") for i in range(3)}
+        candidates = [ArticleRecord.hash_content(f"body {i}") for i in range(5)]
+
+        assert await db.articles_existing_hashes(candidates + candidates[:1]) == stored
+        assert await db.articles_existing_hashes([]) == set()
+
+    @pytest.mark.asyncio
+    async def test_articles_existing_hashes_uses_index(self, db):
+        """Test that the existence check is answered from the content_hash index."""
+        async with db._pool.reader() as conn:
+            cursor = await conn.execute(
+                "EXPLAIN QUERY PLAN " + sqlite_module._hashes_sql(2), (b"a", b"b")
+            )
+            plan = " ".join(str(row[-1]) for row in await cursor.fetchall())
+            await cursor.close()
+
+        assert "COVERING INDEX idx_articles_content_hash" in plan
+
     @pytest.mark.asyncio
     async def test_search_articles_by_topic(self, db):
         """Test searching articles by topic."""
         for i in range(3):
-            article = self._make_article(f"topic-article-{i}", f"https://example.com/topic/{i}")
-            article.topic = "AI"
+            article = self._make_article(
+                f"topic-article-{i}", f"https://example.com/topic/{i}", topic="AI"
+            )
             await db.save_article(article)
 
         results = await db.search_articles(topic="AI")
@@ -444,8 +1011,9 @@ class TestArticleOperations:
     @pytest.mark.asyncio
     async def test_search_articles_by_source(self, db):
         """Test searching articles by source."""
-        article = self._make_article("source-article", "https://techcrunch.com/story")
-        article.source = "techcrunch.com"
+        article = self._make_article(
+            "source-article", "https://techcrunch.com/story", source="techcrunch.com"
+        )
         await db.save_article(article)
 
         results = await db.search_articles(source="techcrunch")
@@ -454,38 +1022,278 @@ class TestArticleOperations:
     @pytest.mark.asyncio
     async def test_search_articles_by_quality(self, db):
         """Test searching articles by minimum quality."""
-        low_quality = self._make_article("low-quality", "https://example.com/low")
-        low_quality.quality_score = 0.3
+        low_quality = self._make_article(
+            "low-quality", "https://example.com/low", quality_score=0.3
+        )
         await db.save_article(low_quality)
 
-        high_quality = self._make_article("high-quality", "https://example.com/high")
-        high_quality.quality_score = 0.9
+        high_quality = self._make_article(
+            "high-quality", "https://example.com/high", quality_score=0.9
+        )
         await db.save_article(high_quality)
 
         results = await db.search_articles(min_quality=0.7)
         assert len(results) == 1
         assert results[0].id == "high-quality"
 
+    @pytest.mark.asyncio
+    async def test_search_articles_full_text(self, db):
+        """Test that queries match title words and word prefixes."""
+        await db.save_articles([
+            self._make_article("fts-1", "https://example.com/fts/1", "Quantum computing leap"),
+            self._make_article("fts-2", "https://example.com/fts/2", "New battery chemistry"),
+        ])
+
+        assert [a.id for a in await db.search_articles(query="quantum")] == ["fts-1"]
+        assert [a.id for a in await db.search_articles(query="batt chem")] == ["fts-2"]
+        assert [a.id for a in await db.search_articles(query="computers")] == ["fts-1"]
+        assert await db.search_articles(query="quantum battery") == []
+
+    @pytest.mark.asyncio
+    async def test_search_articles_full_text_with_filters(self, db):
+        """Test that the text match combines with the other filters."""
+        low = self._make_article(
+            "fts-low", "https://example.com/fts/low", "Fusion update", quality_score=0.2
+        )
+        high = self._make_article(
+            "fts-high", "https://example.com/fts/high", "Fusion milestone", quality_score=0.9
+        )
+        await db.save_articles([low, high])
+
+        results = await db.search_articles(query="fusion", min_quality=0.5)
+        assert [a.id for a in results] == ["fts-high"]
+
+    @pytest.mark.asyncio
+    async def test_search_reuses_statement_per_filter_combination(self, db):
+        """Test that searches with the same filters issue the identical SQL string."""
+        sqlite_module._search_sql.cache_clear()
+        await db.search_articles(topic="AI", min_quality=0.5)
+        await db.search_articles(topic="Science", min_quality=0.9, limit=5)
+        await db.search_articles(query="fusion", source="example")
+
+        info = sqlite_module._search_sql.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_search_index_follows_replace(self, db):
+        """Test that replacing an article drops its old title from the index."""
+        url = "https://example.com/fts/r"
+        await db.save_article(self._make_article("fts-r", url, "Old headline"))
+        await db.save_article(self._make_article("fts-r", url, "New headline"))
+
+        assert await db.search_articles(query="old") == []
+        assert [a.id for a in await db.search_articles(query="headline")] == ["fts-r"]
+
+    @pytest.mark.asyncio
+    async def test_search_index_follows_url_replace(self, db):
+        """Test that a new ID for a known URL moves the index entry with it."""
+        url = "https://example.com/fts/u"
+        await db.save_article(self._make_article("fts-u1", url, "Old headline"))
+        await db.save_article(self._make_article("fts-u2", url, "New headline"))
+
+        assert await db.search_articles(query="old") == []
+        assert [a.id for a in await db.search_articles(query="headline")] == ["fts-u2"]
+
+    @pytest.mark.asyncio
+    async def test_search_index_survives_vacuum(self, db):
+        """Test that search results still point at the right rows after VACUUM."""
+        await db.save_articles([
+            self._make_article(f"fts-v{i}", f"https://example.com/fts/v{i}", f"Story {i}")
+            for i in range(5)
+        ])
+        async with db._pool.writer() as conn:
+            await conn.execute("DELETE FROM articles WHERE id IN ('fts-v0', 'fts-v2')")
+            await conn.commit()
+            await conn.execute("VACUUM")
+
+        results = await db.search_articles(query="story")
+        assert sorted(a.id for a in results) == ["fts-v1", "fts-v3", "fts-v4"]
+        assert [a.id for a in await db.search_articles(query="4")] == ["fts-v4"]
+
+    def test_search_index_synced_without_recursive_triggers(self):
+        """Test the D1 schema with the article upsert on a plain connection."""
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.executescript(get_d1_schema())
+            for title in ("Rust in production", "Python in production"):
+                conn.execute(
+                    INSERT_ARTICLE_SQL,
+                    self._make_article("a1", "https://example.com/a1", title).to_row(),
+                )
+
+            rust = conn.execute(
+                "SELECT COUNT(*) FROM articles_fts WHERE articles_fts MATCH 'rust'"
+            ).fetchone()[0]
+            python = conn.execute(
+                "SELECT articles_search.article_id FROM articles_fts "
+                "JOIN articles_search ON articles_search.docid = articles_fts.rowid "
+                "WHERE articles_fts MATCH 'python'"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        assert rust == 0
+        assert python == [("a1",)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query", ['"unbalanced', "AND OR", "title:x*", "NEAR(", "-"])
+    async def test_search_query_syntax_is_literal(self, db, query):
+        """Test that FTS operators in user input don't raise."""
+        await db.save_article(self._make_article("fts-s", "https://example.com/fts/s"))
+
+        assert isinstance(await db.search_articles(query=query), list)
+
+    @pytest.mark.asyncio
+    async def test_search_matches_author(self, db):
+        """Test that authors are indexed alongside titles and sources."""
+        await db.save_article(
+            self._make_article("fts-au", "https://example.com/fts/au", author="Ada Lovelace")
+        )
+
+        assert [a.id for a in await db.search_articles(query="lovelace")] == ["fts-au"]
+
+    @pytest.mark.asyncio
+    async def test_search_falls_back_to_like_without_fts5(self, db):
+        """Test substring search on SQLite builds without FTS5."""
+        await db.save_articles([
+            self._make_article("like-1", "https://example.com/like/1", "Quantum leap", topic="AI"),
+            self._make_article("like-2", "https://example.com/like/2", "Quantum dots"),
+            self._make_article("like-3", "https://example.com/like/3", author="Ada Lovelace"),
+        ])
+        db._fts = False
+
+        results = await db.search_articles(query="quantum", topic="AI")
+        assert [a.id for a in results] == ["like-1"]
+        assert [a.id for a in await db.search_articles(query="ada love")] == ["like-3"]
+
+    @pytest.mark.asyncio
+    async def test_search_index_rebuilt_with_author(self, temp_db_path):
+        """Test that an index built before authors were indexed is rebuilt."""
+        db = SQLiteDatabase(temp_db_path)
+        await db.initialize()
+        await db.save_article(
+            self._make_article("fts-old", "https://example.com/fts/old", author="Grace Hopper")
+        )
+        await db.close()
+
+        conn = sqlite3.connect(temp_db_path)
+        conn.executescript(
+            sqlite_module.DROP_SEARCH_SQL
+            + sqlite_module.SEARCH_SCHEMA_SQL.replace("    author,\n", "", 1)
+            .replace(", author)", ")", 1)
+            .replace(", new.author\n", "\n", 1)
+            .replace("source, author ON", "source ON", 1)
+            .replace(", author = new.author", "", 1)
+        )
+        conn.close()
+
+        db = SQLiteDatabase(temp_db_path)
+        await db.initialize()
+        try:
+            assert [a.id for a in await db.search_articles(query="hopper")] == ["fts-old"]
+        finally:
+            await db.close()
+
+    @pytest.mark.asyncio
+    async def test_search_index_backfilled(self, temp_db_path):
+        """Test that articles saved before the index existed become searchable."""
+        db = SQLiteDatabase(temp_db_path)
+        await db.initialize()
+        await db.save_article(self._make_article("fts-b", "https://example.com/fts/b", "Legacy"))
+        await db.close()
+
+        conn = sqlite3.connect(temp_db_path)
+        conn.executescript(
+            """
+            DROP TRIGGER articles_fts_insert;
+            DROP TRIGGER articles_fts_delete;
+            DROP TRIGGER articles_fts_update;
+            DROP TABLE articles_fts;
+            DROP TABLE articles_search;
+            """
+        )
+        conn.close()
+
+        db = SQLiteDatabase(temp_db_path)
+        await db.initialize()
+        try:
+            assert [a.id for a in await db.search_articles(query="legacy")] == ["fts-b"]
+        finally:
+            await db.close()
+
     @pytest.mark.asyncio
     async def test_get_recent_articles(self, db):
         """Test getting recent articles."""
-        recent = self._make_article("recent", "https://example.com/recent")
-        recent.first_seen_at = datetime.now()
+        recent = self._make_article(
+            "recent", "https://example.com/recent", first_seen_at=datetime.now()
+        )
         await db.save_article(recent)
 
         results = await db.get_recent_articles(hours=1)
         assert len(results) >= 1
 
+    @pytest.mark.asyncio
+    async def test_iter_recent_articles_streams_newest_first(self, db):
+        """Test that iter_recent_articles yields records newest first."""
+        now = datetime.now()
+        articles = [
+            self._make_article(
+                f"stream-{i}",
+                f"https://example.com/stream/{i}",
+                first_seen_at=now - timedelta(seconds=i),
+            )
+            for i in range(150)
+        ]
+        await db.save_articles(articles)
+
+        streamed = [a.id async for a in db.iter_recent_articles(hours=1, limit=200)]
+
+        assert streamed == [a.id for a in articles]
+        assert [a.id for a in await db.get_recent_articles(hours=1, limit=200)] == streamed
+
+    @pytest.mark.asyncio
+    async def test_iter_search_articles_releases_reader_on_close(self, db):
+        """Test that closing a stream early returns its reader to the pool."""
+        await db.save_articles([
+            self._make_article(f"early-{i}", f"https://example.com/early/{i}", "Quantum news")
+            for i in range(10)
+        ])
+
+        async with contextlib.aclosing(db.iter_search_articles(query="quantum")) as stream:
+            first = await anext(stream)
+            assert db._pool._idle.qsize() == db._pool.readers - 1
+
+        assert first.title == "Quantum news"
+        assert db._pool._idle.qsize() == db._pool.readers
+
+    @pytest.mark.asyncio
+    async def test_save_articles_batch(self, db):
+        """Test saving many articles in one call."""
+        articles = [
+            self._make_article(f"batch-{i}", f"https://example.com/batch/{i}")
+            for i in range(50)
+        ]
+        await db.save_articles(articles)
+
+        stats = await db.get_stats()
+        assert stats["total_articles"] == 50
+        found = await db.get_article("batch-7")
+        assert found is not None
+        assert found.url == "https://example.com/batch/7"
+
+    @pytest.mark.asyncio
+    async def test_save_articles_empty(self, db):
+        """Test that an empty batch is a no-op."""
+        assert await db.save_articles([]) == []
+
     @pytest.mark.asyncio
     async def test_article_url_uniqueness(self, db):
         """Test that duplicate URLs update the existing record."""
-        article1 = self._make_article("unique-1", "https://example.com/same-url")
-        article1.title = "First Title"
+        article1 = self._make_article("unique-1", "https://example.com/same-url", "First Title")
         await db.save_article(article1)
 
         # Same URL with different ID - should update or replace
-        article2 = self._make_article("unique-2", "https://example.com/same-url")
-        article2.title = "Second Title"
+        article2 = self._make_article("unique-2", "https://example.com/same-url", "Second Title")
         await db.save_article(article2)
 
         # Should only have one article with this URL
@@ -574,6 +1382,49 @@ class TestFeedbackOperations:
         results = await db.get_article_feedback("https://example.com/specific-article")
         assert len(results) == 1
 
+    @pytest.mark.asyncio
+    async def test_save_feedbacks_batch(self, db):
+        """Test saving several feedback records at once."""
+        feedbacks = [
+            FeedbackRecord(
+                id=f"batch-fb-{i}",
+                user_id="test-user",
+                digest_id="test-digest",
+                article_url=f"https://example.com/{i}",
+                feedback_type="read",
+                created_at=datetime.now(),
+            )
+            for i in range(5)
+        ]
+        await db.save_feedbacks(feedbacks)
+
+        assert len(await db.get_user_feedback("test-user")) == 5
+
+    @pytest.mark.asyncio
+    async def test_save_feedbacks_rolls_back_on_error(self, db):
+        """Test that a failing batch writes nothing."""
+        feedback = FeedbackRecord(
+            id="dup-fb",
+            user_id="test-user",
+            digest_id="test-digest",
+            article_url=None,
+            feedback_type="like",
+            created_at=datetime.now(),
+        )
+        other = FeedbackRecord(
+            id="other-fb",
+            user_id="test-user",
+            digest_id="test-digest",
+            article_url=None,
+            feedback_type="like",
+            created_at=datetime.now(),
+        )
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await db.save_feedbacks([other, feedback, feedback])
+
+        assert await db.get_user_feedback("test-user") == []
+
     @pytest.mark.asyncio
     async def test_feedback_with_rating(self, db):
         """Test feedback with rating."""
@@ -656,6 +1507,20 @@ class TestUsageTracking:
         assert usage.input_tokens == 300
         assert usage.digest_count == 3
 
+    @pytest.mark.asyncio
+    async def test_concurrent_usage_is_not_lost(self, db):
+        """Test that concurrent records all land in one row."""
+        usages = await asyncio.gather(
+            *(db.record_usage("test-user", output_tokens=10, searches=1) for _ in range(20))
+        )
+
+        assert max(u.search_count for u in usages) == 20
+        assert len({u.id for u in usages}) == 1
+        month = datetime.now().strftime("%Y-%m")
+        usage = await db.get_usage("test-user", month)
+        assert usage.output_tokens == 200
+        assert usage.search_count == 20
+
     @pytest.mark.asyncio
     async def test_get_usage_history(self, db):
         """Test getting usage history."""
@@ -715,6 +1580,385 @@ class TestTransactions:
             user = await db.get_user(f"concurrent-{i}")
             assert user is not None
 
+    @pytest.mark.asyncio
+    async def test_bulk_saves_commit_once_per_call(self, db):
+        """Test that each bulk save is one executemany in one transaction."""
+        await db.create_user(User(id="bulk", email="bulk@example.com", created_at=datetime.now()))
+        now = datetime.now()
+        digests = [
+            DigestRecord(
+                id=f"bulk-d{i}",
+                user_id="bulk",
+                generated_at=now,
+                period_start=now,
+                period_end=now,
+                frequency="daily",
+            )
+            for i in range(100)
+        ]
+        articles = [
+            ArticleRecord(
+                id=f"bulk-a{i}",
+                url=f"https://example.com/bulk/{i}",
+                title="Bulk",
+                source="example.com",
+                content_hash=ArticleRecord.hash_content(str(i)),
+                first_seen_at=now,
+            )
+            for i in range(100)
+        ]
+        feedback = [
+            FeedbackRecord(
+                id=f"bulk-f{i}",
+                user_id="bulk",
+                digest_id=f"bulk-d{i}",
+                article_url=None,
+                feedback_type="read",
+                created_at=now,
+            )
+            for i in range(100)
+        ]
+        statements = []
+        await (await db._get_db()).set_trace_callback(statements.append)
+
+        await db.save_digests(digests)
+        await db.save_articles(articles)
+        await db.save_feedbacks(feedback)
+
+        assert statements.count("COMMIT") == 3
+        stats = await db.get_stats()
+        assert (stats["total_digests"], stats["total_articles"]) == (100, 100)
+
+
+# ============================================================================
+# Connection Pool Tests
+# ============================================================================
+
+
+class TestConnectionPool:
+    """Tests for the reader/writer connection pool."""
+
+    @pytest.mark.asyncio
+    async def test_reads_use_read_only_connections(self, temp_db_path):
+        """Test that reader connections can't write."""
+        db = SQLiteDatabase(temp_db_path, pool_readers=2)
+        await db.initialize()
+
+        async with db._pool.reader() as conn:
+            assert conn is not await db._get_db()
+            with pytest.raises(sqlite3.OperationalError):
+                await conn.execute("DELETE FROM users")
+
+        await db.close()
+
+    @pytest.mark.asyncio
+    async def test_readers_see_committed_writes(self, temp_db_path):
+        """Test that reads on the pool see the writer's commits."""
+        db = SQLiteDatabase(temp_db_path, pool_readers=2)
+        await db.initialize()
+
+        assert await db.get_user("late-user") is None
+        await db.create_user(User(id="late-user", email="late@example.com", created_at=datetime.now()))
+        found = await asyncio.gather(*[db.get_user("late-user") for _ in range(4)])
+
+        assert all(user is not None for user in found)
+        await db.close()
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_wait_for_the_writer(self, temp_db_path):
+        """Test that reads run while a write transaction holds the writer."""
+        db = SQLiteDatabase(temp_db_path, pool_readers=2)
+        await db.initialize()
+        await db.create_user(User(id="before", email="b@example.com", created_at=datetime.now()))
+
+        async with db._pool.writer() as conn:
+            await conn.execute("DELETE FROM users")  # uncommitted
+            found, stats = await asyncio.wait_for(
+                asyncio.gather(db.get_user("before"), db.get_stats()), timeout=2
+            )
+            await conn.rollback()
+        await db.close()
+
+        assert found is not None  # readers see the last committed state
+        assert stats["total_users"] == 1
+
+    @pytest.mark.asyncio
+    async def test_connections_cache_prepared_statements(self, temp_db_path, monkeypatch):
+        """Test that every pooled connection gets the larger statement cache."""
+        calls = []
+        connect = aiosqlite.connect
+
+        def spy(database, **kwargs):
+            calls.append(kwargs)
+            return connect(database, **kwargs)
+
+        monkeypatch.setattr(aiosqlite, "connect", spy)
+        db = SQLiteDatabase(temp_db_path, pool_readers=1)
+        await db.initialize()
+        await db.get_user("anyone")
+        await db.close()
+
+        assert len(calls) == 2
+        assert all(kw["cached_statements"] == STATEMENT_CACHE_SIZE for kw in calls)
+
+    @pytest.mark.asyncio
+    async def test_save_article_updates_existing_url(self, temp_db_path):
+        """Test that saving a known URL updates the row in place."""
+        db = SQLiteDatabase(temp_db_path)
+        await db.initialize()
+        article = ArticleRecord(
+            id="up-1",
+            url="https://example.com/up",
+            title="Draft",
+            source="example.com",
+            content_hash=ArticleRecord.hash_content("draft"),
+            first_seen_at=datetime.now(),
+        )
+        await db.save_article(article)
+        await db.save_article(dataclasses.replace(article, title="Final", quality_score=0.9))
+
+        found = await db.get_article_by_url("https://example.com/up")
+        stats = await db.get_stats()
+        await db.close()
+
+        assert (found.title, found.quality_score) == ("Final", 0.9)
+        assert stats["total_articles"] == 1
+
+    @pytest.mark.asyncio
+    async def test_in_memory_database_shares_one_connection(self):
+        """Test that in-memory databases skip read connections."""
+        db = SQLiteDatabase(":memory:")
+        await db.initialize()
+
+        await db.create_user(User(id="mem-user", email="mem@example.com", created_at=datetime.now()))
+        assert await db.get_user("mem-user") is not None
+        assert db._pool.readers == 0
+
+        await db.close()
+
+    @pytest.mark.asyncio
+    async def test_memory_database_type_reads_through_writer(self):
+        """Test that MEMORY databases are private and read via the writer."""
+        db = await get_database(DatabaseType.MEMORY)
+        other = await get_database(DatabaseType.MEMORY)
+        try:
+            await db.create_user(
+                User(id="shared-user", email="shared@example.com", created_at=datetime.now())
+            )
+
+            assert db._pool.readers == 0
+            async with db._pool.reader() as conn:
+                assert conn is await db._get_db()
+            assert await db.get_user("shared-user") is not None
+            assert await other.get_user("shared-user") is None
+        finally:
+            await db.close()
+            await other.close()
+
+    @pytest.mark.asyncio
+    async def test_writer_reads_wait_for_open_write(self):
+        """Test that reads on the writer don't see an uncommitted batch."""
+        db = await get_database(DatabaseType.MEMORY)
+        try:
+            article = ArticleRecord(
+                id="pending",
+                url="https://example.com/pending",
+                title="Pending",
+                source="example.com",
+                content_hash=ArticleRecord.hash_content("pending"),
+                first_seen_at=datetime.now(),
+            )
+            async with db._pool.writer() as conn:
+                await conn.execute(INSERT_ARTICLE_SQL, article.to_row())
+                read = asyncio.create_task(db.get_article("pending"))
+                await asyncio.sleep(0.05)
+                assert not read.done()
+                await conn.rollback()
+
+            assert await read is None
+        finally:
+            await db.close()
+
+    @pytest.mark.asyncio
+    async def test_writes_during_iteration_without_readers(self):
+        """Test that streaming on the writer doesn't block writes from the loop body."""
+        db = await get_database(DatabaseType.MEMORY)
+        try:
+            def article(i):
+                return ArticleRecord(
+                    id=f"iter-{i}",
+                    url=f"https://example.com/iter/{i}",
+                    title="Streamed",
+                    source="example.com",
+                    content_hash=ArticleRecord.hash_content(f"iter {i}"),
+                    first_seen_at=datetime.now(),
+                )
+
+            await db.save_article(article(0))
+
+            async def copy_while_streaming():
+                async for _ in db.iter_recent_articles():
+                    await db.save_article(article(1))
+                async for _ in db.iter_search_articles("Streamed"):
+                    await db.save_article(article(2))
+
+            await asyncio.wait_for(copy_while_streaming(), timeout=5)
+            assert len(await db.get_recent_articles()) == 3
+        finally:
+            await db.close()
+
+    @pytest.mark.asyncio
+    async def test_writer_optimizes_periodically(self, temp_db_path):
+        """Test that PRAGMA optimize runs every optimize_every writer checkouts."""
+        db = SQLiteDatabase(temp_db_path)
+        await db.initialize()
+        db._pool.optimize_every = 3
+        db._pool._writes_since_optimize = 0
+        statements = []
+        await (await db._get_db()).set_trace_callback(statements.append)
+
+        for i in range(7):
+            await db.delete_old_digests(f"user-{i}")
+        periodic = statements.count("PRAGMA optimize")
+        await db.close()
+
+        assert periodic == 2
+        assert statements.count("PRAGMA optimize") == 3  # and once more on close
+
+    @pytest.mark.asyncio
+    async def test_close_releases_all_connections(self, temp_db_path):
+        """Test that close shuts readers and writer and allows reopening."""
+        db = SQLiteDatabase(temp_db_path, pool_readers=2)
+        await db.initialize()
+        await db.get_user("anyone")
+        await db.close()
+
+        assert db._pool._read_conns == []
+        assert db._pool._writer is None
+
+        await db.initialize()
+        assert await db.get_user("anyone") is None
+        await db.close()
+
+
+# ============================================================================
+# Write Batching Tests
+# ============================================================================
+
+
+class TestWriteBatching:
+    """Tests for coalescing concurrent single-row writes."""
+
+    @pytest.fixture
+    async def db(self, temp_db_path):
+        """Create and initialize a database with one user."""
+        db = SQLiteDatabase(temp_db_path)
+        await db.initialize()
+        await db.create_user(User(id="u", email="u@example.com", created_at=datetime.now()))
+        yield db
+        await db.close()
+
+    def _article(self, i: int) -> ArticleRecord:
+        return ArticleRecord(
+            id=f"w-{i}",
+            url=f"https://example.com/w/{i}",
+            title=f"Write {i}",
+            source="example.com",
+            content_hash=ArticleRecord.hash_content(str(i)),
+            first_seen_at=datetime.now(),
+        )
+
+    def _feedback(self, feedback_id: str, digest_id: str = "d") -> FeedbackRecord:
+        return FeedbackRecord(
+            id=feedback_id,
+            user_id="u",
+            digest_id=digest_id,
+            article_url=None,
+            feedback_type="like",
+            created_at=datetime.now(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_share_transactions(self, db):
+        """Test that a burst of saves is committed in a few batches."""
+        await asyncio.gather(*(db.save_article(self._article(i)) for i in range(200)))
+
+        stats = await db.get_stats()
+        assert stats["total_articles"] == 200
+        assert db._writes.batches < 10
+
+    @pytest.mark.asyncio
+    async def test_order_kept_across_statements(self, db):
+        """Test that a digest saved before its feedback lands first."""
+        digest = DigestRecord(
+            id="d",
+            user_id="u",
+            generated_at=datetime.now(),
+            period_start=datetime.now(),
+            period_end=datetime.now(),
+            frequency="daily",
+        )
+
+        await asyncio.gather(db.save_digest(digest), db.save_feedback(self._feedback("f-1")))
+
+        assert len(await db.get_user_feedback("u")) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_write_isolated(self, db):
+        """Test that one failing write doesn't fail the rest of its batch."""
+        results = await asyncio.gather(
+            db.save_article(self._article(1)),
+            db.save_feedback(self._feedback("f-bad", digest_id="missing-digest")),
+            db.save_article(self._article(2)),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[1], sqlite3.IntegrityError)
+        assert await db.get_article("w-1") is not None
+        assert await db.get_article("w-2") is not None
+
+    @pytest.mark.asyncio
+    async def test_writer_failure_fails_batch_and_keeps_draining(self, db, monkeypatch):
+        """Test that a writer that can't be opened fails the waiting saves, not hangs them."""
+        writer_connection = db._pool.writer_connection
+
+        async def broken():
+            raise OSError("disk gone")
+
+        monkeypatch.setattr(db._pool, "writer_connection", broken)
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                db.save_article(self._article(1)),
+                db.save_article(self._article(2)),
+                return_exceptions=True,
+            ),
+            timeout=5,
+        )
+
+        assert all(isinstance(result, OSError) for result in results)
+        assert not db._writes._task.done()
+
+        monkeypatch.setattr(db._pool, "writer_connection", writer_connection)
+        await asyncio.wait_for(db.save_article(self._article(3)), timeout=5)
+        assert await db.get_article("w-3") is not None
+
+    @pytest.mark.asyncio
+    async def test_close_commits_queued_writes(self, temp_db_path):
+        """Test that writes still queued at close are committed."""
+        db = SQLiteDatabase(temp_db_path)
+        await db.initialize()
+        pending = [asyncio.create_task(db.save_article(self._article(i))) for i in range(5)]
+        await asyncio.sleep(0)
+        await db.close()
+        await asyncio.gather(*pending)
+
+        db = SQLiteDatabase(temp_db_path)
+        await db.initialize()
+        try:
+            assert (await db.get_stats())["total_articles"] == 5
+        finally:
+            await db.close()
+
 
 # ============================================================================
 # Statistics Tests
@@ -749,3 +1993,25 @@ class TestStatistics:
         assert "total_digests" in stats
         assert "total_articles" in stats
         assert "database_size_bytes" in stats
+
+    @pytest.mark.asyncio
+    async def test_get_stats_is_one_query(self, db):
+        """Test that all statistics come back from a single statement."""
+        await db.create_user(User(id="one", email="one@example.com", created_at=datetime.now()))
+        await db.get_user("warm-up")  # open the read connections
+        statements = []
+        for conn in db._pool._read_conns:
+            await conn.set_trace_callback(statements.append)
+
+        stats = await db.get_stats()
+
+        # pragma_page_count() etc. trace as "-- PRAGMA ..." inside the one query
+        assert len([sql for sql in statements if not sql.startswith("--")]) == 1
+        assert stats == {
+            "total_users": 1,
+            "total_digests": 0,
+            "total_articles": 0,
+            "total_feedback": 0,
+            "database_size_bytes": stats["database_size_bytes"],
+        }
+        assert stats["database_size_bytes"] > 0
@@ -4,8 +4,10 @@ Tests for article models.
 
 import pytest
 from dataclasses import asdict
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
+from src.models import article as article_module
 from src.models.article import (
     ParsedArticle,
     AnalyzedArticle,
@@ -51,6 +53,35 @@ class TestArticleURL:
         assert article.url_hash is not None
         assert len(article.url_hash) == 12
 
+    def test_url_hash_memoized(self, monkeypatch):
+        """Test that the URL is hashed once, and again only after it changes."""
+        article = ArticleURL(
+            url="https://example.com/a",
+            title="Test",
+            source="example.com",
+            snippet="Snippet",
+        )
+        first = article.url_hash
+        monkeypatch.setattr(article_module, "_short_hash", None)
+        assert article.url_hash == first
+        assert article.to_dict()["url_hash"] == first
+
+        monkeypatch.undo()
+        article.url = "https://example.com/b"
+        assert article.url_hash != first
+
+    def test_url_hash_without_xxhash(self, monkeypatch):
+        """Test that the hash falls back to truncated MD5 without xxhash."""
+        monkeypatch.setattr(article_module, "HAS_XXHASH", False)
+        article = ArticleURL(
+            url="https://example.com/article",
+            title="Test",
+            source="example.com",
+            snippet="Snippet",
+        )
+        expected = article_module.hashlib.md5(article.url.encode()).hexdigest()[:12]
+        assert article.url_hash == expected
+
     def test_domain_extraction(self):
         """Test domain extraction from URL."""
         article = ArticleURL(
@@ -61,6 +92,19 @@ class TestArticleURL:
         )
         assert article.domain == "example.com"
 
+    def test_domain_parsed_once_per_url(self):
+        """Test that articles sharing a URL reuse one parse, and bad URLs use source."""
+        article_module._url_domain.cache_clear()
+        url = "https://www.example.com/shared"
+        ArticleURL(url=url, title="A", source="s", snippet="").domain
+        parsed = ParsedArticle(article_id="p", url=url, title="B", content="Content")
+
+        assert parsed.domain == "example.com"
+        assert article_module._url_domain.cache_info().hits == 1
+
+        bad = ArticleURL(url="http://[bad", title="C", source="fallback.com", snippet="")
+        assert bad.domain == "fallback.com"
+
 
 # ============================================================================
 # ParsedArticle Tests
@@ -146,6 +190,41 @@ class TestParsedArticle:
         assert "content" in d
         assert "article_id" in d
 
+    def test_article_to_dict_content_options(self):
+        """Test that to_dict can truncate, keep or leave out the body."""
+        article = ParsedArticle(
+            article_id="article-007",
+            url="https://example.com",
+            title="Test",
+            content="x" * 600,
+        )
+        assert article.to_dict()["content"] == "x" * 500 + "..."
+        assert article.to_dict(content_limit=None)["content"] == "x" * 600
+        assert article.to_dict(content_limit=10)["content"] == "x" * 10 + "..."
+        assert article.to_dict(include_content=False)["content"] is None
+
+        analyzed = AnalyzedArticle(parsed_article=article)
+        assert analyzed.to_dict(include_content=False)["parsed_article"]["content"] is None
+
+    def test_content_hash_memoized(self, monkeypatch):
+        """Test that content is hashed once, and again only after it changes."""
+        article = ParsedArticle(
+            article_id="article-006",
+            url="https://example.com",
+            title="Test",
+            content="Content",
+            source="example.com",
+        )
+        first = article.content_hash
+        monkeypatch.setattr(article_module, "_short_hash", None)
+        assert article.content_hash == first
+        assert article.to_dict()["content_hash"] == first
+
+        monkeypatch.undo()
+        article.content = "Other content"
+        assert article.content_hash != first
+        assert "_content_hash" not in repr(article)
+
 
 # ============================================================================
 # QualityAnalysis Tests
@@ -464,6 +543,29 @@ class TestAnalyzedArticle:
         )
         assert article.combined_score > 0
 
+    def test_to_dict_scores_once(self, monkeypatch):
+        """Test that to_dict computes the combined score once for both fields."""
+        calls = []
+        quality_score = QualityAnalysis.combined_score
+
+        def counting(analysis):
+            calls.append(analysis)
+            return quality_score.fget(analysis)
+
+        monkeypatch.setattr(QualityAnalysis, "combined_score", property(counting))
+        article = AnalyzedArticle(
+            parsed_article=self._make_parsed_article(),
+            quality_analysis=QualityAnalysis(relevance_score=1.0, quality_score=1.0),
+            bias_analysis=BiasAnalysis(bias_score=0.5),
+        )
+
+        d = article.to_dict()
+
+        # One for the nested quality_analysis.to_dict(), one for the article score
+        assert len(calls) == 2
+        assert d["combined_score"] == article.combined_score
+        assert d["should_include"] == article.should_include
+
 
 # ============================================================================
 # Model Serialization Tests
@@ -509,6 +611,69 @@ class TestModelSerialization:
         assert "title" in d
         assert "article_id" in d
 
+    def test_timestamps_rendered_per_zone(self):
+        """Test that cached ISO strings keep each aware timestamp's own offset."""
+        utc = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+        cet = utc.astimezone(timezone(timedelta(hours=1)))
+
+        def to_dict(published):
+            return ParsedArticle(
+                article_id="iso",
+                url="https://example.com",
+                title="Test",
+                content="Content",
+                published_date=published,
+            ).to_dict()
+
+        assert to_dict(utc)["published_date"] == "2025-01-01T12:00:00+00:00"
+        assert to_dict(cet)["published_date"] == "2025-01-01T13:00:00+01:00"
+        assert to_dict(None)["published_date"] is None
+
+    def test_timestamps_rendered_per_fold(self):
+        """Test that both readings of an ambiguous DST time keep their offsets."""
+        new_york = ZoneInfo("America/New_York")
+        first = datetime(2021, 11, 7, 1, 30, tzinfo=new_york)
+        second = first.replace(fold=1)
+
+        def published(value):
+            return ParsedArticle(
+                article_id="iso",
+                url="https://example.com",
+                title="Test",
+                content="Content",
+                published_date=value,
+            ).to_dict()["published_date"]
+
+        assert published(first) == "2021-11-07T01:30:00-04:00"
+        assert published(second) == "2021-11-07T01:30:00-05:00"
+
+    def test_timestamps_rendered_once_per_value(self):
+        """Test that repeat to_dict() calls reuse the ISO string until the field changes."""
+        article = ParsedArticle(
+            article_id="iso",
+            url="https://example.com",
+            title="Test",
+            content="Content",
+            extracted_at=datetime(2025, 1, 1, 12),
+        )
+
+        assert article.to_dict()["extracted_at"] is article.to_dict()["extracted_at"]
+
+        article.extracted_at = datetime(2025, 1, 2, 12)
+        assert article.to_dict()["extracted_at"] == "2025-01-02T12:00:00"
+
+    def test_models_use_slots(self):
+        """Test that models don't carry a per-instance __dict__."""
+        article = ParsedArticle(
+            article_id="article-001",
+            url="https://example.com",
+            title="Test",
+            content="Content",
+        )
+        assert not hasattr(article, "__dict__")
+        with pytest.raises(AttributeError):
+            article.extra = "not a field"
+
 
 # ============================================================================
 # ArticleFormat Tests
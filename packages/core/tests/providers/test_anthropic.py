@@ -7,8 +7,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import json
 import httpx
 
-from src.providers.anthropic import AnthropicProvider, ANTHROPIC_MODELS
-from src.providers.base import ModelNotFoundError, LLMResponse, ProviderStats
+from src.providers.anthropic import AnthropicProvider, ANTHROPIC_MODELS, STRUCTURED_OUTPUT_TOOL
+from src.providers.base import AuthenticationError, ModelNotFoundError, LLMResponse, ProviderStats
 
 
 # ============================================================================
@@ -190,6 +190,75 @@ class TestAnthropicComplete:
             )
             assert response.content is not None
 
+    @pytest.mark.asyncio
+    async def test_system_prompt_marked_cacheable(self, provider, mock_response_data):
+        """Test that the system prompt carries a cache breakpoint by default."""
+        with patch.object(provider._client, "post", new_callable=AsyncMock) as mock:
+            mock.return_value = self._mock_httpx_response(mock_response_data)
+            await provider.complete("Hello!", system_prompt="Be brief.")
+            assert mock.call_args.kwargs["json"]["system"] == [
+                {"type": "text", "text": "Be brief.", "cache_control": {"type": "ephemeral"}}
+            ]
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_not_cacheable(self, provider, mock_response_data):
+        """Test that caching can be disabled per request."""
+        with patch.object(provider._client, "post", new_callable=AsyncMock) as mock:
+            mock.return_value = self._mock_httpx_response(mock_response_data)
+            await provider.complete(
+                "Hello!", system_prompt="Be brief.", system_prompt_cacheable=False
+            )
+            assert mock.call_args.kwargs["json"]["system"] == [
+                {"type": "text", "text": "Be brief."}
+            ]
+
+    @pytest.mark.asyncio
+    async def test_cache_usage_recorded(self, provider, mock_response_data):
+        """Test that cache reads and writes are recorded and priced."""
+        mock_response_data["usage"].update(
+            cache_creation_input_tokens=0,
+            cache_read_input_tokens=1000,
+        )
+        with patch.object(provider._client, "post", new_callable=AsyncMock) as mock:
+            mock.return_value = self._mock_httpx_response(mock_response_data)
+            response = await provider.complete("Hello!", system_prompt="Be brief.")
+
+        assert response.metadata["cache_read_tokens"] == 1000
+        uncached_cost = provider.calculate_cost(100, 50)
+        assert response.cost_usd == pytest.approx(uncached_cost + 1000 * 0.25e-6 * 0.1)
+
+    @pytest.mark.asyncio
+    async def test_response_schema_forces_tool(self, provider, mock_response_data):
+        """Test that a response schema is sent as a forced tool call."""
+        schema = {"type": "object", "properties": {"score": {"type": "number"}}}
+        with patch.object(provider._client, "post", new_callable=AsyncMock) as mock:
+            mock.return_value = self._mock_httpx_response(mock_response_data)
+            await provider.complete("Hello!", response_schema=schema)
+            payload = mock.call_args.kwargs["json"]
+            assert payload["tools"][0]["name"] == STRUCTURED_OUTPUT_TOOL
+            assert payload["tools"][0]["input_schema"] == schema
+            assert payload["tool_choice"] == {"type": "tool", "name": STRUCTURED_OUTPUT_TOOL}
+
+    @pytest.mark.asyncio
+    async def test_no_tools_without_schema(self, provider, mock_response_data):
+        """Test that plain completions don't send tools."""
+        with patch.object(provider._client, "post", new_callable=AsyncMock) as mock:
+            mock.return_value = self._mock_httpx_response(mock_response_data)
+            await provider.complete("Hello!")
+            assert "tools" not in mock.call_args.kwargs["json"]
+
+    @pytest.mark.asyncio
+    async def test_tool_use_block_returned_as_json(self, provider, mock_response_data):
+        """Test that structured output tool input becomes the content."""
+        mock_response_data["content"] = [
+            {"type": "tool_use", "id": "tu-1", "name": STRUCTURED_OUTPUT_TOOL,
+             "input": {"score": 0.8}},
+        ]
+        with patch.object(provider._client, "post", new_callable=AsyncMock) as mock:
+            mock.return_value = self._mock_httpx_response(mock_response_data)
+            response = await provider.complete("Hello!", response_schema={"type": "object"})
+            assert json.loads(response.content) == {"score": 0.8}
+
     @pytest.mark.asyncio
     async def test_complete_with_temperature(self, provider, mock_response_data):
         """Test completion with temperature setting."""
@@ -224,6 +293,65 @@ class TestAnthropicComplete:
             assert "Second part" in response.content
 
 
+# ============================================================================
+# Streaming Tests
+# ============================================================================
+
+
+def _sse(*events: dict) -> str:
+    """Encode events as a server-sent event stream."""
+    return "".join(f"event: {e['type']}\ndata: {json.dumps(e)}\n\n" for e in events)
+
+
+class TestAnthropicStreaming:
+    """Tests for Anthropic streaming completion."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_deltas_and_records_usage(self):
+        """Test that text deltas are yielded and usage is recorded."""
+        body = _sse(
+            {"type": "message_start", "message": {"id": "msg-1", "usage": {"input_tokens": 100}}},
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hello"}},
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": " world"}},
+            {"type": "message_delta", "delta": {"stop_reason": "end_turn"}, "usage": {"output_tokens": 50}},
+            {"type": "message_stop"},
+        )
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(json.loads(request.content))
+            return httpx.Response(200, text=body)
+
+        provider = AnthropicProvider(api_key="test-key")
+        provider._client = httpx.AsyncClient(
+            base_url=provider.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+
+        chunks = [chunk async for chunk in provider.stream_complete("Hi")]
+
+        assert chunks == ["Hello", " world"]
+        assert requests[0]["stream"] is True
+        stats = provider.get_stats()
+        assert stats["total_requests"] == 1
+        assert stats["total_input_tokens"] == 100
+        assert stats["total_output_tokens"] == 50
+
+    @pytest.mark.asyncio
+    async def test_stream_http_error(self):
+        """Test that HTTP errors map to provider errors."""
+        provider = AnthropicProvider(api_key="test-key")
+        provider._client = httpx.AsyncClient(
+            base_url=provider.BASE_URL,
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(401, json={"error": {"message": "bad key"}})
+            ),
+        )
+
+        with pytest.raises(AuthenticationError):
+            async for _ in provider.stream_complete("Hi"):
+                pass
+
+
 # ============================================================================
 # Error Handling Tests
 # ============================================================================
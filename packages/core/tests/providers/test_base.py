@@ -384,6 +384,58 @@ class TestBaseLLMProviderInterface:
             IncompleteProvider("api-key", "model")
 
 
+class EchoProvider(BaseLLMProvider):
+    """Minimal concrete provider that echoes prompts."""
+
+    provider_name = "echo"
+    available_models = {}
+
+    async def complete(self, prompt, max_tokens=1024, temperature=0.7, system_prompt=None, **kwargs):
+        return LLMResponse(
+            content=prompt,
+            model=self.model,
+            provider=self.provider_name,
+            input_tokens=1,
+            output_tokens=1,
+            cost_usd=0.0,
+            response_time_seconds=0.0,
+        )
+
+    async def health_check(self):
+        return True
+
+
+class TestCompleteBatch:
+    """Tests for the default batch completion."""
+
+    @pytest.mark.asyncio
+    async def test_preserves_request_order(self):
+        """Test that responses come back in request order."""
+        provider = EchoProvider("api-key", "model")
+        requests = [{"prompt": f"prompt-{i}", "max_tokens": 10} for i in range(20)]
+
+        responses = await provider.complete_batch(requests, max_concurrent=3)
+
+        assert [r.content for r in responses] == [f"prompt-{i}" for i in range(20)]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        """Test that an empty batch returns no responses."""
+        provider = EchoProvider("api-key", "model")
+        assert await provider.complete_batch([]) == []
+
+
+class TestStreamComplete:
+    """Tests for the default streaming completion."""
+
+    @pytest.mark.asyncio
+    async def test_yields_full_completion(self):
+        """Test that non-streaming providers yield one chunk."""
+        provider = EchoProvider("api-key", "model")
+        chunks = [chunk async for chunk in provider.stream_complete("hello")]
+        assert chunks == ["hello"]
+
+
 # ============================================================================
 # Error Classes Tests
 # ============================================================================
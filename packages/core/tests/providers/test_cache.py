@@ -0,0 +1,187 @@
+"""
+Tests for the LLM response cache.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.providers.base import LLMResponse
+from src.providers.cache import LLMCache
+
+
+def _make_response(content: str = "cached content") -> LLMResponse:
+    """Create a test LLM response."""
+    return LLMResponse(
+        content=content,
+        model="test-model",
+        provider="test",
+        input_tokens=100,
+        output_tokens=50,
+        cost_usd=0.001,
+        response_time_seconds=1.0,
+    )
+
+
+# ============================================================================
+# Key Tests
+# ============================================================================
+
+
+class TestCacheKey:
+    """Tests for cache key generation."""
+
+    def test_key_is_deterministic(self):
+        """Test that identical requests produce identical keys."""
+        key1 = LLMCache.make_key("sys", "prompt", "model", 100, 0.3)
+        key2 = LLMCache.make_key("sys", "prompt", "model", 100, 0.3)
+        assert key1 == key2
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ("other", "prompt", "model", 100, 0.3),
+            ("sys", "other", "model", 100, 0.3),
+            ("sys", "prompt", "other", 100, 0.3),
+            ("sys", "prompt", "model", 200, 0.3),
+            ("sys", "prompt", "model", 100, 0.0),
+        ],
+    )
+    def test_key_varies_with_parameters(self, args):
+        """Test that each request parameter affects the key."""
+        base = LLMCache.make_key("sys", "prompt", "model", 100, 0.3)
+        assert LLMCache.make_key(*args) != base
+
+    def test_is_cacheable(self):
+        """Test temperature gate for caching."""
+        assert LLMCache.is_cacheable(0.0)
+        assert LLMCache.is_cacheable(0.4)
+        assert not LLMCache.is_cacheable(0.7)
+
+
+# ============================================================================
+# Backend Tests
+# ============================================================================
+
+
+class TestMemoryBackend:
+    """Tests for the in-memory backend."""
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self):
+        """Test that unknown keys miss."""
+        cache = LLMCache()
+        assert await cache.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_hit_replays_without_usage(self):
+        """Test that hits replay content with zeroed tokens and cost."""
+        cache = LLMCache()
+        await cache.set("key", _make_response())
+
+        replayed = await cache.get("key")
+        assert replayed is not None
+        assert replayed.content == "cached content"
+        assert replayed.total_tokens == 0
+        assert replayed.cost_usd == 0.0
+        assert replayed.metadata["cache_hit"] is True
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_misses(self):
+        """Test that entries past their TTL are evicted."""
+        cache = LLMCache()
+        await cache.set("key", _make_response(), ttl=-1)
+
+        assert await cache.get("key") is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_evicted(self):
+        """Test that the memory tier stays within max_entries."""
+        cache = LLMCache(max_entries=2)
+        await cache.set("a", _make_response("a"))
+        await cache.set("b", _make_response("b"))
+        await cache.get("a")
+        await cache.set("c", _make_response("c"))
+
+        assert len(cache) == 2
+        assert await cache.get("b") is None
+        assert (await cache.get("a")).content == "a"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("finish_reason", ["max_tokens", "length", "content_filter"])
+    async def test_incomplete_response_not_stored(self, finish_reason):
+        """Test that truncated or filtered responses are never replayed."""
+        cache = LLMCache()
+        response = _make_response()
+        response.finish_reason = finish_reason
+        await cache.set("key", response)
+
+        assert await cache.get("key") is None
+        assert len(cache) == 0
+
+
+class TestFileBackend:
+    """Tests for the file backend."""
+
+    @pytest.mark.asyncio
+    async def test_persists_across_instances(self, tmp_path):
+        """Test that entries survive a new cache instance."""
+        await LLMCache(cache_dir=tmp_path).set("key", _make_response())
+
+        replayed = await LLMCache(cache_dir=tmp_path).get("key")
+        assert replayed is not None
+        assert replayed.content == "cached content"
+
+    @pytest.mark.asyncio
+    async def test_clear_removes_files(self, tmp_path):
+        """Test that clear empties both backends."""
+        cache = LLMCache(cache_dir=tmp_path)
+        await cache.set("key", _make_response())
+        await cache.clear()
+
+        assert list(tmp_path.glob("*.json")) == []
+        assert await cache.get("key") is None
+
+
+# ============================================================================
+# Complete Tests
+# ============================================================================
+
+
+class TestCachedComplete:
+    """Tests for completing through the cache."""
+
+    @pytest.fixture
+    def mock_provider(self):
+        """Create a mock LLM provider."""
+        provider = MagicMock()
+        provider.model = "test-model"
+        provider.complete = AsyncMock(return_value=_make_response())
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_second_call_hits(self, mock_provider):
+        """Test that repeated requests only reach the provider once."""
+        cache = LLMCache()
+
+        _, hit1 = await cache.complete(mock_provider, "prompt", 100, 0.3, "sys")
+        response, hit2 = await cache.complete(mock_provider, "prompt", 100, 0.3, "sys")
+
+        assert hit1 is False
+        assert hit2 is True
+        assert response.content == "cached content"
+        assert mock_provider.complete.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_optional_cache_bypassed(self, mock_provider):
+        """Test that no cache, or a random request, calls the provider with no hit status."""
+        cache = LLMCache()
+
+        _, no_cache = await LLMCache.complete_if_cacheable(None, mock_provider, "p", 100, 0.3)
+        _, random = await LLMCache.complete_if_cacheable(cache, mock_provider, "p", 100, 0.9)
+        _, miss = await LLMCache.complete_if_cacheable(cache, mock_provider, "p", 100, 0.3)
+        _, hit = await LLMCache.complete_if_cacheable(cache, mock_provider, "p", 100, 0.3)
+
+        assert (no_cache, random, miss, hit) == (None, None, False, True)
+        assert mock_provider.complete.await_count == 3
+        assert len(cache) == 1
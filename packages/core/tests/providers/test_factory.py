@@ -6,6 +6,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 import os
 
+from src.mcp_servers.factory import create_mcp_servers, get_tier1_server, get_tier2_server
 from src.providers.factory import (
     get_provider,
     get_tier1_provider,
@@ -249,3 +250,40 @@ class TestProviderFactoryIntegration:
             # They may use the same model but could have different settings
             assert tier1 is not None
             assert tier2 is not None
+
+
+# ============================================================================
+# MCP Server Factory Tests
+# ============================================================================
+
+
+class TestMCPServerFactory:
+    """Tests for the shared tier servers in mcp_servers.factory."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_servers(self):
+        """Start and end each test without cached servers."""
+        get_tier1_server.cache_clear()
+        get_tier2_server.cache_clear()
+        yield
+        get_tier1_server.cache_clear()
+        get_tier2_server.cache_clear()
+
+    def test_tier_servers_built_once(self):
+        """Test that agents asking for a tier share one provider."""
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}):
+            tier1 = get_tier1_server()
+            servers = create_mcp_servers()
+
+            assert get_tier1_server() is tier1
+            assert servers["tier1"] is tier1
+            assert servers["tier2"] is get_tier2_server()
+
+    def test_failed_lookup_not_cached(self):
+        """Test that a missing API key isn't remembered once one is set."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError):
+                get_tier1_server()
+
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}):
+            assert isinstance(get_tier1_server(), OpenRouterProvider)
@@ -210,9 +210,86 @@ class TestOpenRouterComplete:
             updated_stats = provider.get_stats()
             assert updated_stats["total_requests"] > initial_stats["total_requests"]
 
+    @pytest.mark.asyncio
+    async def test_system_prompt_plain_for_non_anthropic(self, provider, mock_response_data):
+        """Test that non-Anthropic models get a plain system message."""
+        with patch.object(provider._client, "post", new_callable=AsyncMock) as mock:
+            mock.return_value = self._mock_httpx_response(mock_response_data)
+            await provider.complete("Hello!", system_prompt="Be brief.")
+            system = mock.call_args.kwargs["json"]["messages"][0]
+            assert system["content"] == "Be brief."
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_cache_control_for_anthropic(self, mock_response_data):
+        """Test that Anthropic models get a cache breakpoint on the system prompt."""
+        provider = OpenRouterProvider(api_key="test-key", model="anthropic/claude-sonnet-4")
+        with patch.object(provider._client, "post", new_callable=AsyncMock) as mock:
+            mock.return_value = self._mock_httpx_response(mock_response_data)
+            await provider.complete("Hello!", system_prompt="Be brief.")
+            system = mock.call_args.kwargs["json"]["messages"][0]
+            assert system["content"] == [
+                {"type": "text", "text": "Be brief.", "cache_control": {"type": "ephemeral"}}
+            ]
+
+            await provider.complete(
+                "Hello!", system_prompt="Be brief.", system_prompt_cacheable=False
+            )
+            system = mock.call_args.kwargs["json"]["messages"][0]
+            assert system["content"] == "Be brief."
+
+    @pytest.mark.asyncio
+    async def test_response_schema_sets_strict_json_format(self, provider, mock_response_data):
+        """Test that a response schema is sent as a strict json_schema format."""
+        schema = {"type": "object", "properties": {"score": {"type": "number"}}}
+        with patch.object(provider._client, "post", new_callable=AsyncMock) as mock:
+            mock.return_value = self._mock_httpx_response(mock_response_data)
+            await provider.complete("Hello!", response_schema=schema)
+            response_format = mock.call_args.kwargs["json"]["response_format"]
+            assert response_format["type"] == "json_schema"
+            assert response_format["json_schema"]["strict"] is True
+            assert response_format["json_schema"]["schema"] == schema
+
+            await provider.complete("Hello!")
+            assert "response_format" not in mock.call_args.kwargs["json"]
+
 
 
 
+# ============================================================================
+# Streaming Tests
+# ============================================================================
+
+
+class TestOpenRouterStreaming:
+    """Tests for OpenRouter streaming completion."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_deltas_and_records_usage(self):
+        """Test that content deltas are yielded and final usage is recorded."""
+        chunks = [
+            {"id": "gen-1", "choices": [{"delta": {"content": "Hello"}}]},
+            {"id": "gen-1", "choices": [{"delta": {"content": " world"}, "finish_reason": "stop"}]},
+            {"id": "gen-1", "choices": [], "usage": {"prompt_tokens": 100, "completion_tokens": 50}},
+        ]
+        body = ": OPENROUTER PROCESSING\n\n" + "".join(
+            f"data: {json.dumps(c)}\n\n" for c in chunks
+        ) + "data: [DONE]\n\n"
+
+        provider = OpenRouterProvider(api_key="test-key")
+        provider._client = httpx.AsyncClient(
+            base_url=provider.BASE_URL,
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, text=body)),
+        )
+
+        deltas = [delta async for delta in provider.stream_complete("Hi")]
+
+        assert deltas == ["Hello", " world"]
+        stats = provider.get_stats()
+        assert stats["total_requests"] == 1
+        assert stats["total_input_tokens"] == 100
+        assert stats["total_output_tokens"] == 50
+
+
 # ============================================================================
 # Error Handling Tests
 # ============================================================================
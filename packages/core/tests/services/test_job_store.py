@@ -0,0 +1,148 @@
+"""
+Tests for the API job store.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services import job_store
+from src.services.job_store import (
+    JOB_TTL_SECONDS,
+    MemoryJobStore,
+    RedisJobStore,
+    create_job_store,
+)
+
+# ============================================================================
+# MemoryJobStore Tests
+# ============================================================================
+
+
+class TestMemoryJobStore:
+    """Tests for the in-process job store."""
+
+    @pytest.mark.asyncio
+    async def test_create_rejects_duplicates(self):
+        """Test that a job ID can only be created once."""
+        store = MemoryJobStore()
+
+        assert await store.create("job-1", {"status": "pending"})
+        assert not await store.create("job-1", {"status": "pending"})
+
+    @pytest.mark.asyncio
+    async def test_update_merges_fields(self):
+        """Test that updates change only the given fields."""
+        store = MemoryJobStore()
+        await store.create("job-1", {"status": "pending", "progress": 0})
+
+        assert await store.update("job-1", {"progress": 40})
+        assert await store.get("job-1") == {"status": "pending", "progress": 40}
+
+    @pytest.mark.asyncio
+    async def test_missing_job(self):
+        """Test that updates never recreate a deleted job."""
+        store = MemoryJobStore()
+        await store.create("job-1", {"status": "pending"})
+
+        assert await store.delete("job-1")
+        assert not await store.delete("job-1")
+        assert not await store.update("job-1", {"progress": 40})
+        assert await store.get("job-1") is None
+
+    @pytest.mark.asyncio
+    async def test_get_returns_copy(self):
+        """Test that callers can't mutate stored state."""
+        store = MemoryJobStore()
+        await store.create("job-1", {"status": "pending"})
+
+        (await store.get("job-1"))["status"] = "complete"
+
+        assert (await store.get("job-1"))["status"] == "pending"
+
+
+# ============================================================================
+# RedisJobStore Tests
+# ============================================================================
+
+
+class TestRedisJobStore:
+    """Tests for the Redis job store's TTL handling."""
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        """RedisJobStore over a client whose scripts are mocks."""
+        client = MagicMock()
+        client.register_script.side_effect = lambda _script: AsyncMock(return_value=1)
+        client.expire = AsyncMock(return_value=True)
+        monkeypatch.setattr(job_store, "HAS_REDIS", True)
+        monkeypatch.setattr(
+            job_store,
+            "aioredis",
+            SimpleNamespace(from_url=lambda *_args, **_kwargs: client),
+            raising=False,
+        )
+        return RedisJobStore("redis://localhost:6379/0")
+
+    @pytest.mark.asyncio
+    async def test_updates_restart_ttl(self, store):
+        """Test that every update re-sets the TTL, so long jobs don't expire mid-run."""
+        assert await store.update("job-1", {"progress": 40})
+        assert await store.update("job-1", {})
+
+        store._update.assert_awaited_once_with(
+            keys=["job:job-1"], args=[JOB_TTL_SECONDS, "progress", "40"]
+        )
+        store._redis.expire.assert_awaited_once_with("job:job-1", JOB_TTL_SECONDS)
+
+
+# ============================================================================
+# Factory and Encoding Tests
+# ============================================================================
+
+
+class TestCreateJobStore:
+    """Tests for job store selection."""
+
+    def test_defaults_to_memory(self, monkeypatch):
+        """Test that no REDIS_URL means an in-memory store."""
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        assert isinstance(create_job_store(), MemoryJobStore)
+
+    def test_redis_url_requires_redis(self, monkeypatch):
+        """Test that a configured Redis URL without redis installed fails loudly."""
+        monkeypatch.setattr(job_store, "HAS_REDIS", False)
+        with pytest.raises(ImportError):
+            create_job_store("redis://localhost:6379/0")
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_field_encoding_round_trips(self, monkeypatch, has_orjson):
+        """Test that field values (including datetimes) encode with either backend."""
+        if has_orjson and not job_store.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(job_store, "HAS_ORJSON", has_orjson)
+
+        encoded = job_store._dumps({"generated_at": datetime(2025, 1, 1), "count": 3})
+
+        assert job_store._loads(encoded) == {"generated_at": "2025-01-01T00:00:00", "count": 3}
+        assert job_store._loads(json.dumps(None)) is None
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_dataclass_fields_encode(self, monkeypatch, has_orjson):
+        """Test that dataclass values (digest metadata) encode with either backend."""
+        if has_orjson and not job_store.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(job_store, "HAS_ORJSON", has_orjson)
+
+        @dataclass
+        class Point:
+            x: int
+            at: datetime
+
+        encoded = job_store._dumps({"point": Point(1, datetime(2025, 1, 1))})
+
+        assert job_store._loads(encoded) == {"point": {"x": 1, "at": "2025-01-01T00:00:00"}}
@@ -0,0 +1,306 @@
+"""Tests for the HTTP API."""
+
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src import api
+from src.api import DigestStream
+from src.models.article import DigestMetadata
+from src.services.job_store import MemoryJobStore
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client with a fresh in-memory job store."""
+    monkeypatch.setattr(api, "job_store", MemoryJobStore())
+    monkeypatch.setattr(api, "digest_streams", {})
+    return TestClient(api.app)
+
+
+def _metadata() -> DigestMetadata:
+    return DigestMetadata(
+        digest_id="2025-01-01",
+        generated_at=datetime(2025, 1, 1, 6, 0),
+        topics_covered=["AI"],
+        total_articles_found=10,
+        total_articles_parsed=8,
+        total_articles_analyzed=8,
+        total_articles_included=5,
+        total_tokens_used=1000,
+        total_cost_usd=0.01,
+    )
+
+
+# ============================================================================
+# DigestStream Tests
+# ============================================================================
+
+
+class TestDigestStream:
+    """Tests for replayable digest chunk streams."""
+
+    @pytest.mark.asyncio
+    async def test_reader_waits_for_chunks(self):
+        """Test that a reader receives chunks pushed after it started."""
+        stream = DigestStream()
+        stream.push("# Header")
+
+        async def produce():
+            await asyncio.sleep(0.01)
+            stream.push("\n\n## Topic")
+            stream.close()
+
+        producer = asyncio.create_task(produce())
+        chunks = [chunk async for chunk in stream.read()]
+        await producer
+
+        assert chunks == ["# Header", "\n\n## Topic"]
+
+    @pytest.mark.asyncio
+    async def test_late_reader_replays_from_start(self):
+        """Test that every reader gets the full digest."""
+        stream = DigestStream()
+        stream.push("a")
+        stream.push("b")
+        stream.close()
+
+        assert [chunk async for chunk in stream.read()] == ["a", "b"]
+        assert [chunk async for chunk in stream.read()] == ["a", "b"]
+
+
+# ============================================================================
+# Stream Endpoint Tests
+# ============================================================================
+
+
+class TestStreamEndpoint:
+    """Tests for /api/digest/{job_id}/stream."""
+
+    def test_streams_live_digest(self, client):
+        """Test streaming a digest being generated on this worker."""
+        stream = DigestStream()
+        stream.push("# Header")
+        stream.push("\n\n## AI")
+        stream.close()
+        api.digest_streams["job-1"] = stream
+
+        response = client.get("/api/digest/job-1/stream")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/markdown")
+        assert response.text == "# Header\n\n## AI"
+
+    def test_streams_completed_digest(self, client):
+        """Test that finished jobs stream the stored markdown."""
+        asyncio.run(api.job_store.create("job-1", {
+            "status": "complete",
+            "result": {"markdown": "# Done"},
+        }))
+
+        assert client.get("/api/digest/job-1/stream").text == "# Done"
+
+    def test_unknown_job(self, client):
+        """Test that unknown jobs return 404."""
+        assert client.get("/api/digest/missing/stream").status_code == 404
+
+
+# ============================================================================
+# Progress Endpoint Tests
+# ============================================================================
+
+
+class TestProgressEndpoint:
+    """Tests for /api/digest/{job_id}/progress."""
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_returns_progress_fields(self, client, monkeypatch, has_orjson):
+        """Test that progress is returned without internal job fields."""
+        if has_orjson and not api.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(api, "HAS_ORJSON", has_orjson)
+        asyncio.run(api.job_store.create("job-1", {
+            "status": "parsing",
+            "progress": 40,
+            "current_step": "Parsing articles...",
+            "articles_found": 20,
+            "articles_parsed": 8,
+            "articles_included": 0,
+            "error": None,
+            "result": None,
+        }))
+
+        response = client.get("/api/digest/job-1/progress")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "job_id": "job-1",
+            "status": "parsing",
+            "progress": 40,
+            "current_step": "Parsing articles...",
+            "articles_found": 20,
+            "articles_parsed": 8,
+            "articles_included": 0,
+            "error": None,
+        }
+
+    def test_unknown_job(self, client):
+        """Test that unknown jobs return 404."""
+        assert client.get("/api/digest/missing/progress").status_code == 404
+
+
+# ============================================================================
+# Result Endpoint Tests
+# ============================================================================
+
+
+class TestResultEndpoint:
+    """Tests for /api/digest/{job_id}/result."""
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_metadata_dataclass_serialized(self, client, monkeypatch, has_orjson):
+        """Test that stored metadata dataclasses serialize on either path."""
+        if has_orjson and not api.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(api, "HAS_ORJSON", has_orjson)
+        asyncio.run(api.job_store.create("job-1", {
+            "status": "complete",
+            "result": {"digest_id": "2025-01-01", "markdown": "# Done", "metadata": _metadata()},
+        }))
+
+        data = client.get("/api/digest/job-1/result").json()
+
+        assert data["success"] is True
+        assert data["metadata"]["total_articles_included"] == 5
+        assert data["metadata"]["generated_at"] == "2025-01-01T06:00:00"
+
+
+# ============================================================================
+# Webhook Tests
+# ============================================================================
+
+
+class TestWebhook:
+    """Tests for webhook delivery."""
+
+    def test_client_shared_across_app_lifetime(self, client):
+        """Test that the lifespan creates one pooled client and closes it."""
+        with client:
+            http = api.app.state.http
+            assert not http.is_closed
+        assert http.is_closed
+
+    @pytest.mark.asyncio
+    async def test_posts_job_status(self):
+        """Test the webhook payload sent through the given client."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            await api.send_webhook(http, "https://hooks.test/done", "job-1", {
+                "status": "complete",
+                "result": {"markdown": "# Digest"},
+            })
+
+        assert len(requests) == 1
+        assert requests[0].url == "https://hooks.test/done"
+        assert b'"status":"complete"' in requests[0].content.replace(b" ", b"")
+
+    @pytest.mark.asyncio
+    async def test_payload_encodes_metadata_dataclass(self):
+        """Test that metadata dataclasses are encoded in the webhook body."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            await api.send_webhook(http, "https://hooks.test/done", "job-1", {
+                "status": "complete",
+                "result": {"metadata": _metadata()},
+            })
+
+        body = requests[0].content.replace(b" ", b"")
+        assert requests[0].headers["content-type"] == "application/json"
+        assert b'"generated_at":"2025-01-01T06:00:00"' in body
+
+    @pytest.mark.asyncio
+    async def test_server_errors_retried(self, monkeypatch):
+        """Test that 5xx responses are retried until delivered."""
+        monkeypatch.setattr(api, "WEBHOOK_BACKOFF_SECONDS", 0)
+        statuses = iter([503, 502, 200])
+
+        def handler(request):
+            return httpx.Response(next(statuses))
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            delivered = await api.send_webhook(http, "https://hooks.test/done", "job-1", {
+                "status": "complete",
+            })
+
+        assert delivered is True
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self, monkeypatch):
+        """Test that rejected webhooks are dropped without retrying."""
+        monkeypatch.setattr(api, "WEBHOOK_BACKOFF_SECONDS", 0)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(404)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            delivered = await api.send_webhook(http, "https://hooks.test/done", "job-1", {
+                "status": "failed",
+            })
+
+        assert delivered is False
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_give_up(self, monkeypatch):
+        """Test that unreachable receivers are retried, then dropped."""
+        monkeypatch.setattr(api, "WEBHOOK_BACKOFF_SECONDS", 0)
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            raise httpx.ConnectError("refused")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            delivered = await api.send_webhook(http, "https://hooks.test/done", "job-1", {
+                "status": "complete",
+            })
+
+        assert delivered is False
+        assert len(attempts) == api.WEBHOOK_RETRIES + 1
+
+    @pytest.mark.asyncio
+    async def test_worker_delivers_queued_webhooks(self):
+        """Test that queued webhooks are sent by a background worker."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200)
+
+        queue = asyncio.Queue()
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            worker = asyncio.create_task(api.webhook_worker(queue, http))
+            queue.put_nowait(("https://hooks.test/a", "job-1", {"status": "complete"}))
+            queue.put_nowait(("https://hooks.test/b", "job-2", {"status": "failed"}))
+            await asyncio.wait_for(queue.join(), timeout=1)
+            worker.cancel()
+
+        assert [str(request.url) for request in requests] == [
+            "https://hooks.test/a",
+            "https://hooks.test/b",
+        ]
@@ -0,0 +1,141 @@
+"""
+Tests for rule-based prompt compression.
+"""
+
+import pytest
+
+from src.utils import compression
+from src.utils.compression import bm25_scores, compress_content, count_tokens, truncate_tokens
+
+
+class TestCleaning:
+    """Tests for whitespace and boilerplate removal."""
+
+    def test_short_content_kept(self):
+        """Test that content within budget is returned intact."""
+        assert compress_content("A short article.", budget_tokens=100) == "A short article."
+
+    def test_collapses_whitespace(self):
+        """Test that whitespace runs are collapsed."""
+        text = "First   paragraph\t here.\n\n\n\nSecond paragraph."
+        assert compress_content(text, budget_tokens=100) == "First paragraph here.\n\nSecond paragraph."
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "Subscribe to our newsletter!",
+            "Advertisement",
+            "Share this article",
+            "© 2025 Example Media. All rights reserved.",
+            "Read more: other stories",
+        ],
+    )
+    def test_drops_boilerplate(self, line):
+        """Test that boilerplate lines are dropped."""
+        text = f"The actual story.\n\n{line}"
+        assert compress_content(text, budget_tokens=100) == "The actual story."
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "Recommended daily doses fall by half under the new guidance.",
+            "Copyright holders sued the lab over its training data.",
+            "Related research from Stanford found the same effect.",
+            "Sign up rates for the trial doubled after the announcement.",
+            "Share this week's numbers with caution, analysts said.",
+        ],
+    )
+    def test_keeps_paragraphs_starting_like_boilerplate(self, line):
+        """Test that real paragraphs beginning with a boilerplate word are kept."""
+        text = f"The FDA cut its recommended limits.\n\n{line}"
+        assert compress_content(text, budget_tokens=1000) == text
+
+    def test_drops_duplicate_paragraphs(self):
+        """Test that repeated paragraphs are kept once."""
+        text = "Disclaimer text.\n\nStory body.\n\nDisclaimer text."
+        assert compress_content(text, budget_tokens=100) == "Disclaimer text.\n\nStory body."
+
+
+class TestBudget:
+    """Tests for relevance-ranked packing."""
+
+    def test_respects_budget(self):
+        """Test that output never exceeds the token budget."""
+        text = "\n\n".join(f"Paragraph {i} " + "word " * 40 for i in range(20))
+        result = compress_content(text, budget_tokens=100)
+        assert 0 < count_tokens(result) <= 100
+
+    def test_keeps_relevant_paragraphs_in_order(self):
+        """Test that relevant paragraphs win and keep original order."""
+        filler = "Unrelated filler text about the weather and sports. " * 2
+        text = "\n\n".join([
+            "Lead: the company announced results.",
+            filler,
+            "Critics said the claims lacked evidence.",
+            filler + "more",
+            "According to the report, revenue rose 12%.",
+        ])
+
+        result = compress_content(text, budget_tokens=40, query_terms=["critics claims evidence according report"])
+
+        assert result.startswith("Lead:")
+        assert "Critics said" in result
+        assert "revenue rose 12%" in result
+        assert "filler" not in result
+        assert result.index("Critics") < result.index("According")
+
+    def test_oversized_single_paragraph_truncates(self):
+        """Test fallback truncation for a single oversized paragraph."""
+        result = compress_content("x" * 1000, budget_tokens=10)
+        assert result and result == "x" * len(result)
+        assert count_tokens(result) <= 10
+
+
+class TestBM25:
+    """Tests for BM25 scoring."""
+
+    def test_matching_paragraph_scores_higher(self):
+        """Test that term matches raise the score."""
+        scores = bm25_scores(["quantum computing advance", "football results"], ["quantum"])
+        assert scores[0] > scores[1] == 0.0
+
+    def test_no_query_scores_zero(self):
+        """Test that an empty query scores everything zero."""
+        assert bm25_scores(["a", "b"], []) == [0.0, 0.0]
+
+
+class TestTokenCounting:
+    """Tests for token counting and truncation."""
+
+    @pytest.fixture
+    def estimated(self, monkeypatch):
+        """Force the estimator (no tiktoken encoding)."""
+        monkeypatch.setattr(compression, "_get_encoding", lambda: None)
+
+    @pytest.mark.usefixtures("estimated")
+    def test_estimate_counts_punctuation(self):
+        """Test that URLs cost more than their character count suggests."""
+        url = "https://a.io/x?y=1&z=2"
+        assert count_tokens(url) > len(url) // 4
+        assert count_tokens("the cat") == 2
+
+    @pytest.mark.usefixtures("estimated")
+    def test_truncate_within_budget_unchanged(self):
+        """Test that short text is returned as-is."""
+        assert truncate_tokens("short text", 10) == "short text"
+
+    @pytest.mark.usefixtures("estimated")
+    def test_truncate_cuts_at_word_boundary(self):
+        """Test that truncation stops before the overflowing word."""
+        assert truncate_tokens("one two three four", 4) == "one two three"
+        assert truncate_tokens("one two three four", 3) == "one two"
+
+    def test_truncate_respects_budget(self):
+        """Test truncation with whichever tokenizer is available."""
+        text = "word " * 100
+        assert count_tokens(truncate_tokens(text, 20)) <= 20
+
+    @pytest.mark.usefixtures("estimated")
+    def test_load_tokenizer_reports_fallback(self):
+        """Test that load_tokenizer reports when counts are only estimates."""
+        assert compression.load_tokenizer() is False
@@ -0,0 +1,110 @@
+"""
+Tests for LLM response JSON decoding.
+"""
+
+import json
+
+import pytest
+
+from src.utils import llm_json
+from src.utils.llm_json import (
+    JSONFieldStream,
+    clamp01,
+    loads_llm_json,
+    strip_code_fence,
+)
+
+
+class TestStripCodeFence:
+    """Tests for markdown fence removal."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '{"a": 1}',
+            '```json\n{"a": 1}\n```',
+            '```\n{"a": 1}\n```',
+            '  ```json\n{"a": 1}```  ',
+            '```json\n{"a": 1}',
+        ],
+    )
+    def test_strips_fences(self, content):
+        """Test that fenced and unfenced JSON reduce to the same text."""
+        assert strip_code_fence(content) == '{"a": 1}'
+
+    def test_inner_backticks_kept(self):
+        """Test that backticks inside the payload are untouched."""
+        content = '```json\n{"code": "use ```x```"}\n```'
+        assert strip_code_fence(content) == '{"code": "use ```x```"}'
+
+
+class TestLoadsLLMJson:
+    """Tests for JSON decoding."""
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_decodes_with_either_backend(self, monkeypatch, has_orjson):
+        """Test decoding with orjson and with the stdlib fallback."""
+        if has_orjson and not llm_json.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(llm_json, "HAS_ORJSON", has_orjson)
+
+        assert loads_llm_json('```json\n{"score": 0.5, "tags": ["a"]}\n```') == {
+            "score": 0.5,
+            "tags": ["a"],
+        }
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_invalid_raises_json_decode_error(self, monkeypatch, has_orjson):
+        """Test that both backends raise json.JSONDecodeError."""
+        if has_orjson and not llm_json.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(llm_json, "HAS_ORJSON", has_orjson)
+
+        with pytest.raises(json.JSONDecodeError):
+            loads_llm_json("not json")
+
+
+class TestClamp01:
+    """Tests for score clamping."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(0.3, 0.3), ("0.7", 0.7), (1.5, 1.0), (-2, 0.0), (1, 1.0)],
+    )
+    def test_clamps_numeric(self, value, expected):
+        """Test numbers and numeric strings are clamped to [0, 1]."""
+        assert clamp01(value) == expected
+
+    @pytest.mark.parametrize("value", [None, "high", [0.5]])
+    def test_non_numeric_uses_default(self, value):
+        """Test junk falls back to the default."""
+        assert clamp01(value) == 0.5
+        assert clamp01(value, default=0.0) == 0.0
+
+
+class TestJSONFieldStream:
+    """Tests for incremental field parsing."""
+
+    def test_fields_complete_char_by_char(self):
+        """Test that each field is emitted once, fully formed."""
+        text = '```json\n{"score": 0.35, "tags": ["a", "b"], "ok": true, "note": "x, y}"}\n```'
+        parser = JSONFieldStream()
+
+        fields = [field for char in text for field in parser.feed(char)]
+
+        assert fields == [("score", 0.35), ("tags", ["a", "b"]), ("ok", True), ("note", "x, y}")]
+
+    def test_field_emitted_before_object_closes(self):
+        """Test that earlier fields arrive while later ones are still streaming."""
+        parser = JSONFieldStream()
+
+        assert parser.feed('{"score": 0.8, "summary": "still wri') == [("score", 0.8)]
+        assert parser.feed('ting"}') == [("summary", "still writing")]
+
+    def test_scalar_waits_for_delimiter(self):
+        """Test that a number is not emitted until it is terminated."""
+        parser = JSONFieldStream()
+
+        assert parser.feed('{"score": 0') == []
+        assert parser.feed('.75') == []
+        assert parser.feed('}') == [("score", 0.75)]
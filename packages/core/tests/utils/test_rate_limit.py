@@ -0,0 +1,80 @@
+"""
+Tests for the request/token rate limiter.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.rate_limit import RateLimiter
+
+
+class TestRateLimiter:
+    """Tests for token-bucket rate limiting."""
+
+    def test_rejects_non_positive_limits(self):
+        """Test that limits must be positive."""
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_minute=0)
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_minute=60, tokens_per_minute=0)
+
+    @pytest.mark.asyncio
+    async def test_fractional_rate_admits_first_request(self):
+        """Test that a limit below one per minute still holds one request."""
+        limiter = RateLimiter(requests_per_minute=0.5)
+
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+        assert limiter._wait_time(time.monotonic(), 0) == pytest.approx(120, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_burst_within_budget_not_delayed(self):
+        """Test that a full bucket admits a burst immediately."""
+        limiter = RateLimiter(requests_per_minute=100)
+
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(50)))
+
+        assert time.monotonic() - start < 0.1
+
+    @pytest.mark.asyncio
+    async def test_requests_spaced_once_bucket_empty(self):
+        """Test that requests beyond the budget wait for the refill."""
+        limiter = RateLimiter(requests_per_minute=1200)  # one per 50ms
+        limiter._requests = 0
+
+        start = time.monotonic()
+        await limiter.acquire()
+        await limiter.acquire()
+
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_token_budget_limits(self):
+        """Test that expected tokens are drawn from the token bucket."""
+        limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=60_000)
+        await limiter.acquire(tokens=60_000)
+
+        start = time.monotonic()
+        await limiter.acquire(tokens=100)  # refills at 1000 tokens/s
+
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_capped(self):
+        """Test that a request above the per-minute token limit still runs."""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100)
+
+        await asyncio.wait_for(limiter.acquire(tokens=10_000), timeout=0.1)
+
+    @pytest.mark.asyncio
+    async def test_pause_holds_requests(self):
+        """Test that pause delays the next request."""
+        limiter = RateLimiter(requests_per_minute=1000)
+        limiter.pause(0.1)
+
+        start = time.monotonic()
+        await limiter.acquire()
+
+        assert time.monotonic() - start >= 0.09
@@ -0,0 +1,53 @@
+"""
+Tests for local lexical similarity.
+"""
+
+import pytest
+
+from src.utils.similarity import cosine, similar_pairs, term_counts, tfidf_vectors
+
+
+class TestTermCounts:
+    """Tests for term counting."""
+
+    def test_drops_stopwords_and_short_words(self):
+        """Test that function words and single letters are ignored."""
+        assert term_counts("The model and a Model") == {"model": 2}
+
+
+class TestTfidf:
+    """Tests for TF-IDF vectors and cosine similarity."""
+
+    def test_vectors_are_normalized(self):
+        """Test that each vector has unit length."""
+        vectors = tfidf_vectors([term_counts("quantum computing qubits"), term_counts("quantum")])
+        for vector in vectors:
+            assert cosine(vector, vector) == pytest.approx(1.0)
+
+    def test_disjoint_documents_score_zero(self):
+        """Test that documents without shared terms are orthogonal."""
+        a, b = tfidf_vectors([term_counts("quantum qubits"), term_counts("interest rates")])
+        assert cosine(a, b) == 0.0
+
+
+class TestSimilarPairs:
+    """Tests for candidate pair selection."""
+
+    def test_threshold_and_order(self):
+        """Test that pairs are filtered by threshold and sorted by score."""
+        counts = [
+            term_counts("quantum computing qubits error correction"),
+            term_counts("interest rates inflation"),
+            term_counts("quantum qubits error correction breakthrough"),
+            term_counts("quantum computing startup"),
+        ]
+        pairs = similar_pairs(counts, threshold=0.1, top_k=10)
+
+        assert [(i, j) for i, j, _ in pairs][0] == (0, 2)
+        assert all(1 not in (i, j) for i, j, _ in pairs)
+        assert [s for _, _, s in pairs] == sorted((s for _, _, s in pairs), reverse=True)
+
+    def test_top_k_limits_pairs(self):
+        """Test that at most top_k pairs are returned."""
+        counts = [term_counts("shared topic words") for _ in range(5)]
+        assert len(similar_pairs(counts, threshold=0.0, top_k=3)) == 3